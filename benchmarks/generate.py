@@ -0,0 +1,130 @@
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import Any
+from typing import List
+from typing import Optional
+from xlform.engine.base import get_column_letter
+import openpyxl  # type: ignore
+import random
+
+KEY_VALUE = "key"
+TABLE_ROW = 3
+
+
+def get_header_path_list(columns: int, header_depth: int) -> List[List[str]]:
+    """Get the header paths of the columns of the generated tables
+
+    The columns are grouped by two at each level above the last level.
+
+    Args:
+        columns (int): Number of the columns
+        header_depth (int): Number of the header rows
+
+    Returns:
+        List[List[str]]: Header path of each column
+    """
+    header_path_list: List[List[str]] = list()
+    for column in range(0, columns):
+        header_path = list()
+        for level in range(0, header_depth - 1):
+            group = column // (2 ** (header_depth - 1 - level))
+            header_path.append("group%d_%d" % (level + 1, group + 1))
+        header_path.append("column%d" % (column + 1))
+        header_path_list.append(header_path)
+    return header_path_list
+
+
+def get_table_range_arg(rows: int, columns: int, header_depth: int) -> str:
+    """Get the range of the generated tables including the headers"""
+    last_row = TABLE_ROW + header_depth + rows - 1
+    return "A%d:%s%d" % (TABLE_ROW, get_column_letter(columns), last_row)
+
+
+def generate_book(
+    path: Path,
+    rows: int = 1000,
+    columns: int = 10,
+    sheets: int = 1,
+    header_depth: int = 1,
+    formulas: float = 0.0,
+    sparsity: float = 0.0,
+    seed: int = 0,
+) -> None:
+    """Generate a book for the benchmarks
+
+    Each sheet has a key and a value at A1:B1 and a table from A3 with the
+    header rows. The formulas and the empty cells are placed in the columns
+    to the right of the table, so that the table is readable.
+
+    Args:
+        path (Path): File path
+        rows (int, optional): Number of the rows of the table
+        columns (int, optional): Number of the columns of the table
+        sheets (int, optional): Number of the sheets
+        header_depth (int, optional): Number of the header rows
+        formulas (float, optional): Ratio of the formulas in the extra cells
+        sparsity (float, optional): Ratio of the empty extra cells
+        seed (int, optional): Seed of the random values
+    """
+    if header_depth < 1:
+        raise ValueError("header_depth must be positive.")
+    rand = random.Random(seed)
+    header_path_list = get_header_path_list(columns, header_depth)
+    extra_column = columns + 2
+
+    wb = openpyxl.Workbook(write_only=True)
+    for sheet_index in range(1, sheets + 1):
+        ws = wb.create_sheet("Sheet%d" % (sheet_index))
+        ws.append([KEY_VALUE, "value%d" % (sheet_index)])
+        ws.append([])
+        for level in range(0, header_depth):
+            ws.append([header_path[level] for header_path in header_path_list])
+        for row in range(
+            TABLE_ROW + header_depth, TABLE_ROW + header_depth + rows
+        ):
+            values: List[Any] = list()
+            for column in range(1, columns + 1):
+                if column % 2 == 0:
+                    values.append(rand.randint(0, 1000000))
+                else:
+                    values.append("text%d" % (rand.randint(0, 1000000)))
+            values.append(None)
+            for column in range(extra_column, extra_column + columns):
+                r = rand.random()
+                if r < sparsity:
+                    values.append(None)
+                elif r < sparsity + formulas:
+                    values.append("=B%d*2" % (row))
+                else:
+                    values.append(rand.random())
+            ws.append(values)
+    wb.save(str(path))
+    wb.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = ArgumentParser(description="Generate a book for the benchmarks.")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument("--sheets", type=int, default=1)
+    parser.add_argument("--header-depth", type=int, default=1)
+    parser.add_argument("--formulas", type=float, default=0.0)
+    parser.add_argument("--sparsity", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+    generate_book(
+        args.path,
+        rows=args.rows,
+        columns=args.columns,
+        sheets=args.sheets,
+        header_depth=args.header_depth,
+        formulas=args.formulas,
+        sparsity=args.sparsity,
+        seed=args.seed,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
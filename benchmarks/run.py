@@ -0,0 +1,347 @@
+from argparse import ArgumentParser
+from benchmarks.generate import generate_book
+from benchmarks.generate import get_header_path_list
+from benchmarks.generate import get_table_range_arg
+from benchmarks.generate import KEY_VALUE
+from benchmarks.generate import TABLE_ROW
+from pathlib import Path
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from xlform.engine.base import Book
+from xlform.engine.base import Engine
+from xlform.engine.base import get_column_letter
+from xlform.engine.memory import EngineMemory
+from xlform.engine.openpyxl import EngineOpenpyxl
+from xlform.engine.openpyxl import EngineOpenpyxlReadOnly
+from xlform.engine.xlsx import EngineXlsxReader
+from xlform.form import FormFactory
+from xlform.form import FormItemCell
+from xlform.form import FormItemKeyValueCells
+from xlform.form import FormItemTable
+from xlform.form import FormSession
+from xlform.form import MetaLevel
+import gc
+import json
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# A scenario sets up with the book path and returns the function to measure
+# and the function to clean up.
+Scenario = Callable[
+    [Path, Dict[str, int]], Tuple[Callable[[], Any], Callable[[], None]]
+]
+
+# The arguments of the book, which must match the baseline.
+BOOK_ARGS = [
+    "rows",
+    "columns",
+    "sheets",
+    "header_depth",
+    "formulas",
+    "sparsity",
+]
+
+ENGINE_DIC: Dict[str, Callable[[], Engine]] = {
+    "openpyxl": EngineOpenpyxl,
+    "openpyxl_read_only": EngineOpenpyxlReadOnly,
+    "memory": EngineMemory,
+    "xlsx_reader": EngineXlsxReader,
+}
+
+
+def _new_factory(config: Dict[str, int]) -> FormFactory:
+    rows, columns = config["rows"], config["columns"]
+    header_depth = config["header_depth"]
+    data_row = TABLE_ROW + header_depth
+    last_row = data_row + rows - 1
+    factory = FormFactory()
+    factory.register_form(
+        "cell",
+        {
+            "item": {
+                "cls": FormItemCell,
+                "kwargs": {"sheet_name": "Sheet1", "range_arg": "B1"},
+            }
+        },
+    )
+    factory.register_form(
+        "key_value",
+        {
+            "item": {
+                "cls": FormItemKeyValueCells,
+                "kwargs": {
+                    "sheet_name": "Sheet1",
+                    "range_arg": "A1:B1",
+                    "header_value": KEY_VALUE,
+                },
+            }
+        },
+    )
+    factory.register_form(
+        "table_list",
+        {
+            "item": {
+                "cls": FormItemTable,
+                "kwargs": {
+                    "sheet_name": "Sheet1",
+                    "range_arg": "A%d:%s%d"
+                    % (data_row, get_column_letter(columns), last_row),
+                },
+            }
+        },
+    )
+    factory.register_form(
+        "table_dict",
+        {
+            "item": {
+                "cls": FormItemTable,
+                "kwargs": {
+                    "sheet_name": "Sheet1",
+                    "range_arg": get_table_range_arg(
+                        rows, columns, header_depth
+                    ),
+                    "header_rows_count": header_depth,
+                    "header_path_list": get_header_path_list(
+                        columns, header_depth
+                    ),
+                },
+            }
+        },
+    )
+    return factory
+
+
+def _form_scenario(
+    engine_name: str, form_name: str, meta_level: MetaLevel
+) -> Scenario:
+    def scenario(
+        path: Path, config: Dict[str, int]
+    ) -> Tuple[Callable[[], Any], Callable[[], None]]:
+        factory = _new_factory(config)
+        book = ENGINE_DIC[engine_name]().open_book(path)
+
+        def run() -> Any:
+            # A new session to read the book again on each run.
+            session = FormSession(book)
+            form = factory.new_form(form_name, book, session=session)
+            return form.get_form_doc(meta_level)
+
+        return run, book.close
+
+    return scenario
+
+
+def _set_form_doc_scenario(
+    path: Path, config: Dict[str, int]
+) -> Tuple[Callable[[], Any], Callable[[], None]]:
+    factory = _new_factory(config)
+    book = EngineOpenpyxl().open_book(path)
+    form = factory.new_form("table_dict", book)
+    doc = form.get_form_doc(MetaLevel.NONE)
+
+    def run() -> Any:
+        form.set_form_doc(doc)
+
+    return run, book.close
+
+
+def _open_book_scenario(engine_name: str) -> Scenario:
+    def scenario(
+        path: Path, config: Dict[str, int]
+    ) -> Tuple[Callable[[], Any], Callable[[], None]]:
+        engine = ENGINE_DIC[engine_name]()
+
+        def run() -> Any:
+            book = engine.open_book(path)
+            book.close()
+
+        return run, lambda: None
+
+    return scenario
+
+
+def _save_scenario(
+    path: Path, config: Dict[str, int]
+) -> Tuple[Callable[[], Any], Callable[[], None]]:
+    book: Book = EngineOpenpyxl().open_book(path)
+    output_path = Path(tempfile.mkdtemp(prefix="benchmark_save")) / "book.xlsx"
+
+    def run() -> Any:
+        book.save(output_path)
+
+    return run, book.close
+
+
+def get_scenario_dic() -> Dict[str, Scenario]:
+    """Get the scenarios by the names"""
+    scenario_dic: Dict[str, Scenario] = dict()
+    for engine_name in ENGINE_DIC.keys():
+        scenario_dic["open_book[%s]" % (engine_name)] = _open_book_scenario(
+            engine_name
+        )
+        for form_name in ["cell", "key_value", "table_list", "table_dict"]:
+            for meta_level in [MetaLevel.NONE, MetaLevel.FULL]:
+                name = "%s[%s,%s]" % (form_name, engine_name, meta_level.value)
+                scenario_dic[name] = _form_scenario(
+                    engine_name, form_name, meta_level
+                )
+    scenario_dic["set_form_doc[openpyxl]"] = _set_form_doc_scenario
+    scenario_dic["save[openpyxl]"] = _save_scenario
+    return scenario_dic
+
+
+def measure(
+    scenario: Scenario, path: Path, config: Dict[str, int], repeat: int
+) -> Dict[str, float]:
+    """Measure the time and the peak memory of the scenario
+
+    The time is the median of the repeated runs. The peak memory is traced
+    in another run, since tracing slows down the run.
+    """
+    run, close = scenario(path, config)
+    try:
+        times: List[float] = list()
+        for _ in range(0, repeat):
+            gc.collect()
+            start = time.perf_counter()
+            run()
+            times.append(time.perf_counter() - start)
+
+        gc.collect()
+        tracemalloc.start()
+        try:
+            run()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    finally:
+        close()
+    return {"time": statistics.median(times), "peak_memory": float(peak)}
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float,
+) -> List[str]:
+    """Get the regressions from the baseline
+
+    The scenarios and the measures missing from the baseline are reported
+    too, since their regressions can't be detected. Save the baseline
+    again after adding scenarios.
+
+    Args:
+        results (Dict[str, Dict[str, float]]): Results by the scenarios
+        baseline (Dict[str, Dict[str, float]]): Baseline by the scenarios
+        threshold (float): Ratio of the allowed increase
+
+    Returns:
+        List[str]: Descriptions of the regressions
+    """
+    regressions: List[str] = list()
+    for name, result in results.items():
+        if name not in baseline:
+            regressions.append("%s: not in the baseline" % (name))
+            continue
+        for key, value in result.items():
+            base = baseline[name].get(key)
+            if base is None:
+                regressions.append("%s %s: not in the baseline" % (name, key))
+                continue
+            if base <= 0:
+                continue
+            if value > base * (1 + threshold):
+                regressions.append(
+                    "%s %s: %.4g -> %.4g (%+.0f%%)"
+                    % (name, key, base, value, (value / base - 1) * 100)
+                )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the benchmarks
+
+    Returns 1 if any scenario regresses from the baseline.
+    """
+    parser = ArgumentParser(description="Run the benchmarks of xlform.")
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--columns", type=int, default=10)
+    parser.add_argument("--sheets", type=int, default=1)
+    parser.add_argument("--header-depth", type=int, default=2)
+    parser.add_argument("--formulas", type=float, default=0.1)
+    parser.add_argument("--sparsity", type=float, default=0.1)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--scenario", action="append", default=None, help="Scenario names"
+    )
+    parser.add_argument(
+        "--baseline",
+        type=Path,
+        default=Path(__file__).parent / "baseline.json",
+    )
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args(argv)
+    if args.header_depth < 1:
+        parser.error("--header-depth must be positive.")
+
+    config = {
+        "rows": args.rows,
+        "columns": args.columns,
+        "header_depth": args.header_depth,
+    }
+    path = Path(tempfile.mkdtemp(prefix="benchmark")) / "book.xlsx"
+    generate_book(
+        path,
+        rows=args.rows,
+        columns=args.columns,
+        sheets=args.sheets,
+        header_depth=args.header_depth,
+        formulas=args.formulas,
+        sparsity=args.sparsity,
+    )
+
+    scenario_dic = get_scenario_dic()
+    names = args.scenario if args.scenario else list(scenario_dic.keys())
+    results: Dict[str, Dict[str, float]] = dict()
+    for name in names:
+        result = measure(scenario_dic[name], path, config, args.repeat)
+        results[name] = result
+        print(
+            "%-40s %10.2f ms %10.1f KiB"
+            % (name, result["time"] * 1000, result["peak_memory"] / 1024)
+        )
+
+    if args.save_baseline:
+        config_dic = {key: getattr(args, key) for key in BOOK_ARGS}
+        data = {"config": config_dic, "results": results}
+        args.baseline.write_text(
+            json.dumps(data, indent=2, sort_keys=True) + "\n"
+        )
+        return 0
+    if not args.baseline.exists():
+        return 0
+    baseline = json.loads(args.baseline.read_text())
+    for key in BOOK_ARGS:
+        if baseline["config"].get(key) != getattr(args, key):
+            print(
+                "The baseline is for another book: %s=%s"
+                % (key, baseline["config"].get(key)),
+                file=sys.stderr,
+            )
+            return 0
+    regressions = compare(results, baseline["results"], args.threshold)
+    for regression in regressions:
+        print("REGRESSION %s" % (regression), file=sys.stderr)
+    return 1 if len(regressions) > 0 else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
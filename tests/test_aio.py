@@ -0,0 +1,182 @@
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+from typing import Awaitable
+from typing import List
+from xlform.aio import AsyncEngine
+from xlform.cache import FormDocCache
+from xlform.cache import SqliteDocStore
+from xlform.engine.base import Book
+from xlform.engine.openpyxl import EngineOpenpyxl
+from xlform.exception import XlFormArgumentException
+from xlform.form import FormFactory
+from xlform.form import FormItemCell
+import asyncio
+import openpyxl  # type: ignore
+import tempfile
+import threading
+import time
+import unittest
+
+FACTORY: FormFactory = FormFactory()
+FACTORY.register_form(
+    "form1",
+    {
+        "item1": {
+            "cls": FormItemCell,
+            "kwargs": {"sheet_name": "Sheet", "range_arg": "A1"},
+        }
+    },
+)
+
+
+class TestAsyncEngine(unittest.TestCase):
+    def setUp(self) -> None:
+        self._dir_path = Path(tempfile.mkdtemp(prefix="test_aio"))
+        self._paths: List[Path] = list()
+        for value in [10, 20, 30]:
+            wb = openpyxl.Workbook()
+            wb.active["A1"] = value
+            path = self._dir_path / ("book%d.xlsx" % (value))
+            wb.save(str(path))
+            wb.close()
+            self._paths.append(path)
+
+    def _run(self, awaitable: Awaitable[Any]) -> Any:
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(awaitable)
+        finally:
+            loop.close()
+
+    def test_open_book(self) -> None:
+        async def run() -> Any:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                engine = AsyncEngine(EngineOpenpyxl(), executor, 2)
+                books = await asyncio.gather(
+                    *[engine.open_book(path) for path in self._paths]
+                )
+                forms = [FACTORY.new_form("form1", book) for book in books]
+                return await asyncio.gather(
+                    *[form.get_form_doc_async() for form in forms]
+                )
+
+        docs = self._run(run())
+
+        self.assertEqual(
+            [doc["item1"]["result"] for doc in docs], [10, 20, 30]
+        )
+
+    def test_save_async(self) -> None:
+        path = self._dir_path / "saved.xlsx"
+
+        async def run() -> None:
+            engine = AsyncEngine(EngineOpenpyxl())
+            book: Book = await engine.new_book()
+            book.get_sheet("Sheet1").get_cell(1, 1).set_value(1)
+            await book.save_async(path)
+
+        self._run(run())
+
+        self.assertTrue(path.exists())
+
+    def test_open_book__event_loops(self) -> None:
+        engine = AsyncEngine(EngineOpenpyxl(), max_concurrency=1)
+
+        async def run() -> Any:
+            return await asyncio.gather(
+                *[engine.open_book(path) for path in self._paths]
+            )
+
+        self.assertEqual(len(self._run(run())), 3)
+        self.assertEqual(len(self._run(run())), 3)
+
+    def test_save_async__max_concurrency(self) -> None:
+        lock = threading.Lock()
+        counts: List[int] = [0, 0]
+
+        def save(path: Any) -> None:
+            with lock:
+                counts[0] += 1
+                counts[1] = max(counts)
+            time.sleep(0.01)
+            with lock:
+                counts[0] -= 1
+
+        async def run() -> Any:
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                engine = AsyncEngine(EngineOpenpyxl(), executor, 1)
+                books = await asyncio.gather(
+                    *[engine.open_book(path) for path in self._paths]
+                )
+                forms = [FACTORY.new_form("form1", book) for book in books]
+                for book in books:
+                    book.save = save  # type: ignore
+                await asyncio.gather(
+                    *[book.save_async(self._dir_path) for book in books]
+                )
+                return await asyncio.gather(
+                    *[form.get_form_doc_async() for form in forms]
+                )
+
+        docs = self._run(run())
+
+        self.assertEqual(counts[1], 1)
+        self.assertEqual(
+            [doc["item1"]["result"] for doc in docs], [10, 20, 30]
+        )
+
+    def test_extract_form_doc__process_pool(self) -> None:
+        async def run() -> Any:
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                engine = AsyncEngine(EngineOpenpyxl(), executor)
+                return await asyncio.gather(
+                    *[
+                        engine.extract_form_doc(FACTORY, "form1", path)
+                        for path in self._paths
+                    ]
+                )
+
+        docs = self._run(run())
+
+        self.assertEqual(
+            [doc["item1"]["result"] for doc in docs], [10, 20, 30]
+        )
+
+    def test_extract_form_doc__process_pool_cache(self) -> None:
+        store = SqliteDocStore(self._dir_path / "cache.sqlite3")
+        cache = FormDocCache(store)
+
+        async def run() -> Any:
+            with ProcessPoolExecutor(max_workers=2) as executor:
+                engine = AsyncEngine(EngineOpenpyxl(), executor)
+                return await asyncio.gather(
+                    *[
+                        engine.extract_form_doc(
+                            FACTORY, "form1", path, cache=cache
+                        )
+                        for path in self._paths
+                    ]
+                )
+
+        docs = self._run(run())
+
+        self.assertEqual(
+            [doc["item1"]["result"] for doc in docs], [10, 20, 30]
+        )
+        self.assertGreater(store.get_size(), 0)
+        store.close()
+
+    def test_open_book__process_pool(self) -> None:
+        async def run() -> None:
+            with ProcessPoolExecutor(max_workers=1) as executor:
+                engine = AsyncEngine(EngineOpenpyxl(), executor)
+                await engine.open_book(self._paths[0])
+
+        with self.assertRaises(XlFormArgumentException):
+            self._run(run())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,276 @@
+from pathlib import Path
+from typing import Any
+from typing import List
+from xlform.arrow import TableExporter
+from xlform.engine.base import Book
+from xlform.engine.base import Engine
+from xlform.engine.base import Sheet
+from xlform.engine.openpyxl import EngineOpenpyxl
+from xlform.exception import XlFormArgumentException
+from xlform.exception import XlFormRuntimeException
+from xlform.exception import XlFormValidationException
+from xlform.form import FormItemTable
+from xlform.form import TableEnd
+import importlib.util
+import io
+import sys
+import tempfile
+import unittest
+
+HAS_PYARROW = importlib.util.find_spec("pyarrow") is not None
+
+
+@unittest.skipUnless(HAS_PYARROW, "pyarrow is not installed")
+class TestTableExporter(unittest.TestCase):
+    def setUp(self) -> None:
+        self._engine: Engine = EngineOpenpyxl()
+        self._book: Book = self._engine.new_book()
+        self._sheet: Sheet = self._book.get_sheets()[0]
+
+        table: List[List[Any]] = [
+            ["head1", "head1", "head2"],
+            ["head11", "head12", "head21"],
+            [111, 1.5, "a"],
+            [211, 2.5, "b"],
+            [311, 3.5, "c"],
+        ]
+
+        for row, rows in enumerate(table, start=1):
+            for col, value in enumerate(rows, start=1):
+                self._sheet.get_cell(row, col).set_value(value)
+
+    def _new_item(self) -> FormItemTable:
+        return FormItemTable(
+            self._book,
+            "Sheet1",
+            "A1:C5",
+            header_rows_count=2,
+            header_path_list=[
+                ["head1", "head11"],
+                ["head1", "head12"],
+                ["head2", "head21"],
+            ],
+        )
+
+    def test_iter_record_batches__flat(self) -> None:
+        exporter = TableExporter(self._new_item(), batch_rows_count=2)
+        batches = list(exporter.iter_record_batches())
+
+        self.assertEqual([b.num_rows for b in batches], [2, 1])
+        self.assertEqual(
+            batches[0].schema.names,
+            ["head1.head11", "head1.head12", "head2.head21"],
+        )
+        self.assertEqual(
+            [b.to_pylist() for b in batches],
+            [
+                [
+                    {
+                        "head1.head11": 111,
+                        "head1.head12": 1.5,
+                        "head2.head21": "a",
+                    },
+                    {
+                        "head1.head11": 211,
+                        "head1.head12": 2.5,
+                        "head2.head21": "b",
+                    },
+                ],
+                [
+                    {
+                        "head1.head11": 311,
+                        "head1.head12": 3.5,
+                        "head2.head21": "c",
+                    },
+                ],
+            ],
+        )
+
+    def test_iter_record_batches__nested(self) -> None:
+        exporter = TableExporter(self._new_item(), nested=True)
+        batches = list(exporter.iter_record_batches())
+
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(batches[0].schema.names, ["head1", "head2"])
+        self.assertEqual(
+            batches[0].to_pylist()[0],
+            {
+                "head1": {"head11": 111, "head12": 1.5},
+                "head2": {"head21": "a"},
+            },
+        )
+
+    def test_iter_record_batches__same_as_item_doc(self) -> None:
+        item = self._new_item()
+        exporter = TableExporter(item, nested=True)
+        rows = [
+            r for b in exporter.iter_record_batches() for r in b.to_pylist()
+        ]
+
+        self.assertEqual(rows, list(self._new_item().iter_rows()))
+
+    def test_iter_record_batches__no_header(self) -> None:
+        exporter = TableExporter(FormItemTable(self._book, "Sheet1", "A3:B4"))
+        batches = list(exporter.iter_record_batches())
+
+        self.assertEqual(batches[0].schema.names, ["A", "B"])
+        self.assertEqual(
+            batches[0].to_pylist(),
+            [{"A": 111, "B": 1.5}, {"A": 211, "B": 2.5}],
+        )
+
+    def test_iter_record_batches__no_rows(self) -> None:
+        item = FormItemTable(
+            self._book,
+            "Sheet1",
+            "A3:C",
+            table_end=TableEnd(sentinel_value=111),
+        )
+        exporter = TableExporter(item)
+
+        with self.assertRaises(XlFormValidationException):
+            list(exporter.iter_record_batches())
+
+    def test_iter_record_batches__column_types(self) -> None:
+        import pyarrow  # type: ignore
+
+        exporter = TableExporter(
+            self._new_item(),
+            batch_rows_count=1,
+            column_types={"head1.head12": pyarrow.float32()},
+        )
+        batches = list(exporter.iter_record_batches())
+
+        self.assertEqual(batches[0].schema.field(1).type, pyarrow.float32())
+        self.assertEqual(batches[2].schema, batches[0].schema)
+
+    def test_iter_record_batches__type_mismatch(self) -> None:
+        self._sheet.get_cell(5, 1).set_value("x")
+        exporter = TableExporter(self._new_item(), batch_rows_count=2)
+
+        with self.assertRaises(XlFormValidationException):
+            list(exporter.iter_record_batches())
+
+    def test_iter_record_batches__int_in_float_column(self) -> None:
+        self._sheet.get_cell(5, 2).set_value(3)
+        exporter = TableExporter(self._new_item(), batch_rows_count=2)
+        batches = list(exporter.iter_record_batches())
+
+        self.assertEqual(batches[1].schema, batches[0].schema)
+        self.assertEqual(batches[1].column(1).to_pylist(), [3.0])
+
+    def test_iter_record_batches__float_in_int_column(self) -> None:
+        import pyarrow
+
+        self._sheet.get_cell(5, 1).set_value(2.5)
+        exporter = TableExporter(self._new_item(), batch_rows_count=2)
+
+        with self.assertRaises(XlFormValidationException):
+            list(exporter.iter_record_batches())
+
+        exporter = TableExporter(
+            self._new_item(),
+            batch_rows_count=2,
+            column_types={"head1.head11": pyarrow.float64()},
+        )
+        batches = list(exporter.iter_record_batches())
+
+        self.assertEqual(
+            [v for b in batches for v in b.column(0).to_pylist()],
+            [111.0, 211.0, 2.5],
+        )
+
+    def test_init__batch_rows_count(self) -> None:
+        with self.assertRaises(XlFormArgumentException):
+            TableExporter(self._new_item(), batch_rows_count=0)
+
+    def test_write_ipc(self) -> None:
+        import pyarrow
+
+        f = io.BytesIO()
+        exporter = TableExporter(self._new_item(), batch_rows_count=2)
+
+        self.assertEqual(exporter.write_ipc(f), 3)
+        table = pyarrow.ipc.open_stream(f.getvalue()).read_all()
+        self.assertEqual(
+            table.column("head1.head11").to_pylist(), [111, 211, 311]
+        )
+
+    def test_write_parquet(self) -> None:
+        import pyarrow.parquet  # type: ignore
+
+        path = (
+            Path(tempfile.mkdtemp(prefix="test_write_parquet")) / "t.parquet"
+        )
+        exporter = TableExporter(
+            self._new_item(), batch_rows_count=2, nested=True
+        )
+
+        self.assertEqual(exporter.write_parquet(path), 3)
+        table = pyarrow.parquet.read_table(path)
+        self.assertEqual(table.num_rows, 3)
+        self.assertEqual(
+            table.to_pylist()[2],
+            {
+                "head1": {"head11": 311, "head12": 3.5},
+                "head2": {"head21": "c"},
+            },
+        )
+
+    def _new_empty_item(self) -> FormItemTable:
+        item = self._new_item()
+        item.iter_row_values = lambda: iter(list())  # type: ignore
+        return item
+
+    def test_write_ipc__empty(self) -> None:
+        import pyarrow
+
+        f = io.BytesIO()
+        exporter = TableExporter(
+            self._new_empty_item(),
+            column_types={"head1.head12": pyarrow.float64()},
+        )
+
+        self.assertEqual(exporter.write_ipc(f), 0)
+        table = pyarrow.ipc.open_stream(f.getvalue()).read_all()
+        self.assertEqual(table.num_rows, 0)
+        self.assertEqual(
+            table.schema.names,
+            ["head1.head11", "head1.head12", "head2.head21"],
+        )
+        self.assertEqual(table.schema.field(0).type, pyarrow.null())
+        self.assertEqual(table.schema.field(1).type, pyarrow.float64())
+
+    def test_write_parquet__empty(self) -> None:
+        import pyarrow.parquet
+
+        path = (
+            Path(tempfile.mkdtemp(prefix="test_write_parquet")) / "t.parquet"
+        )
+        exporter = TableExporter(self._new_empty_item(), nested=True)
+
+        self.assertEqual(exporter.write_parquet(path), 0)
+        table = pyarrow.parquet.read_table(path)
+        self.assertEqual(table.num_rows, 0)
+        self.assertEqual(table.schema.names, ["head1", "head2"])
+        self.assertEqual(
+            table.schema.field(0).type,
+            pyarrow.struct(
+                [("head11", pyarrow.null()), ("head12", pyarrow.null())]
+            ),
+        )
+
+    def test_init__no_pyarrow(self) -> None:
+        module = sys.modules.get("pyarrow")
+        sys.modules["pyarrow"] = None  # type: ignore
+        try:
+            with self.assertRaises(XlFormRuntimeException):
+                TableExporter(self._new_item())
+        finally:
+            del sys.modules["pyarrow"]
+            if module is not None:
+                sys.modules["pyarrow"] = module
+
+
+if __name__ == "__main__":
+    unittest.main()
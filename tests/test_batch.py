@@ -0,0 +1,85 @@
+from pathlib import Path
+from typing import List
+from xlform.batch import iter_paths
+from xlform.batch import main
+from xlform.batch import run_batch
+from xlform.form import FormFactory
+from xlform.form import FormItemCell
+import json
+import openpyxl  # type: ignore
+import tempfile
+import unittest
+
+FACTORY: FormFactory = FormFactory()
+FACTORY.register_form(
+    "form1",
+    {
+        "item1": {
+            "cls": FormItemCell,
+            "kwargs": {"sheet_name": "Sheet", "range_arg": "A1"},
+        }
+    },
+)
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self) -> None:
+        self._dir_path = Path(tempfile.mkdtemp(prefix="test_batch"))
+        self._paths: List[Path] = list()
+        for value in [10, 20]:
+            wb = openpyxl.Workbook()
+            wb.active["A1"] = value
+            path = self._dir_path / ("book%d.xlsx" % (value))
+            wb.save(str(path))
+            wb.close()
+            self._paths.append(path)
+        self._broken_path = self._dir_path / "broken.xlsx"
+        self._broken_path.write_bytes(b"broken")
+
+    def test_iter_paths(self) -> None:
+        paths = list(iter_paths([str(self._dir_path / "book*.xlsx")]))
+
+        self.assertEqual(paths, self._paths)
+
+    def test_run_batch(self) -> None:
+        paths = self._paths + [self._broken_path]
+        results = list(run_batch(FACTORY, "form1", paths, workers=2))
+
+        result_dic = {result["path"]: result for result in results}
+        self.assertEqual(len(result_dic), 3)
+        self.assertEqual(
+            result_dic[str(self._paths[0])]["doc"]["item1"]["result"], 10
+        )
+        self.assertEqual(
+            result_dic[str(self._paths[1])]["doc"]["item1"]["result"], 20
+        )
+        self.assertTrue("error" in result_dic[str(self._broken_path)])
+
+    def test_main(self) -> None:
+        output_path = self._dir_path / "output.jsonl"
+        exit_code = main(
+            [
+                "%s:FACTORY" % (__name__),
+                "form1",
+                str(self._dir_path / "*.xlsx"),
+                "--workers",
+                "1",
+                "--meta-level",
+                "none",
+                "--output",
+                str(output_path),
+            ]
+        )
+
+        lines = output_path.read_text(encoding="utf-8").splitlines()
+        results = [json.loads(line) for line in lines]
+        self.assertEqual(exit_code, 1)
+        self.assertEqual(len(results), 3)
+        self.assertEqual(
+            sorted(r["doc"]["item1"]["result"] for r in results if "doc" in r),
+            [10, 20],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,305 @@
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import List
+from typing import Optional
+from xlform.batch import extract_form_doc
+from xlform.batch import run_batch
+from xlform.cache import decode_doc
+from xlform.cache import DirectoryDocStore
+from xlform.cache import DocStore
+from xlform.cache import encode_doc
+from xlform.cache import FormDocCache
+from xlform.cache import hash_file
+from xlform.cache import SqliteDocStore
+from xlform.engine.base import Book
+from xlform.engine.base import BookSource
+from xlform.engine.openpyxl import EngineOpenpyxlReadOnly
+from xlform.exception import XlFormArgumentException
+from xlform.form import FormFactory
+from xlform.form import FormItemCell
+from xlform.form import FormItemTable
+from xlform.form import MetaLevel
+from xlform.form import ResultFormat
+from xlform.form import TableEnd
+import array
+import datetime
+import json
+import openpyxl  # type: ignore
+import pickle
+import shutil
+import tempfile
+import unittest
+import unittest.mock
+
+FACTORY: FormFactory = FormFactory()
+FACTORY.register_form(
+    "form1",
+    {
+        "item1": {
+            "cls": FormItemCell,
+            "kwargs": {"sheet_name": "Sheet", "range_arg": "A1"},
+        }
+    },
+)
+
+
+class EngineCounting(EngineOpenpyxlReadOnly):
+    open_count = 0
+
+    def open_book(
+        self, path: BookSource, sheets: Optional[Iterable[str]] = None
+    ) -> Book:
+        EngineCounting.open_count += 1
+        return super().open_book(path, sheets)
+
+
+class BrokenDocStore(DirectoryDocStore):
+    broken_get = False
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        if self.broken_get:
+            raise OSError("broken get")
+        return super().get(key)
+
+    def put(self, key: str, doc: Dict[str, Any]) -> None:
+        raise OSError("broken put")
+
+
+class TestCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self._dir_path = Path(tempfile.mkdtemp(prefix="test_cache"))
+        self._paths: List[Path] = list()
+        for value in [10, 20]:
+            wb = openpyxl.Workbook()
+            wb.active["A1"] = value
+            path = self._dir_path / ("book%d.xlsx" % (value))
+            wb.save(str(path))
+            wb.close()
+            self._paths.append(path)
+        self._copy_path = self._dir_path / "copy.xlsx"
+        shutil.copyfile(str(self._paths[0]), str(self._copy_path))
+
+    def _check_store(self, store: DocStore) -> None:
+        self.assertIsNone(store.get("key1"))
+        store.put("key1", {"item1": {"result": 1}})
+        self.assertEqual(store.get("key1"), {"item1": {"result": 1}})
+        self.assertGreater(store.get_size(), 0)
+
+    def test_hash_file(self) -> None:
+        self.assertEqual(hash_file(self._paths[0]), hash_file(self._copy_path))
+        self.assertNotEqual(
+            hash_file(self._paths[0]), hash_file(self._paths[1])
+        )
+
+    def test_get_fingerprint(self) -> None:
+        factory: FormFactory = FormFactory()
+        factory.register_form("form1", {})
+        fingerprint = factory.get_fingerprint("form1")
+        factory.register_form(
+            "form1",
+            {
+                "item1": {
+                    "cls": FormItemCell,
+                    "kwargs": {"sheet_name": "Sheet", "range_arg": "A1"},
+                }
+            },
+        )
+
+        self.assertNotEqual(factory.get_fingerprint("form1"), fingerprint)
+        self.assertEqual(
+            factory.get_fingerprint("form1"), FACTORY.get_fingerprint("form1")
+        )
+
+    def test_get_fingerprint__table_end(self) -> None:
+        factory: FormFactory = FormFactory()
+        factory.register_form(
+            "form1",
+            {"item1": {"cls": FormItemCell, "kwargs": {"x": TableEnd()}}},
+        )
+        fingerprint = factory.get_fingerprint("form1")
+        factory.register_form(
+            "form1",
+            {"item1": {"cls": FormItemCell, "kwargs": {"x": TableEnd()}}},
+        )
+
+        self.assertEqual(factory.get_fingerprint("form1"), fingerprint)
+
+    def test_directory_doc_store(self) -> None:
+        self._check_store(DirectoryDocStore(self._dir_path / "cache"))
+
+    def test_directory_doc_store__evict(self) -> None:
+        store = DirectoryDocStore(self._dir_path / "cache", max_size=250)
+        doc: Any = {"result": "x" * 80}
+        for key in ["key1", "key2", "key3"]:
+            store.put(key, doc)
+        self.assertIsNone(store.get("key1"))
+        self.assertIsNotNone(store.get("key3"))
+        self.assertLessEqual(store.get_size(), 250)
+
+    def test_sqlite_doc_store(self) -> None:
+        store = SqliteDocStore(self._dir_path / "cache.sqlite3")
+        self._check_store(store)
+        store.close()
+
+    def test_sqlite_doc_store__evict(self) -> None:
+        store = SqliteDocStore(self._dir_path / "cache.sqlite3", max_size=250)
+        doc: Any = {"result": "x" * 80}
+        store.put("key1", doc)
+        store.put("key2", doc)
+        store.get("key1")
+        store.put("key3", doc)
+
+        self.assertIsNotNone(store.get("key1"))
+        self.assertIsNone(store.get("key2"))
+        self.assertLessEqual(store.get_size(), 250)
+        store.close()
+
+    def test_encode_doc(self) -> None:
+        doc: Dict[str, Any] = {
+            "datetime": datetime.datetime(2020, 1, 2, 3, 4, 5, 6),
+            "aware": datetime.datetime(
+                2020,
+                1,
+                2,
+                tzinfo=datetime.timezone(datetime.timedelta(hours=9)),
+            ),
+            "date": datetime.date(2020, 1, 2),
+            "time": datetime.time(3, 4, 5),
+            "timedelta": datetime.timedelta(1, 2, 3),
+            "values": [1, 1.5, True, None, "s", (1, 2), b"\x00"],
+            "keys": {1: "int", "__xlform__": "tag"},
+            "arrays": [array.array("q", [1, 2]), array.array("d", [1.5])],
+        }
+        data = encode_doc(doc)
+
+        self.assertIsInstance(json.loads(data.decode("utf-8")), dict)
+        self.assertEqual(decode_doc(data), doc)
+
+    def test_encode_doc__unknown_type(self) -> None:
+        with self.assertRaises(XlFormArgumentException):
+            encode_doc({"result": object()})
+
+    def test_directory_doc_store__json(self) -> None:
+        store = DirectoryDocStore(self._dir_path / "cache")
+        store.put("key1", {"item1": {"result": 1}})
+
+        self.assertEqual(
+            json.loads((self._dir_path / "cache" / "key1.json").read_text()),
+            {"item1": {"result": 1}},
+        )
+
+    def test_sqlite_doc_store__pickle(self) -> None:
+        store = SqliteDocStore(self._dir_path / "cache.sqlite3")
+        store.put("key1", {"item1": {"result": 1}})
+        store2 = pickle.loads(pickle.dumps(store))
+
+        self.assertEqual(store2.get("key1"), {"item1": {"result": 1}})
+        store.close()
+        store2.close()
+
+    def test_get_key__version(self) -> None:
+        cache = FormDocCache(DirectoryDocStore(self._dir_path / "cache"))
+        engine = EngineOpenpyxlReadOnly()
+        key = cache.get_key(FACTORY, "form1", self._paths[0], engine)
+        with unittest.mock.patch("xlform.cache.__version__", "0.0.0"):
+            key2 = cache.get_key(FACTORY, "form1", self._paths[0], engine)
+
+        self.assertNotEqual(key, key2)
+
+    def test_extract_form_doc(self) -> None:
+        cache = FormDocCache(DirectoryDocStore(self._dir_path / "cache"))
+        engine = EngineCounting()
+        EngineCounting.open_count = 0
+        doc1 = extract_form_doc(
+            FACTORY, "form1", self._paths[0], engine, cache=cache
+        )
+        doc2 = extract_form_doc(
+            FACTORY, "form1", self._copy_path, engine, cache=cache
+        )
+        doc3 = extract_form_doc(
+            FACTORY, "form1", self._paths[0], engine, MetaLevel.NONE, cache
+        )
+
+        self.assertEqual(doc1, doc2)
+        self.assertEqual(doc3, {"item1": {"_meta": {}, "result": 10}})
+        self.assertEqual(EngineCounting.open_count, 2)
+
+    def test_extract_form_doc__columns(self) -> None:
+        factory: FormFactory = FormFactory()
+        factory.register_form(
+            "form1",
+            {
+                "item1": {
+                    "cls": FormItemTable,
+                    "kwargs": {
+                        "sheet_name": "Sheet",
+                        "range_arg": "A1",
+                        "result_format": ResultFormat.COLUMNS,
+                    },
+                }
+            },
+        )
+        cache = FormDocCache(DirectoryDocStore(self._dir_path / "cache"))
+        engine = EngineCounting()
+        EngineCounting.open_count = 0
+        doc1 = extract_form_doc(
+            factory, "form1", self._paths[0], engine, cache=cache
+        )
+        doc2 = extract_form_doc(
+            factory, "form1", self._paths[0], engine, cache=cache
+        )
+
+        self.assertEqual(doc2, doc1)
+        self.assertEqual(doc2["item1"]["result"], [array.array("q", [10])])
+        self.assertEqual(EngineCounting.open_count, 1)
+
+    def test_run_batch(self) -> None:
+        store = DirectoryDocStore(self._dir_path / "cache")
+        cache = FormDocCache(store)
+        broken_path = self._dir_path / "broken.xlsx"
+        broken_path.write_bytes(b"broken")
+        paths = self._paths + [self._copy_path, broken_path]
+        results = list(
+            run_batch(FACTORY, "form1", paths, workers=2, cache=cache)
+        )
+
+        result_dic = {result["path"]: result for result in results}
+        self.assertEqual(len(result_dic), 4)
+        self.assertEqual(
+            result_dic[str(self._copy_path)]["doc"]["item1"]["result"], 10
+        )
+        self.assertTrue("error" in result_dic[str(broken_path)])
+        self.assertEqual(len(list((self._dir_path / "cache").iterdir())), 2)
+
+        results = list(run_batch(FACTORY, "form1", paths[:3], cache=cache))
+        self.assertEqual(
+            sorted(result["doc"]["item1"]["result"] for result in results),
+            [10, 10, 20],
+        )
+
+    def test_run_batch__cache_errors(self) -> None:
+        store = BrokenDocStore(self._dir_path / "cache")
+        cache = FormDocCache(store)
+        results = list(run_batch(FACTORY, "form1", self._paths, cache=cache))
+
+        self.assertEqual(
+            sorted(result["doc"]["item1"]["result"] for result in results),
+            [10, 20],
+        )
+        self.assertEqual(
+            [result["cache_error"] for result in results],
+            ["OSError: broken put"] * 2,
+        )
+
+        store.broken_get = True
+        results = list(run_batch(FACTORY, "form1", self._paths, cache=cache))
+        self.assertEqual(
+            [result["error"] for result in results],
+            ["OSError: broken get"] * 2,
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,38 @@
+from xlform.engine.base import format_range_arg
+from xlform.engine.base import get_column_index
+from xlform.engine.base import parse_range_arg
+from xlform.exception import XlFormArgumentException
+import unittest
+
+
+class TestEngineBase(unittest.TestCase):
+    def test_get_column_index(self) -> None:
+        self.assertEqual(get_column_index("A"), 1)
+        self.assertEqual(get_column_index("z"), 26)
+        self.assertEqual(get_column_index("AB"), 28)
+
+    def test_get_column_index__illegal(self) -> None:
+        with self.assertRaises(XlFormArgumentException):
+            get_column_index("")
+
+    def test_parse_range_arg(self) -> None:
+        self.assertEqual(parse_range_arg("B3"), (2, 3, 2, 3))
+        self.assertEqual(parse_range_arg("$A$1:C3"), (1, 1, 3, 3))
+
+    def test_parse_range_arg__unbounded(self) -> None:
+        self.assertEqual(parse_range_arg("A:C"), (1, None, 3, None))
+        self.assertEqual(parse_range_arg("1:3"), (None, 1, None, 3))
+        self.assertEqual(parse_range_arg("A3:C"), (1, 3, 3, None))
+
+    def test_parse_range_arg__illegal(self) -> None:
+        for arg in ["", "A", "A0", "C1:A1", "A3:C1", "A1:B2:C3", "A:3"]:
+            with self.subTest(arg=arg):
+                with self.assertRaises(XlFormArgumentException):
+                    parse_range_arg(arg)
+
+    def test_format_range_arg(self) -> None:
+        self.assertEqual(format_range_arg(1, 2, 28, 5), "A2:AB5")
+
+
+if __name__ == "__main__":
+    unittest.main()
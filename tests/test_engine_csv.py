@@ -0,0 +1,291 @@
+from pathlib import Path
+from typing import Any
+from typing import Iterable
+from typing import List
+from typing import Optional
+from typing import Union
+from unittest import TestLoader
+from unittest import TestSuite
+from xlform.batch import extract_form_doc
+from xlform.engine.base import Book
+from xlform.engine.base import BookSource
+from xlform.engine.base import Sheet
+from xlform.engine.csv import EngineCsv
+from xlform.engine.csv import SheetCsv
+from xlform.engine.test import EngineTestCase
+from xlform.exception import XlFormNotImplementedException
+from xlform.form import FormFactory
+from xlform.form import FormItemCell
+from xlform.form import FormItemTable
+from xlform.form import MetaLevel
+import csv
+import io
+import tempfile
+import xlform.engine.test
+import unittest
+
+
+def _write_csv(
+    path: Path, rows: List[List[Any]], dialect: str = "excel"
+) -> None:
+    with path.open("w", newline="") as f:
+        csv.writer(f, dialect=dialect).writerows(rows)
+
+
+def _read_csv(path: Path) -> List[List[str]]:
+    with path.open("r", newline="") as f:
+        return list(csv.reader(f))
+
+
+class _ClosingEngineCsv(EngineCsv):
+    # Closes the books opened by the common tests, which don't close them.
+    def __init__(self, test_case: unittest.TestCase) -> None:
+        super().__init__()
+        self._test_case = test_case
+
+    def open_book(
+        self, path: BookSource, sheets: Optional[Iterable[str]] = None
+    ) -> Book:
+        book = super().open_book(path, sheets)
+        self._test_case.addCleanup(book.close)
+        return book
+
+
+class TestEngineCsv(EngineTestCase):
+    def setUp(self) -> None:
+        self._engine = _ClosingEngineCsv(self)
+
+    def _get_book_path(
+        self,
+        prefix: Optional[str] = None,
+        rows: Optional[List[List[Union[float, int, str]]]] = None,
+    ) -> Path:
+        path = Path(tempfile.mkdtemp(prefix=prefix)) / "Sheet.csv"
+        _write_csv(path, [[0]] if rows is None else rows)
+        return path
+
+    def test_engine_open_book__buffer(self) -> None:
+        path = self._get_a1_zero_book_path(prefix="test_engine_open_book")
+        data = path.read_bytes()
+
+        sources: List[BookSource] = [data, bytearray(data), memoryview(data)]
+        for source in sources:
+            book: Book = self._engine.open_book(source)
+            sheet: Sheet = book.get_sheet("Sheet1")
+            self.assertEqual(sheet.get_range("A1").get_values(), [[0]])
+            book.close()
+
+    def test_engine_open_book__mmap(self) -> None:
+        self.skipTest("Covered by test_engine_open_book__buffer.")
+
+    def test_engine_open_book__file(self) -> None:
+        path = self._get_a1_zero_book_path(prefix="test_engine_open_book")
+
+        with path.open("rb") as f:
+            book: Book = self._engine.open_book(f)
+            sheet: Sheet = book.get_sheet("Sheet")
+            self.assertEqual(sheet.get_range("A1").get_values(), [[0]])
+            book.close()
+
+            # The file belongs to the caller.
+            self.assertFalse(f.closed)
+
+    def test_engine_open_book__sheets(self) -> None:
+        path = self._get_a1_zero_book_path(prefix="test_engine_open_book")
+
+        book: Book = self._engine.open_book(path, sheets=[])
+        sheets: List[Sheet] = book.get_sheets()
+
+        self.assertEqual([s.get_name() for s in sheets], ["Sheet"])
+        self.assertFalse(sheets[0].is_loaded())
+
+    def test_book_iter_sheets(self) -> None:
+        self.skipTest("EngineCsv has one sheet per file.")
+
+    def test_book_get_sheets(self) -> None:
+        self.skipTest("EngineCsv has one sheet per file.")
+
+    def test_book_get_sheet(self) -> None:
+        self.skipTest("EngineCsv has one sheet per file.")
+
+    def test_book_add_sheet(self) -> None:
+        book: Book = self._engine.new_book()
+        with self.assertRaises(XlFormNotImplementedException):
+            book.add_sheet("Sheet2")
+
+    def test_book_save__a1_is_zero(self) -> None:
+        path = self._get_a1_zero_book_path(prefix="test_book_save")
+        book: Book = self._engine.open_book(path)
+        path2 = Path(tempfile.mkdtemp()) / "book.csv"
+        book.save(path2)
+
+        self.assertEqual(_read_csv(path2), [["0"]])
+
+    def test_book_save__stream(self) -> None:
+        path = self._get_a1_zero_book_path(prefix="test_book_save")
+        book: Book = self._engine.open_book(path)
+        f = io.BytesIO()
+        book.save(f)
+
+        self.assertEqual(f.getvalue(), b"0\r\n")
+
+    def test_book_save_bytes(self) -> None:
+        path = self._get_a1_zero_book_path(prefix="test_book_save")
+        book: Book = self._engine.open_book(path)
+
+        self.assertEqual(book.save_bytes(), b"0\r\n")
+
+    def test_book_save__same_file(self) -> None:
+        path = self._get_book_path(rows=[[1], [2], [3]])
+        engine = EngineCsv(chunk_rows=1)
+        book: Book = engine.open_book(path)
+        book.get_sheet("Sheet").get_cell(1, 2).set_value("a")
+        book.save(path)
+        book.close()
+
+        self.assertEqual(_read_csv(path), [["1", "a"], ["2", ""], ["3", ""]])
+
+    def test_sheet_protect(self) -> None:
+        self.skipTest("not implemented")
+
+    def test_sheet_unprotect(self) -> None:
+        self.skipTest("not implemented")
+
+    def test_cell_get_value__fields(self) -> None:
+        path = self._get_book_path(
+            rows=[["007", "-1.5", "1e3", "abc", "", " 1"]]
+        )
+
+        book: Book = self._engine.open_book(path)
+        r = book.get_sheet("Sheet").get_range("A1:F1")
+        values = r.get_values_or_none()
+
+        self.assertEqual(values, [[7, -1.5, 1000.0, "abc", None, " 1"]])
+        self.assertIsInstance(values[0][2], float)
+
+    def test_range_dump__text(self) -> None:
+        path = self._get_book_path(rows=[["007", "1.50", "a"]])
+
+        book: Book = self._engine.open_book(path)
+        dump = book.get_sheet("Sheet").get_range("A1:C1").dump()
+
+        self.assertEqual(dump["value"], [7, 1.5, "a"])
+        self.assertEqual(dump["text"], ["007", "1.50", "a"])
+
+    def test_sheet_get_range__open_ended(self) -> None:
+        path = self._get_book_path(rows=[[1], [2], [3]])
+
+        book: Book = self._engine.open_book(path)
+        sheet = book.get_sheet("Sheet")
+
+        self.assertEqual(sheet.get_range("A2:A").get_values(), [[2], [3]])
+        self.assertEqual(sheet.get_range("A5:A").get_rows_count(), 1)
+
+    def test_sheet_get_range__lazy(self) -> None:
+        path = self._get_book_path(rows=[[row] for row in range(1, 11)])
+        engine = EngineCsv(chunk_rows=2)
+        book: Book = engine.open_book(path)
+        sheet = book.get_sheet("Sheet")
+        assert isinstance(sheet, SheetCsv)
+
+        self.assertEqual(sheet.get_range("A2:A3").get_values(), [[2], [3]])
+        self.assertEqual(len(sheet._rows), 4)
+        self.assertEqual(sheet.get_max_row(), 10)
+        self.assertEqual(len(sheet._rows), 10)
+
+    def test_sheet_iter_values__open_ended(self) -> None:
+        path = self._get_book_path(rows=[[1, 2], [3], [4, 5, 6]])
+        engine = EngineCsv(chunk_rows=2)
+        book: Book = engine.open_book(path)
+        sheet = book.get_sheet("Sheet")
+
+        self.assertEqual(list(sheet.iter_values(2, 1, 2)), [[3, None], [4, 5]])
+
+    def test_engine_open_book__tsv(self) -> None:
+        path = Path(tempfile.mkdtemp()) / "Data.tsv"
+        _write_csv(path, [["a,b", 1]], dialect="excel-tab")
+
+        engine = EngineCsv(dialect="excel-tab")
+        book: Book = engine.open_book(path)
+
+        self.assertEqual(
+            book.get_sheet("Data").get_range("A1:B1").get_values(),
+            [["a,b", 1]],
+        )
+
+    def test_form(self) -> None:
+        path = self._get_book_path(
+            rows=[["name", "x"], ["id", "value"], [1, "a"], [2, "b"]]
+        )
+        factory = FormFactory()
+        factory.register_form(
+            "form1",
+            {
+                "name": {
+                    "cls": FormItemCell,
+                    "kwargs": {"sheet_name": "Sheet", "range_arg": "B1"},
+                },
+                "table": {
+                    "cls": FormItemTable,
+                    "kwargs": {
+                        "sheet_name": "Sheet",
+                        "range_arg": "A2:B4",
+                        "header_rows_count": 1,
+                        "header_path_list": [["id"], ["value"]],
+                    },
+                },
+            },
+        )
+
+        book: Book = self._engine.open_book(path)
+        form = factory.new_form("form1", book, compiled=True)
+        doc = form.get_form_doc(MetaLevel.NONE)
+
+        self.assertEqual(doc["name"]["result"], "x")
+        self.assertEqual(
+            doc["table"]["result"],
+            [{"id": 1, "value": "a"}, {"id": 2, "value": "b"}],
+        )
+
+    def test_engine_open_book__sheet_name(self) -> None:
+        path = Path(tempfile.mkdtemp()) / "feed.csv"
+        _write_csv(path, [["x"]])
+        factory = FormFactory()
+        factory.register_form(
+            "form1",
+            {
+                "name": {
+                    "cls": FormItemCell,
+                    "kwargs": {"sheet_name": "Sheet1", "range_arg": "A1"},
+                },
+            },
+        )
+
+        engine = EngineCsv(sheet_name="Sheet1")
+        doc = extract_form_doc(factory, "form1", path, engine, MetaLevel.NONE)
+
+        self.assertEqual(doc["name"]["result"], "x")
+        self.assertEqual(
+            engine.new_book().get_sheets()[0].get_name(), "Sheet1"
+        )
+
+    def test_sheet_close__end_of_file(self) -> None:
+        path = self._get_book_path(rows=[[1], [2], [3]])
+        engine = EngineCsv(chunk_rows=2)
+        book: Book = engine.open_book(path)
+        sheet = book.get_sheet("Sheet")
+        assert isinstance(sheet, SheetCsv)
+
+        self.assertEqual(sheet.get_range("A1").get_values(), [[1]])
+        self.assertIsNotNone(sheet._file)
+        self.assertEqual(sheet.get_max_row(), 3)
+        self.assertIsNone(sheet._file)
+        book.close()
+
+
+def load_tests(loader: TestLoader, tests: Any, patterns: Any) -> TestSuite:
+    return xlform.engine.test.load_tests(loader, (TestEngineCsv,))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,121 @@
+from pathlib import Path
+from typing import Any
+from unittest import TestLoader
+from unittest import TestSuite
+from xlform.engine.base import Book
+from xlform.engine.base import Sheet
+from xlform.engine.memory import EngineMemory
+from xlform.engine.test import EngineTestCase
+from xlform.exception import XlFormArgumentException
+from xlform.exception import XlFormRuntimeException
+import openpyxl  # type: ignore
+import tempfile
+import xlform.engine.test
+import unittest
+
+
+class TestEngineMemory(EngineTestCase):
+    def setUp(self) -> None:
+        self._engine = EngineMemory()
+
+    def test_cell_get_text(self) -> None:
+        self.skipTest("EngineMemory doesn't support evaluation of formula.")
+
+    def test_cell_slots(self) -> None:
+        book: Book = self._engine.new_book()
+        cell = book.get_sheet("Sheet1").get_cell(1, 1)
+
+        self.assertFalse(hasattr(cell, "__dict__"))
+
+    def test_book_add_sheet__exists(self) -> None:
+        book: Book = self._engine.new_book()
+
+        with self.assertRaises(XlFormArgumentException):
+            book.add_sheet("Sheet1")
+
+    def test_sheet_get_range__sparse(self) -> None:
+        book: Book = self._engine.new_book()
+        sheet: Sheet = book.get_sheet("Sheet1")
+        sheet.get_cell(1000, 3).set_value(1)
+
+        self.assertEqual(sheet.get_max_row(), 1000)
+        self.assertEqual(sheet.get_range("C:C").get_rows_count(), 1000)
+        self.assertEqual(
+            sheet.get_range("B999:D1000").get_values_or_none(),
+            [[None, None, None], [None, 1, None]],
+        )
+
+    def test_sheet_get_range__open_ended(self) -> None:
+        book: Book = self._engine.new_book()
+        sheet: Sheet = book.get_sheet("Sheet1")
+        sheet.get_range("A1:A5").set_values([[1], [2], [3], [4], [5]])
+
+        self.assertEqual(sheet.get_range("A3:A").get_values(), [[3], [4], [5]])
+        self.assertEqual(sheet.get_range("A9:A").get_rows_count(), 1)
+
+    def test_engine_open_book__sparse(self) -> None:
+        path = self._get_book_path(prefix="test_engine_open_book")
+        wb = openpyxl.load_workbook(str(path))
+        wb.active["C5"] = "c5"
+        wb.save(str(path))
+        wb.close()
+
+        book: Book = self._engine.open_book(path)
+        sheet: Sheet = book.get_sheets()[0]
+        self.assertEqual(sheet.get_max_row(), 5)
+        self.assertEqual(
+            sheet.get_range("A1:C5").get_values_or_none(),
+            [[0, None, None]]
+            + [[None, None, None]] * 3
+            + [[None, None, "c5"]],
+        )
+
+    def test_book_save__round_trip(self) -> None:
+        book: Book = self._engine.new_book()
+        sheet: Sheet = book.get_sheet("Sheet1")
+        sheet.get_range("A1:B2").set_values([[1, "a"], [2.5, "=A1+1"]])
+        path = Path(tempfile.mkdtemp()) / "book.xlsx"
+        book.save(path)
+
+        wb = openpyxl.load_workbook(str(path))
+        ws = wb["Sheet1"]
+        self.assertEqual(
+            [[c.value for c in row] for row in ws["A1:B2"]],
+            [[1, "a"], [2.5, "=A1+1"]],
+        )
+        book2: Book = self._engine.open_book(path)
+        self.assertEqual(
+            book2.get_sheet("Sheet1").get_range("A1:B2").dump()["formula"],
+            [1, "a", 2.5, "=A1+1"],
+        )
+
+    def test_book_save__number_format(self) -> None:
+        path = self._get_book_path(rows=[[1]], prefix="test_book_save")
+        wb = openpyxl.load_workbook(str(path))
+        wb.active["A1"].number_format = "0.00"
+        wb.save(str(path))
+        wb.close()
+
+        book: Book = self._engine.open_book(path)
+        cell = book.get_sheets()[0].get_cell(1, 1)
+        self.assertEqual(cell.get_number_format(), "0.00")
+        path2 = Path(tempfile.mkdtemp()) / "book.xlsx"
+        book.save(path2)
+
+        wb = openpyxl.load_workbook(str(path2))
+        self.assertEqual(wb.active["A1"].number_format, "0.00")
+
+    def test_book_save__unloaded_sheets(self) -> None:
+        path = self._get_book_path(rows=[[1]], prefix="test_book_save")
+        book: Book = self._engine.open_book(path, sheets=[])
+
+        with self.assertRaises(XlFormRuntimeException):
+            book.save(Path(tempfile.mkdtemp()) / "book.xlsx")
+
+
+def load_tests(loader: TestLoader, tests: Any, patterns: Any) -> TestSuite:
+    return xlform.engine.test.load_tests(loader, (TestEngineMemory,))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,17 @@
+from openpyxl.workbook.defined_name import DefinedName  # type: ignore
+from pathlib import Path
 from typing import Any
+from typing import cast
+from typing import List
 from unittest import TestLoader
 from unittest import TestSuite
+from xlform.engine.base import Book
+from xlform.engine.base import Sheet
 from xlform.engine.openpyxl import EngineOpenpyxl
 from xlform.engine.test import EngineTestCase
+from xlform.exception import XlFormRuntimeException
+import openpyxl  # type: ignore
+import tempfile
 import xlform.engine.test
 import unittest
 
@@ -11,6 +20,38 @@ class TestEngineOpenpyxl(EngineTestCase):
     def setUp(self) -> None:
         self._engine = EngineOpenpyxl()
 
+    def test_book_get_sheet__cached(self) -> None:
+        book: Book = self._engine.new_book()
+        book.add_sheet("Sheet2")
+        sheets: List[Sheet] = book.get_sheets()
+
+        self.assertIs(book.get_sheet("Sheet1"), sheets[0])
+        self.assertIs(book.get_sheet("Sheet2"), sheets[1])
+        self.assertIs(book.get_sheet("Sheet2"), book.get_sheet("Sheet2"))
+
+    def test_engine_open_book__sheets_defined_names(self) -> None:
+        wb = openpyxl.Workbook()
+        wb.create_sheet("Sheet2")
+        ws3 = wb.create_sheet("Sheet3")
+        ws3["A1"] = 1
+        ws3.print_title_rows = "1:1"
+        wb.defined_names["global1"] = DefinedName(
+            "global1", attr_text="Sheet3!$A$1"
+        )
+        path = Path(tempfile.mkdtemp()) / "book.xlsx"
+        wb.save(str(path))
+        wb.close()
+
+        book: Book = self._engine.open_book(path, sheets=["Sheet3"])
+        path2 = Path(tempfile.mkdtemp()) / "book.xlsx"
+        with self.assertRaises(XlFormRuntimeException):
+            book.save(path2)
+
+        # The local names refer to Sheet3 by its index in the file.
+        ws = cast(Any, book.get_sheet("Sheet3"))._sheet
+        self.assertEqual(ws.print_title_rows, "$1:$1")
+        self.assertIn("global1", ws.parent.defined_names)
+
     def test_cell_get_text(self) -> None:
         self.skipTest("EngineOpenpyxl doesn't support evaluation of formula.")
 
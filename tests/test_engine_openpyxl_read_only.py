@@ -0,0 +1,116 @@
+from typing import Any
+from unittest import TestLoader
+from unittest import TestSuite
+from xlform.engine.base import Book
+from xlform.engine.base import Sheet
+from xlform.engine.openpyxl import EngineOpenpyxlReadOnly
+from xlform.engine.test import EngineTestCase
+from xlform.exception import XlFormNotImplementedException
+from xlform.form import FormFactory
+from xlform.form import FormItemTable
+import xlform.engine.test
+import unittest
+
+
+class TestEngineOpenpyxlReadOnly(EngineTestCase):
+    def setUp(self) -> None:
+        self._engine = EngineOpenpyxlReadOnly()
+
+    def test_engine_new_book(self) -> None:
+        with self.assertRaises(XlFormNotImplementedException):
+            self._engine.new_book()
+
+    def test_engine_new_book__new_book_has_only_one_sheet(self) -> None:
+        self.skipTest("EngineOpenpyxlReadOnly can't create books.")
+
+    def test_engine_new_book__sheet_name_is_sheet1(self) -> None:
+        self.skipTest("EngineOpenpyxlReadOnly can't create books.")
+
+    def test_book_save__file_exists(self) -> None:
+        self.skipTest("EngineOpenpyxlReadOnly can't save books.")
+
+    def test_book_save__a1_is_zero(self) -> None:
+        self.skipTest("EngineOpenpyxlReadOnly can't save books.")
+
+    def test_book_save__stream(self) -> None:
+        self.skipTest("EngineOpenpyxlReadOnly can't save books.")
+
+    def test_book_save_bytes(self) -> None:
+        self.skipTest("EngineOpenpyxlReadOnly can't save books.")
+
+    def test_book_add_sheet(self) -> None:
+        self.skipTest("EngineOpenpyxlReadOnly can't modify books.")
+
+    def test_cell_set_value(self) -> None:
+        path = self._get_a1_zero_book_path(prefix="test_cell_set_value")
+
+        book: Book = self._engine.open_book(path)
+        sheet: Sheet = book.get_sheets()[0]
+        with self.assertRaises(XlFormNotImplementedException):
+            sheet.get_cell(1, 1).set_value(1)
+
+    def test_range_set_values(self) -> None:
+        self.skipTest("EngineOpenpyxlReadOnly can't modify books.")
+
+    def test_range_set_values__out_of_range(self) -> None:
+        self.skipTest("EngineOpenpyxlReadOnly can't modify books.")
+
+    def test_cell_get_text(self) -> None:
+        self.skipTest("EngineOpenpyxl doesn't support evaluation of formula.")
+
+    def test_sheet_protect(self) -> None:
+        self.skipTest("not implemented")
+
+    def test_sheet_unprotect(self) -> None:
+        self.skipTest("not implemented")
+
+    def test_range_get_cell__address(self) -> None:
+        path = self._get_book_path(
+            rows=[[11, 12, 13], [21, 22, 23]], prefix="test_range_get_cell"
+        )
+
+        book: Book = self._engine.open_book(path)
+        sheet: Sheet = book.get_sheets()[0]
+        r = sheet.get_range("B1:D2")
+
+        self.assertEqual(r.get_cell(2, 1).get_address(), "$B$2")
+        self.assertEqual(r.get_cell(2, 3).get_address(), "$D$2")
+
+    def test_get_form_doc(self) -> None:
+        path = self._get_book_path(
+            rows=[["head1", "head2"], [11, 12], [21, 22]],
+            prefix="test_get_form_doc",
+        )
+        factory: FormFactory = FormFactory()
+        factory.register_form(
+            "form1",
+            {
+                "item1": {
+                    "cls": FormItemTable,
+                    "kwargs": {
+                        "sheet_name": "Sheet",
+                        "range_arg": "A1:B3",
+                        "header_rows_count": 1,
+                        "header_path_list": [["head1"], ["head2"]],
+                    },
+                }
+            },
+        )
+
+        book: Book = self._engine.open_book(path)
+        form = factory.new_form("form1", book)
+        doc = form.get_form_doc()
+        book.close()
+
+        self.assertEqual(
+            doc["item1"]["result"],
+            [{"head1": 11, "head2": 12}, {"head1": 21, "head2": 22}],
+        )
+
+
+def load_tests(loader: TestLoader, tests: Any, patterns: Any) -> TestSuite:
+    return xlform.engine.test.load_tests(loader, (TestEngineOpenpyxlReadOnly,))
+
+
+if __name__ == "__main__":
+    unittest.main()
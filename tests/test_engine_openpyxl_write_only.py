@@ -0,0 +1,162 @@
+from pathlib import Path
+from typing import Any
+from typing import List
+from xlform.engine.base import Book
+from xlform.engine.base import Engine
+from xlform.engine.base import Sheet
+from xlform.engine.openpyxl import EngineOpenpyxlWriteOnly
+from xlform.exception import XlFormArgumentException
+from xlform.exception import XlFormNotImplementedException
+from xlform.form import FormFactory
+from xlform.form import FormItemKeyValueCells
+from xlform.form import FormItemTable
+import openpyxl  # type: ignore
+import tempfile
+import unittest
+
+
+class TestEngineOpenpyxlWriteOnly(unittest.TestCase):
+    def setUp(self) -> None:
+        self._engine: Engine = EngineOpenpyxlWriteOnly()
+
+    def _load_values(self, path: Path) -> List[List[Any]]:
+        wb = openpyxl.load_workbook(str(path))
+        values = [list(row) for row in wb.active.values]
+        wb.close()
+        return values
+
+    def test_engine_new_book__sheet_name_is_sheet1(self) -> None:
+        book: Book = self._engine.new_book()
+        sheets = book.get_sheets()
+
+        self.assertEqual(len(sheets), 1)
+        self.assertEqual(sheets[0].get_name(), "Sheet1")
+
+    def test_engine_open_book(self) -> None:
+        with self.assertRaises(XlFormNotImplementedException):
+            self._engine.open_book(Path("book.xlsx"))
+
+    def test_cell_set_value(self) -> None:
+        book: Book = self._engine.new_book()
+        sheet: Sheet = book.get_sheets()[0]
+        sheet.get_cell(1, 1).set_value(11)
+        sheet.get_cell(1, 2).set_value(12)
+        sheet.get_cell(3, 2).set_value(32)
+        path = Path(tempfile.mkdtemp()) / "book.xlsx"
+        book.save(path)
+
+        self.assertEqual(
+            self._load_values(path), [[11, 12], [None, None], [None, 32]]
+        )
+
+    def test_cell_set_value__written_row(self) -> None:
+        book: Book = self._engine.new_book()
+        sheet: Sheet = book.get_sheets()[0]
+        sheet.get_cell(1, 1).set_value(11)
+        sheet.get_cell(2, 1).set_value(21)
+
+        with self.assertRaises(XlFormArgumentException):
+            sheet.get_cell(1, 2).set_value(12)
+        book.save(Path(tempfile.mkdtemp()) / "book.xlsx")
+
+    def test_cell_set_value__pending_row(self) -> None:
+        book: Book = self._engine.new_book()
+        sheet: Sheet = book.get_sheets()[0]
+        sheet.get_cell(5, 1).set_value("x")
+        sheet.get_cell(5, 2).set_value("y")
+
+        with self.assertRaises(XlFormArgumentException):
+            sheet.get_cell(3, 1).set_value("z")
+        path = Path(tempfile.mkdtemp()) / "book.xlsx"
+        book.save(path)
+
+        self.assertEqual(self._load_values(path)[-1], ["x", "y"])
+        self.assertEqual(len(self._load_values(path)), 5)
+
+    def test_cell_get_value(self) -> None:
+        book: Book = self._engine.new_book()
+        sheet: Sheet = book.get_sheets()[0]
+
+        with self.assertRaises(XlFormNotImplementedException):
+            sheet.get_cell(1, 1).get_value()
+
+    def test_sheet_get_range(self) -> None:
+        book: Book = self._engine.new_book()
+        sheet: Sheet = book.get_sheets()[0]
+        r = sheet.get_range("B2:D3")
+
+        self.assertEqual(r.get_rows_count(), 2)
+        self.assertEqual(r.get_columns_count(), 3)
+        self.assertEqual(r.get_cell(2, 3).get_address(), "$D$3")
+
+    def test_set_form_doc(self) -> None:
+        factory: FormFactory = FormFactory()
+        factory.register_form(
+            "form1",
+            {
+                "item1": {
+                    "cls": FormItemTable,
+                    "kwargs": {"sheet_name": "Sheet1", "range_arg": "B2:C3"},
+                }
+            },
+        )
+        book: Book = self._engine.new_book()
+        form = factory.new_form("form1", book)
+        form.set_form_doc({"item1": {"result": [[1, 2], [3, 4]]}})
+        path = Path(tempfile.mkdtemp()) / "book.xlsx"
+        book.save(path)
+
+        self.assertEqual(
+            self._load_values(path),
+            [[None, None, None], [None, 1, 2], [None, 3, 4]],
+        )
+
+    def test_set_form_doc__headers(self) -> None:
+        factory: FormFactory = FormFactory()
+        factory.register_form(
+            "form1",
+            {
+                "item1": {
+                    "cls": FormItemKeyValueCells,
+                    "kwargs": {
+                        "sheet_name": "Sheet1",
+                        "range_arg": "A1:B1",
+                        "header_value": "key",
+                    },
+                },
+                "item2": {
+                    "cls": FormItemTable,
+                    "kwargs": {
+                        "sheet_name": "Sheet1",
+                        "range_arg": "A2:B5",
+                        "header_rows_count": 2,
+                        "header_path_list": [["h1", "h11"], ["h1", "h12"]],
+                    },
+                },
+            },
+        )
+        book: Book = self._engine.new_book()
+        self.assertEqual(book.get_cell_attributes(), frozenset())
+        form = factory.new_form("form1", book)
+        form.set_form_doc(
+            {
+                "item1": {"result": "value"},
+                "item2": {
+                    "result": [
+                        {"h1": {"h11": 1, "h12": 2}},
+                        {"h1": {"h11": 3, "h12": 4}},
+                    ]
+                },
+            }
+        )
+        path = Path(tempfile.mkdtemp()) / "book.xlsx"
+        book.save(path)
+
+        self.assertEqual(
+            self._load_values(path),
+            [["key", "value"], ["h1", "h1"], ["h11", "h12"], [1, 2], [3, 4]],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
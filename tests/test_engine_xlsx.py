@@ -0,0 +1,345 @@
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import IO
+from typing import List
+from unittest import TestLoader
+from unittest import TestSuite
+from xlform.engine.base import Book
+from xlform.engine.base import Sheet
+from xlform.engine.test import EngineTestCase
+from xlform.engine.xlsx import BookXlsx
+from xlform.engine.xlsx import EngineXlsxReader
+from xlform.exception import XlFormNotImplementedException
+from xlform.form import FormFactory
+from xlform.form import FormItemTable
+import datetime
+import tempfile
+import xlform.engine.test
+import unittest
+import unittest.mock
+import zipfile
+
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+_DOC_REL_NS = (
+    "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+)
+
+
+def _write_book(sheet_data: str, date1904: bool = False) -> Path:
+    # Writes the parts of a book like the ones written by Excel, with the
+    # shared strings and the styles.
+    parts: Dict[str, str] = {
+        "_rels/.rels": (
+            '<Relationships xmlns="%s">'
+            '<Relationship Id="rId1" Target="xl/workbook.xml" '
+            'Type="%s/officeDocument"/>'
+            "</Relationships>" % (_REL_NS, _DOC_REL_NS)
+        ),
+        "xl/workbook.xml": (
+            '<workbook xmlns="%s" xmlns:r="%s"><workbookPr%s/><sheets>'
+            '<sheet name="Data" sheetId="1" r:id="rId1"/>'
+            '<sheet name="Form" sheetId="2" r:id="rId2"/>'
+            "</sheets></workbook>"
+            % (_MAIN_NS, _DOC_REL_NS, ' date1904="1"' if date1904 else "")
+        ),
+        "xl/_rels/workbook.xml.rels": (
+            '<Relationships xmlns="%s">'
+            '<Relationship Id="rId1" Target="worksheets/sheet1.xml" '
+            'Type="%s/worksheet"/>'
+            '<Relationship Id="rId2" Target="/xl/worksheets/sheet2.xml" '
+            'Type="%s/worksheet"/>'
+            '<Relationship Id="rId3" Target="sharedStrings.xml" '
+            'Type="%s/sharedStrings"/>'
+            '<Relationship Id="rId4" Target="styles.xml" '
+            'Type="%s/styles"/>'
+            "</Relationships>"
+            % (_REL_NS, _DOC_REL_NS, _DOC_REL_NS, _DOC_REL_NS, _DOC_REL_NS)
+        ),
+        "xl/sharedStrings.xml": (
+            '<sst xmlns="%s"><si><t>a</t></si>'
+            "<si><r><t>b</t></r><r><t>c</t></r>"
+            "<rPh><t>x</t></rPh></si></sst>" % (_MAIN_NS)
+        ),
+        "xl/styles.xml": (
+            '<styleSheet xmlns="%s"><numFmts>'
+            '<numFmt numFmtId="164" formatCode="0.000"/></numFmts>'
+            '<cellStyleXfs><xf numFmtId="14"/></cellStyleXfs>'
+            '<cellXfs><xf numFmtId="0"/><xf numFmtId="14"/>'
+            '<xf numFmtId="164"/></cellXfs></styleSheet>' % (_MAIN_NS)
+        ),
+        "xl/worksheets/sheet1.xml": (
+            '<worksheet xmlns="%s"><sheetData>%s</sheetData></worksheet>'
+            % (_MAIN_NS, sheet_data)
+        ),
+        "xl/worksheets/sheet2.xml": (
+            '<worksheet xmlns="%s"><dimension ref="A1"/><sheetData>'
+            '<row r="1"><c r="A1" t="s"><v>0</v></c></row>'
+            "</sheetData></worksheet>" % (_MAIN_NS)
+        ),
+    }
+    path = Path(tempfile.mkdtemp(prefix="test_engine_xlsx")) / "book.xlsx"
+    with zipfile.ZipFile(str(path), "w") as zip_file:
+        for name, data in parts.items():
+            zip_file.writestr(name, data)
+    return path
+
+
+class TestEngineXlsxReader(EngineTestCase):
+    def setUp(self) -> None:
+        self._engine = EngineXlsxReader()
+
+    def test_engine_new_book(self) -> None:
+        with self.assertRaises(XlFormNotImplementedException):
+            self._engine.new_book()
+
+    def test_engine_new_book__new_book_has_only_one_sheet(self) -> None:
+        self.skipTest("EngineXlsxReader can't create books.")
+
+    def test_engine_new_book__sheet_name_is_sheet1(self) -> None:
+        self.skipTest("EngineXlsxReader can't create books.")
+
+    def test_book_save__file_exists(self) -> None:
+        self.skipTest("EngineXlsxReader can't save books.")
+
+    def test_book_save__a1_is_zero(self) -> None:
+        self.skipTest("EngineXlsxReader can't save books.")
+
+    def test_book_save__stream(self) -> None:
+        self.skipTest("EngineXlsxReader can't save books.")
+
+    def test_book_save_bytes(self) -> None:
+        self.skipTest("EngineXlsxReader can't save books.")
+
+    def test_book_add_sheet(self) -> None:
+        self.skipTest("EngineXlsxReader can't modify books.")
+
+    def test_cell_set_value(self) -> None:
+        path = self._get_a1_zero_book_path(prefix="test_cell_set_value")
+
+        book: Book = self._engine.open_book(path)
+        sheet: Sheet = book.get_sheets()[0]
+        with self.assertRaises(XlFormNotImplementedException):
+            sheet.get_cell(1, 1).set_value(1)
+
+    def test_range_set_values(self) -> None:
+        self.skipTest("EngineXlsxReader can't modify books.")
+
+    def test_range_set_values__out_of_range(self) -> None:
+        self.skipTest("EngineXlsxReader can't modify books.")
+
+    def test_cell_get_text(self) -> None:
+        self.skipTest(
+            "EngineXlsxReader doesn't support evaluation of formula."
+        )
+
+    def test_sheet_protect(self) -> None:
+        self.skipTest("not implemented")
+
+    def test_sheet_unprotect(self) -> None:
+        self.skipTest("not implemented")
+
+    def test_range_get_cell__address(self) -> None:
+        path = self._get_book_path(
+            rows=[[11, 12, 13], [21, 22, 23]], prefix="test_range_get_cell"
+        )
+
+        book: Book = self._engine.open_book(path)
+        sheet: Sheet = book.get_sheets()[0]
+        r = sheet.get_range("B1:D2")
+
+        self.assertEqual(r.get_cell(2, 1).get_address(), "$B$2")
+        self.assertEqual(r.get_cell(2, 3).get_address(), "$D$2")
+
+    def test_get_form_doc(self) -> None:
+        path = self._get_book_path(
+            rows=[["head1", "head2"], [11, 12], [21, 22]],
+            prefix="test_get_form_doc",
+        )
+        factory: FormFactory = FormFactory()
+        factory.register_form(
+            "form1",
+            {
+                "item1": {
+                    "cls": FormItemTable,
+                    "kwargs": {
+                        "sheet_name": "Sheet",
+                        "range_arg": "A1:B3",
+                        "header_rows_count": 1,
+                        "header_path_list": [["head1"], ["head2"]],
+                    },
+                }
+            },
+        )
+
+        book: Book = self._engine.open_book(path)
+        form = factory.new_form("form1", book)
+        doc = form.get_form_doc()
+        book.close()
+
+        self.assertEqual(
+            doc["item1"]["result"],
+            [{"head1": 11, "head2": 12}, {"head1": 21, "head2": 22}],
+        )
+
+
+class TestEngineXlsxReaderParts(unittest.TestCase):
+    def setUp(self) -> None:
+        self._engine = EngineXlsxReader()
+
+    def test_book_iter_sheets(self) -> None:
+        book: Book = self._engine.open_book(_write_book(""))
+
+        self.assertEqual(
+            [sheet.get_name() for sheet in book.iter_sheets()],
+            ["Data", "Form"],
+        )
+        self.assertEqual(book.get_sheet("Form").get_max_row(), 1)
+        book.close()
+
+    def test_range_get_values(self) -> None:
+        book: Book = self._engine.open_book(
+            _write_book(
+                '<row r="2"><c r="B2" t="s"><v>1</v></c>'
+                '<c r="C2" t="s"><v>0</v></c></row>'
+                '<row r="4"><c r="B4" t="b"><v>1</v></c>'
+                '<c r="C4" t="inlineStr"><is><t>d</t></is></c></row>'
+                '<row r="5"><c r="B5"><v>1.5</v></c>'
+                '<c r="C5" t="str"><f>"e"</f><v>e</v></c></row>'
+            )
+        )
+        r = book.get_sheet("Data").get_range("B2:C5")
+
+        self.assertEqual(
+            r.get_values_or_none(),
+            [["bc", "a"], [None, None], [True, "d"], [1.5, None]],
+        )
+        self.assertEqual(r.get_cell(4, 2).get_formula(), '="e"')
+        book.close()
+
+    def test_range_get_values__stops_at_last_row(self) -> None:
+        # The broken row after the range is not parsed.
+        book: Book = self._engine.open_book(
+            _write_book(
+                '<row r="1"><c r="A1"><v>1</v></c></row>'
+                '<row r="2"><c r="A2" t="s"><v>99</v></c></row>'
+            )
+        )
+        sheet: Sheet = book.get_sheet("Data")
+
+        self.assertEqual(sheet.get_range("A1").get_values(), [[1]])
+        self.assertEqual(list(sheet.iter_values(1, 1, 1, 1)), [[1]])
+        book.close()
+
+    def test_sheet_get_range__open_ended(self) -> None:
+        book: Book = self._engine.open_book(
+            _write_book(
+                '<row r="1"><c r="A1"><v>1</v></c></row>'
+                '<row r="2"><c r="A2"><v>2</v></c></row>'
+                '<row r="3"><c r="A3"><v>3</v></c></row>'
+            )
+        )
+        sheet: Sheet = book.get_sheet("Data")
+
+        self.assertEqual(sheet.get_range("A2:A").get_values(), [[2], [3]])
+        self.assertEqual(sheet.get_range("A5:A").get_rows_count(), 1)
+        book.close()
+
+    def test_range_get_values__rows_without_references(self) -> None:
+        book: Book = self._engine.open_book(
+            _write_book(
+                "<row><c><v>1</v></c><c><v>2</v></c></row>"
+                "<row><c><v>3</v></c></row>"
+            )
+        )
+
+        self.assertEqual(
+            book.get_sheet("Data").get_range("A1:B2").get_values_or_none(),
+            [[1, 2], [3, None]],
+        )
+        book.close()
+
+    def test_sheet_get_cell__cached_rows(self) -> None:
+        book = self._engine.open_book(
+            _write_book(
+                '<row r="1"><c r="A1"><v>1</v></c><c r="C1"><v>3</v></c></row>'
+                '<row r="3"><c r="B3" t="s"><v>0</v></c></row>'
+            )
+        )
+        assert isinstance(book, BookXlsx)
+        sheet: Sheet = book.get_sheet("Data")
+        parts: List[str] = list()
+
+        def open_part(part: str) -> IO[bytes]:
+            parts.append(part)
+            return BookXlsx.open_part(book, part)
+
+        with unittest.mock.patch.object(book, "open_part", open_part):
+            values = [
+                sheet.get_cell(row, column).get_value()
+                for row, column in [(1, 1), (1, 3), (3, 2), (1, 1)]
+            ]
+            self.assertEqual(parts.count("xl/worksheets/sheet1.xml"), 1)
+            self.assertEqual(
+                sheet.get_cell(100, 1).get_number_format(), "General"
+            )
+            self.assertEqual(parts.count("xl/worksheets/sheet1.xml"), 2)
+
+        self.assertEqual(values, [1, 3, "a", 1])
+        book.close()
+
+    def test_cell_get_value__date(self) -> None:
+        data = '<row r="1"><c r="A1" s="1"><v>43832</v></c></row>'
+        book: Book = self._engine.open_book(_write_book(data))
+        book1904: Book = self._engine.open_book(_write_book(data, True))
+
+        self.assertEqual(
+            book.get_sheet("Data").get_cell(1, 1).get_value(),
+            datetime.datetime(2020, 1, 2),
+        )
+        self.assertEqual(
+            book1904.get_sheet("Data").get_cell(1, 1).get_value(),
+            datetime.datetime(2024, 1, 3),
+        )
+        book.close()
+        book1904.close()
+
+    def test_cell_get_number_format(self) -> None:
+        book: Book = self._engine.open_book(
+            _write_book(
+                '<row r="1"><c r="A1" s="2"><v>1</v></c>'
+                '<c r="B1"><v>1</v></c></row>'
+            )
+        )
+        r = book.get_sheet("Data").get_range("A1:C1")
+
+        self.assertEqual(r.get_cell(1, 1).get_number_format(), "0.000")
+        self.assertEqual(
+            r.dump()["number_format"], ["0.000", "General", "General"]
+        )
+        book.close()
+
+    def test_cell_get_formula__shared(self) -> None:
+        book: Book = self._engine.open_book(
+            _write_book(
+                '<row r="1"><c r="B1"><f t="shared" ref="B1:B3" si="0">'
+                "A1*2</f><v>2</v></c></row>"
+                '<row r="3"><c r="B3"><f t="shared" si="0"/><v>6</v></c>'
+                "</row>"
+            )
+        )
+        sheet: Sheet = book.get_sheet("Data")
+
+        self.assertEqual(sheet.get_range("B3").dump()["formula"], ["=A3*2"])
+        book.close()
+
+
+def load_tests(loader: TestLoader, tests: Any, patterns: Any) -> TestSuite:
+    return xlform.engine.test.load_tests(
+        loader, (TestEngineXlsxReader, TestEngineXlsxReaderParts)
+    )
+
+
+if __name__ == "__main__":
+    unittest.main()
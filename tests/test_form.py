@@ -4,6 +4,7 @@ from xlform.exception import XlFormNotImplementedException
 from xlform.form import Form
 from xlform.form import FormItem
 from xlform.form import ItemDoc
+from xlform.form import MetaLevel
 import unittest
 
 
@@ -21,6 +22,10 @@ class TestForm(unittest.TestCase):
         def _set_item_doc(self, item_doc: ItemDoc) -> None:
             raise XlFormNotImplementedException()
 
+    class FormItemMetaImpl(FormItemImpl):
+        def _get_item_doc(self) -> ItemDoc:
+            return ItemDoc(result=1, meta={"A1": {"value": 1}})
+
     def test_add_form_item(self) -> None:
         f = Form()
         form_item = self.FormItemImpl()
@@ -39,6 +44,16 @@ class TestForm(unittest.TestCase):
         self.assertTrue("result" in doc["item1"])
         self.assertEqual(doc["item1"]["result"], 1)
 
+    def test_get_form_doc__meta_level(self) -> None:
+        f = Form()
+        f.add_form_item("item1", self.FormItemMetaImpl())
+
+        self.assertEqual(
+            f.get_form_doc(MetaLevel.FULL)["item1"]["_meta"],
+            {"A1": {"value": 1}},
+        )
+        self.assertEqual(f.get_form_doc(MetaLevel.NONE)["item1"]["_meta"], {})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,137 @@
+from xlform.engine.base import Book
+from xlform.engine.base import Engine
+from xlform.engine.base import Sheet
+from xlform.engine.openpyxl import EngineOpenpyxl
+from xlform.form import FormFactory
+from xlform.form import FormItemCell
+from xlform.form import FormItemKeyValueCells
+from xlform.form import FormItemTable
+from xlform.form import MetaLevel
+import unittest
+
+
+class TestFormDiff(unittest.TestCase):
+    def setUp(self) -> None:
+        self._engine: Engine = EngineOpenpyxl()
+        self._book: Book = self._engine.new_book()
+        self._sheet: Sheet = self._book.get_sheets()[0]
+        self._sheet.get_range("A1:C4").set_values(
+            [
+                [1, "key", "value"],
+                ["head1", "head2", "head3"],
+                [11, 12, 13],
+                [21, 22, 23],
+            ]
+        )
+        self._factory: FormFactory = FormFactory()
+        self._factory.register_form(
+            "form1",
+            {
+                "item1": {
+                    "cls": FormItemCell,
+                    "kwargs": {"sheet_name": "Sheet1", "range_arg": "A1"},
+                },
+                "item2": {
+                    "cls": FormItemKeyValueCells,
+                    "kwargs": {
+                        "sheet_name": "Sheet1",
+                        "range_arg": "B1:C1",
+                        "header_value": "key",
+                    },
+                },
+                "item3": {
+                    "cls": FormItemTable,
+                    "kwargs": {
+                        "sheet_name": "Sheet1",
+                        "range_arg": "A2:C4",
+                        "header_rows_count": 1,
+                        "header_path_list": [["h1"], ["h2"], ["h3"]],
+                    },
+                },
+            },
+        )
+        self._form = self._factory.new_form("form1", self._book, compiled=True)
+
+    def test_set_form_doc_diff__no_changes(self) -> None:
+        doc = self._form.get_form_doc(MetaLevel.NONE)
+
+        self.assertEqual(self._form.set_form_doc_diff(doc), [])
+
+    def test_set_form_doc_diff(self) -> None:
+        doc = self._form.get_form_doc(MetaLevel.NONE)
+        doc["item1"]["result"] = 2
+        doc["item2"]["result"] = "value2"
+        doc["item3"]["result"][1]["h2"] = 0
+        change_list = self._form.set_form_doc_diff(doc)
+
+        self.assertEqual(
+            [change.get_dict() for change in change_list],
+            [
+                {
+                    "sheet_name": "Sheet1",
+                    "address": "A1",
+                    "old_value": 1,
+                    "new_value": 2,
+                },
+                {
+                    "sheet_name": "Sheet1",
+                    "address": "C1",
+                    "old_value": "value",
+                    "new_value": "value2",
+                },
+                {
+                    "sheet_name": "Sheet1",
+                    "address": "B4",
+                    "old_value": 22,
+                    "new_value": 0,
+                },
+            ],
+        )
+        self.assertEqual(
+            self._sheet.get_range("A1:C4").get_values(),
+            [
+                [2, "key", "value2"],
+                ["head1", "head2", "head3"],
+                [11, 12, 13],
+                [21, 0, 23],
+            ],
+        )
+        doc2 = self._form.get_form_doc(MetaLevel.NONE)
+        self.assertEqual(doc2["item3"]["result"][1]["h2"], 0)
+
+    def test_set_form_doc_diff__empty_cell(self) -> None:
+        item = FormItemCell(self._book, "Sheet1", "D3")
+        self._form.add_form_item("item4", item)
+        change_list = self._form.set_form_doc_diff({"item4": {"result": 1}})
+
+        self.assertEqual(len(change_list), 1)
+        self.assertEqual(change_list[0].get_address(), "D3")
+        self.assertIsNone(change_list[0].get_old_value())
+        self.assertEqual(self._sheet.get_cell(3, 4).get_value(), 1)
+
+    def test_set_form_doc_diff__twice(self) -> None:
+        doc = self._form.get_form_doc(MetaLevel.NONE)
+        doc["item1"]["result"] = 2
+        doc["item3"]["result"][1]["h2"] = 0
+
+        self.assertEqual(len(self._form.set_form_doc_diff(doc)), 2)
+        self.assertEqual(self._form.set_form_doc_diff(doc), [])
+        form = self._factory.new_form("form1", self._book, compiled=True)
+        self.assertEqual(form.set_form_doc_diff(doc), [])
+        self.assertEqual(form.get_form_doc(MetaLevel.NONE), doc)
+
+    def test_set_form_doc_diff__type_change(self) -> None:
+        doc = self._form.get_form_doc(MetaLevel.NONE)
+        doc["item1"]["result"] = True
+        doc["item3"]["result"][0]["h1"] = 11.0
+        change_list = self._form.set_form_doc_diff(doc)
+
+        self.assertEqual(
+            [change.get_address() for change in change_list], ["A1", "A3"]
+        )
+        self.assertIs(self._sheet.get_cell(1, 1).get_value(), True)
+        self.assertIsInstance(self._sheet.get_cell(3, 1).get_value(), float)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,7 @@ from xlform.form import Form
 from xlform.form import FormFactory
 from xlform.form import FormItem
 from xlform.form import FormItemCell
+from xlform.form import FormItemTable
 import unittest
 
 
@@ -52,6 +53,30 @@ class TestFormFactory(unittest.TestCase):
         form: Form = factory.new_form("form1", book1)
         self.assertIsInstance(form, Form)
 
+    def test_get_sheet_names(self) -> None:
+        factory: FormFactory = FormFactory()
+        factory.register_form(
+            "form1",
+            {
+                "item1": {
+                    "cls": FormItemCell,
+                    "kwargs": {"sheet_name": "Sheet2", "range_arg": "A1"},
+                },
+                "item2": {
+                    "cls": FormItemTable,
+                    "kwargs": {"sheet_name": "Sheet1", "range_arg": "A:B"},
+                },
+                "item3": {
+                    "cls": FormItemCell,
+                    "kwargs": {"sheet_name": "Sheet2", "range_arg": "B1"},
+                },
+            },
+        )
+
+        self.assertEqual(
+            factory.get_sheet_names("form1"), ["Sheet2", "Sheet1"]
+        )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,10 +1,17 @@
 from typing import List
 from xlform.engine.base import Book
+from xlform.engine.base import CellValue
 from xlform.engine.base import Engine
 from xlform.engine.base import Sheet
 from xlform.engine.openpyxl import EngineOpenpyxl
+from xlform.exception import XlFormArgumentException
+from xlform.exception import XlFormValidationException
 from xlform.form import FormFactory
 from xlform.form import FormItemTable
+from xlform.form import ItemDoc
+from xlform.form import MetaLevel
+from xlform.form import ResultFormat
+import array
 import unittest
 
 
@@ -149,6 +156,143 @@ class TestFormItemTable(unittest.TestCase):
             ],
         )
 
+    def test_get_form_doc__meta_level_none(self) -> None:
+        factory: FormFactory = FormFactory()
+        factory.register_form(
+            "form1",
+            {
+                "item1": {
+                    "cls": FormItemTable,
+                    "kwargs": {"sheet_name": "Sheet1", "range_arg": "A4:B5"},
+                }
+            },
+        )
+        form = factory.new_form("form1", self._book)
+        doc = form.get_form_doc(MetaLevel.NONE)
+
+        self.assertEqual(doc["item1"]["_meta"], {})
+        self.assertEqual(
+            doc["item1"]["result"],
+            [["data211", "data212"], ["data311", "data312"]],
+        )
+
+    def test_get_form_doc__meta_level_values(self) -> None:
+        factory: FormFactory = FormFactory()
+        factory.register_form(
+            "form1",
+            {
+                "item1": {
+                    "cls": FormItemTable,
+                    "kwargs": {
+                        "sheet_name": "Sheet1",
+                        "range_arg": "B4:C5",
+                        "header_rows_count": 1,
+                        "header_path_list": [["data212"], ["data221"]],
+                    },
+                }
+            },
+        )
+        form = factory.new_form("form1", self._book)
+        doc = form.get_form_doc(MetaLevel.VALUES)
+
+        self.assertEqual(
+            doc["item1"]["_meta"],
+            {"B5": {"value": "data312"}, "C5": {"value": "data321"}},
+        )
+
+    def test_get_form_doc__meta_level_full(self) -> None:
+        factory: FormFactory = FormFactory()
+        factory.register_form(
+            "form1",
+            {
+                "item1": {
+                    "cls": FormItemTable,
+                    "kwargs": {"sheet_name": "Sheet1", "range_arg": "C5"},
+                }
+            },
+        )
+        form = factory.new_form("form1", self._book)
+        doc = form.get_form_doc(MetaLevel.FULL)
+
+        self.assertEqual(
+            doc["item1"]["_meta"],
+            {
+                "C5": {
+                    "formula": "data321",
+                    "value": "data321",
+                    "number_format": "General",
+                }
+            },
+        )
+
+    def test_get_form_doc__result_format_columns(self) -> None:
+        table: List[List[CellValue]] = [[1, 1.5, "a"], [2, 3, 4]]
+        for row, values in enumerate(table, start=3):
+            for col, value in enumerate(values, start=5):
+                self._sheet.get_cell(row, col).set_value(value)
+
+        factory: FormFactory = FormFactory()
+        factory.register_form(
+            "form1",
+            {
+                "item1": {
+                    "cls": FormItemTable,
+                    "kwargs": {
+                        "sheet_name": "Sheet1",
+                        "range_arg": "E3:G4",
+                        "result_format": ResultFormat.COLUMNS,
+                    },
+                }
+            },
+        )
+        form = factory.new_form("form1", self._book)
+        doc = form.get_form_doc()
+        result = doc["item1"]["result"]
+
+        self.assertEqual(result[0], array.array("q", [1, 2]))
+        self.assertEqual(result[1], array.array("d", [1.5, 3]))
+        self.assertEqual(result[2], ["a", 4])
+
+    def test_get_form_doc__result_format_columns_header(self) -> None:
+        factory: FormFactory = FormFactory()
+        factory.register_form(
+            "form1",
+            {
+                "item1": {
+                    "cls": FormItemTable,
+                    "kwargs": {
+                        "sheet_name": "Sheet1",
+                        "range_arg": "A1:C5",
+                        "header_rows_count": 2,
+                        "header_path_list": [
+                            ["head1", "head11"],
+                            ["head1", "head12"],
+                            ["head2", "head21"],
+                        ],
+                        "result_format": ResultFormat.COLUMNS,
+                    },
+                }
+            },
+        )
+        form = factory.new_form("form1", self._book)
+        doc = form.get_form_doc()
+
+        self.assertEqual(
+            doc["item1"]["result"],
+            {
+                "head1": {
+                    "head11": ["data111", "data211", "data311"],
+                    "head12": ["data112", "data212", "data312"],
+                },
+                "head2": {"head21": ["data121", "data221", "data321"]},
+            },
+        )
+
+        doc["item1"]["result"]["head2"]["head21"][1] = "x"
+        form.set_form_doc(doc)
+
+        self.assertEqual(self._sheet.get_cell(4, 3).get_value(), "x")
+
     def test_set_form_doc(self) -> None:
         factory: FormFactory = FormFactory()
         factory.register_form(
@@ -167,6 +311,87 @@ class TestFormItemTable(unittest.TestCase):
 
         self.assertEqual(self._sheet.get_cell(4, 3).get_value(), "x")
 
+    def test_set_form_doc__header_rows_count_1(self) -> None:
+        factory: FormFactory = FormFactory()
+        factory.register_form(
+            "form1",
+            {
+                "item1": {
+                    "cls": FormItemTable,
+                    "kwargs": {
+                        "sheet_name": "Sheet1",
+                        "range_arg": "A4:C5",
+                        "header_rows_count": 1,
+                        "header_path_list": [
+                            ["data211"],
+                            ["data212"],
+                            ["data221"],
+                        ],
+                    },
+                }
+            },
+        )
+        form = factory.new_form("form1", self._book)
+        form.set_form_doc({"item1": {"result": [["x", "y", "z"]]}})
+
+        self.assertEqual(self._sheet.get_cell(4, 1).get_value(), "data211")
+        self.assertEqual(self._sheet.get_cell(5, 1).get_value(), "x")
+        self.assertEqual(self._sheet.get_cell(5, 3).get_value(), "z")
+
+    def test_set_form_doc__row_dict(self) -> None:
+        item = FormItemTable(
+            self._book,
+            "Sheet1",
+            "A2:C4",
+            header_rows_count=1,
+            header_path_list=[["h1", "h11"], ["h1", "h12"], ["h2"]],
+        )
+        item.set_item_doc(
+            ItemDoc(
+                [
+                    {"h1": {"h11": "a", "h12": "b"}, "h2": "c"},
+                    {"h2": "f", "h1": {"h12": "e", "h11": "d"}},
+                ]
+            )
+        )
+
+        self.assertEqual(
+            self._sheet.get_range("A3:C4").get_values(),
+            [["a", "b", "c"], ["d", "e", "f"]],
+        )
+
+    def test_set_form_doc__row_dict_missing_key(self) -> None:
+        item = FormItemTable(
+            self._book,
+            "Sheet1",
+            "A2:C3",
+            header_rows_count=1,
+            header_path_list=[["h1", "h11"], ["h1", "h12"], ["h2"]],
+        )
+
+        with self.assertRaises(XlFormValidationException):
+            item.set_item_doc(ItemDoc([{"h1": {"h11": "a"}, "h2": "c"}]))
+        with self.assertRaises(XlFormValidationException):
+            item.set_item_doc(ItemDoc([{"h1": "a", "h2": "c"}]))
+
+    def test_header_path_list__conflict(self) -> None:
+        with self.assertRaises(XlFormArgumentException):
+            FormItemTable(
+                self._book,
+                "Sheet1",
+                "A2:B3",
+                header_rows_count=1,
+                header_path_list=[["h1"], ["h1", "h11"]],
+            )
+        with self.assertRaises(XlFormArgumentException):
+            FormItemTable(
+                self._book,
+                "Sheet1",
+                "A2:B3",
+                header_rows_count=1,
+                header_path_list=[["h1"], ["h1"]],
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
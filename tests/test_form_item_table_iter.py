@@ -0,0 +1,254 @@
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import List
+from xlform.engine.base import Book
+from xlform.engine.base import Engine
+from xlform.engine.base import Sheet
+from xlform.engine.openpyxl import EngineOpenpyxl
+from xlform.engine.openpyxl import EngineOpenpyxlReadOnly
+from xlform.exception import XlFormArgumentException
+from xlform.exception import XlFormValidationException
+from xlform.form import FormFactory
+from xlform.form import FormItemTable
+from xlform.form import MetaLevel
+from xlform.form import TableEnd
+import tempfile
+import types
+import unittest
+import unittest.mock
+
+
+class TestFormItemTableIter(unittest.TestCase):
+    def setUp(self) -> None:
+        self._engine: Engine = EngineOpenpyxl()
+        self._book: Book = self._engine.new_book()
+        self._sheet: Sheet = self._book.get_sheets()[0]
+
+        table: List[List[Any]] = [
+            ["head1", "head1", "head2"],
+            ["head11", "head12", "head21"],
+            [111, 112, 121],
+            [211, 212, 221],
+            [311, 312, 321],
+        ]
+
+        for row, rows in enumerate(table, start=1):
+            for col, value in enumerate(rows, start=1):
+                self._sheet.get_cell(row, col).set_value(value)
+
+    def test_iter_rows__list(self) -> None:
+        item = FormItemTable(self._book, "Sheet1", "A3:C4")
+        rows = item.iter_rows()
+
+        self.assertIsInstance(rows, types.GeneratorType)
+        self.assertEqual(list(rows), [[111, 112, 121], [211, 212, 221]])
+
+    def test_iter_row_values(self) -> None:
+        item = FormItemTable(
+            self._book,
+            "Sheet1",
+            "A1:C5",
+            header_rows_count=2,
+            header_path_list=[
+                ["head1", "head11"],
+                ["head1", "head12"],
+                ["head2", "head21"],
+            ],
+        )
+
+        self.assertEqual(
+            list(item.iter_row_values()),
+            [[111, 112, 121], [211, 212, 221], [311, 312, 321]],
+        )
+
+    def test_get_column_paths(self) -> None:
+        item = FormItemTable(
+            self._book,
+            "Sheet1",
+            "A1:C5",
+            header_rows_count=2,
+            header_path_list=[
+                ["head1", "head11"],
+                ["head1", "head12"],
+                ["head2", "head21"],
+            ],
+        )
+
+        self.assertEqual(
+            item.get_column_paths(),
+            [["head1", "head11"], ["head1", "head12"], ["head2", "head21"]],
+        )
+
+    def test_get_column_paths__list(self) -> None:
+        item = FormItemTable(self._book, "Sheet1", "B3:C4")
+
+        self.assertEqual(item.get_column_paths(), [["B"], ["C"]])
+
+    def test_iter_rows__dict(self) -> None:
+        item = FormItemTable(
+            self._book,
+            "Sheet1",
+            "A1:C5",
+            header_rows_count=2,
+            header_path_list=[
+                ["head1", "head11"],
+                ["head1", "head12"],
+                ["head2", "head21"],
+            ],
+        )
+        rows = list(item.iter_rows())
+
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(
+            rows[0],
+            {
+                "head1": {"head11": 111, "head12": 112},
+                "head2": {"head21": 121},
+            },
+        )
+
+    def test_iter_rows__open_ended(self) -> None:
+        item = FormItemTable(
+            self._book, "Sheet1", "A3:C", table_end=TableEnd(max_rows_count=2)
+        )
+
+        self.assertEqual(
+            list(item.iter_rows()), [[111, 112, 121], [211, 212, 221]]
+        )
+
+    def test_iter_rows__empty_cell(self) -> None:
+        item = FormItemTable(self._book, "Sheet1", "A3:D5")
+
+        with self.assertRaises(XlFormValidationException):
+            list(item.iter_rows())
+
+    def test_iter_rows__after_last_row(self) -> None:
+        item = FormItemTable(self._book, "Sheet1", "A3:C6")
+        rows = item.iter_rows()
+
+        self.assertEqual(next(rows), [111, 112, 121])
+        with self.assertRaises(XlFormValidationException):
+            list(rows)
+
+    def test_iter_item_doc(self) -> None:
+        item = FormItemTable(self._book, "Sheet1", "B4:C5")
+        item_docs = list(item.iter_item_doc(MetaLevel.VALUES))
+
+        self.assertEqual(len(item_docs), 2)
+        self.assertEqual(item_docs[1].get_result(), [312, 321])
+        self.assertEqual(
+            item_docs[1].get_meta(),
+            {"B5": {"value": 312}, "C5": {"value": 321}},
+        )
+
+    def test_iter_item_doc__full(self) -> None:
+        item = FormItemTable(self._book, "Sheet1", "A3:C5")
+        item_doc = next(item.iter_item_doc())
+        meta = item.get_item_doc().get_meta()
+
+        self.assertEqual(
+            item_doc.get_meta(),
+            {k: v for k, v in meta.items() if k.endswith("3")},
+        )
+
+    def test_iter_item_doc__full_chunks(self) -> None:
+        for row in range(1, 201):
+            self._sheet.get_cell(row, 5).set_value(row)
+            self._sheet.get_cell(row, 6).set_value("r%d" % (row))
+        item = FormItemTable(self._book, "Sheet1", "E1:F200")
+        item_docs = list(item.iter_item_doc(MetaLevel.FULL))
+        meta = item.get_item_doc(MetaLevel.FULL).get_meta()
+
+        self.assertEqual(len(item_docs), 200)
+        self.assertEqual(item_docs[199].get_result(), [200, "r200"])
+        self.assertEqual(
+            item_docs[199].get_meta(),
+            {"E200": meta["E200"], "F200": meta["F200"]},
+        )
+        merged: Dict[str, Any] = dict()
+        for item_doc in item_docs:
+            merged.update(item_doc.get_meta())
+        self.assertEqual(merged, meta)
+
+    def test_iter_rows__validate_book(self) -> None:
+        class FormItemTableImpl(FormItemTable):
+            def _validate_book(self) -> None:
+                raise XlFormValidationException()
+
+        item = FormItemTableImpl(self._book, "Sheet1", "A3:C5")
+
+        with self.assertRaises(XlFormValidationException):
+            next(item.iter_rows())
+        with self.assertRaises(XlFormValidationException):
+            next(item.iter_item_doc())
+
+    def test_iter_rows__read_only(self) -> None:
+        tmp_dir_path = Path(tempfile.mkdtemp(prefix="test_iter_rows"))
+        path = tmp_dir_path / "book.xlsx"
+        self._book.save(path)
+
+        factory: FormFactory = FormFactory()
+        factory.register_form(
+            "form1",
+            {
+                "item1": {
+                    "cls": FormItemTable,
+                    "kwargs": {"sheet_name": "Sheet1", "range_arg": "A3:C"},
+                }
+            },
+        )
+        book: Book = EngineOpenpyxlReadOnly().open_book(path)
+        item = factory.new_form("form1", book).get_form_item("item1")
+        assert isinstance(item, FormItemTable)
+        rows = list(item.iter_rows())
+        book.close()
+
+        self.assertEqual(rows[-1], [311, 312, 321])
+        self.assertEqual(len(rows), 3)
+
+    def test_iter_rows__read_only_headers(self) -> None:
+        tmp_dir_path = Path(tempfile.mkdtemp(prefix="test_iter_rows"))
+        path = tmp_dir_path / "book.xlsx"
+        self._book.save(path)
+
+        book: Book = EngineOpenpyxlReadOnly().open_book(path)
+        sheet = book.get_sheet("Sheet1")
+        with unittest.mock.patch.object(
+            sheet, "get_range", wraps=sheet.get_range
+        ) as get_range:
+            item = FormItemTable(
+                book,
+                "Sheet1",
+                "A1:C5",
+                header_rows_count=2,
+                header_path_list=[
+                    ["head1", "head11"],
+                    ["head1", "head12"],
+                    ["head2", "head21"],
+                ],
+            )
+            rows = list(item.iter_rows())
+        book.close()
+
+        self.assertEqual(len(rows), 3)
+        self.assertEqual(
+            rows[-1],
+            {
+                "head1": {"head11": 311, "head12": 312},
+                "head2": {"head21": 321},
+            },
+        )
+        get_range.assert_called_once_with("A1:C2")
+
+    def test_get_form_item__not_found(self) -> None:
+        factory: FormFactory = FormFactory()
+        factory.register_form("form1", {})
+        form = factory.new_form("form1", self._book)
+
+        with self.assertRaises(XlFormArgumentException):
+            form.get_form_item("item1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+from typing import Any
+from typing import Dict
+from typing import List
+from xlform.engine.base import Book
+from xlform.engine.base import Engine
+from xlform.engine.base import Sheet
+from xlform.engine.openpyxl import EngineOpenpyxl
+from xlform.exception import XlFormArgumentException
+from xlform.exception import XlFormValidationException
+from xlform.form import Form
+from xlform.form import FormFactory
+from xlform.form import FormItemTable
+from xlform.form import TableEnd
+import unittest
+
+
+class TestFormItemTableOpenEnded(unittest.TestCase):
+    def setUp(self) -> None:
+        self._engine: Engine = EngineOpenpyxl()
+        self._book: Book = self._engine.new_book()
+        self._sheet: Sheet = self._book.get_sheets()[0]
+
+        table: List[List[Any]] = [
+            ["title"],
+            [],
+            ["head1", "head2"],
+            [11, 12],
+            [21, 22],
+            ["end", 32],
+            [41, 42],
+            [],
+            [61, 62],
+        ]
+
+        for row, rows in enumerate(table, start=1):
+            for col, value in enumerate(rows, start=1):
+                self._sheet.get_cell(row, col).set_value(value)
+
+    def _new_form(self, kwargs: Dict[str, Any]) -> Form:
+        factory: FormFactory = FormFactory()
+        kwargs.update({"sheet_name": "Sheet1", "range_arg": "A3:B"})
+        factory.register_form(
+            "form1", {"item1": {"cls": FormItemTable, "kwargs": kwargs}}
+        )
+        return factory.new_form("form1", self._book)
+
+    def test_get_form_doc__blank_row(self) -> None:
+        form = self._new_form(
+            {"header_rows_count": 1, "header_path_list": [["h1"], ["h2"]]}
+        )
+        doc = form.get_form_doc()
+
+        self.assertEqual(
+            doc["item1"]["result"],
+            [
+                {"h1": 11, "h2": 12},
+                {"h1": 21, "h2": 22},
+                {"h1": "end", "h2": 32},
+                {"h1": 41, "h2": 42},
+            ],
+        )
+        self.assertEqual(
+            sorted(doc["item1"]["_meta"].keys()),
+            ["A4", "A5", "A6", "A7", "B4", "B5", "B6", "B7"],
+        )
+
+    def test_get_form_doc__sentinel_value(self) -> None:
+        form = self._new_form({"table_end": TableEnd(sentinel_value="end")})
+        doc = form.get_form_doc()
+
+        self.assertEqual(
+            doc["item1"]["result"],
+            [["head1", "head2"], [11, 12], [21, 22]],
+        )
+
+    def test_get_form_doc__max_rows_count(self) -> None:
+        form = self._new_form(
+            {
+                "header_rows_count": 1,
+                "header_path_list": [["h1"], ["h2"]],
+                "table_end": TableEnd(blank_row=False, max_rows_count=3),
+            }
+        )
+        doc = form.get_form_doc()
+
+        self.assertEqual(len(doc["item1"]["result"]), 3)
+        self.assertEqual(doc["item1"]["result"][-1], {"h1": "end", "h2": 32})
+
+    def test_get_form_doc__no_rows(self) -> None:
+        self._sheet.get_cell(4, 1).set_value("end")
+        form = self._new_form(
+            {
+                "header_rows_count": 1,
+                "header_path_list": [["h1"], ["h2"]],
+                "table_end": TableEnd(sentinel_value="end"),
+            }
+        )
+
+        with self.assertRaises(XlFormValidationException):
+            form.get_form_doc()
+
+    def test_set_form_doc(self) -> None:
+        form = self._new_form({"table_end": TableEnd(max_rows_count=2)})
+        form.set_form_doc({"item1": {"result": [["a", "b"], ["c", "d"]]}})
+
+        self.assertEqual(
+            form.get_form_doc()["item1"]["result"], [["a", "b"], ["c", "d"]]
+        )
+
+    def test_table_end__bounded_range(self) -> None:
+        with self.assertRaises(XlFormArgumentException):
+            FormItemTable(self._book, "Sheet1", "A3:B5", table_end=TableEnd())
+
+    def test_table_end__max_rows_count(self) -> None:
+        with self.assertRaises(XlFormArgumentException):
+            TableEnd(max_rows_count=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
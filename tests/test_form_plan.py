@@ -0,0 +1,190 @@
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from xlform.engine.base import Book
+from xlform.engine.base import Engine
+from xlform.engine.base import Sheet
+from xlform.engine.openpyxl import EngineOpenpyxl
+from xlform.engine.openpyxl import EngineOpenpyxlReadOnly
+from xlform.exception import XlFormArgumentException
+from xlform.exception import XlFormException
+from xlform.form import FormFactory
+from xlform.form import FormItemCell
+from xlform.form import FormItemKeyValueCells
+from xlform.form import FormItemTable
+from xlform.form import FormSession
+from xlform.form import MetaLevel
+import tempfile
+import unittest
+
+FORM: Dict[str, Dict[str, Any]] = {
+    "item1": {
+        "cls": FormItemCell,
+        "kwargs": {"sheet_name": "Sheet1", "range_arg": "B2"},
+    },
+    "item2": {
+        "cls": FormItemKeyValueCells,
+        "kwargs": {
+            "sheet_name": "Sheet1",
+            "range_arg": "A4:B4",
+            "header_value": "key",
+        },
+    },
+    "item3": {
+        "cls": FormItemTable,
+        "kwargs": {
+            "sheet_name": "Sheet2",
+            "range_arg": "B1:C3",
+            "header_rows_count": 1,
+            "header_path_list": [["head1"], ["head2"]],
+        },
+    },
+    "item4": {
+        "cls": FormItemTable,
+        "kwargs": {"sheet_name": "Sheet2", "range_arg": "E:E"},
+    },
+}
+
+
+class TestFormPlan(unittest.TestCase):
+    def setUp(self) -> None:
+        self._engine: Engine = EngineOpenpyxl()
+        self._book: Book = self._engine.new_book()
+        sheet1: Sheet = self._book.get_sheets()[0]
+        sheet1.get_cell(2, 2).set_value(10)
+        sheet1.get_cell(4, 1).set_value("key")
+        sheet1.get_cell(4, 2).set_value("value")
+        self._book.add_sheet("Sheet2")
+        sheet2: Sheet = self._book.get_sheet("Sheet2")
+        sheet2.get_range("B1:C3").set_values(
+            [["head1", "head2"], [11, 12], [21, 22]]
+        )
+        sheet2.get_range("E1:E3").set_values([[1], [2], [3]])
+        self._factory = FormFactory()
+        self._factory.register_form("form1", FORM)
+
+    def test_compile_form(self) -> None:
+        plan = self._factory.compile_form("form1")
+
+        self.assertEqual(plan.get_sheet_names(), ["Sheet1", "Sheet2"])
+        self.assertEqual(plan.get_range_arg("Sheet1"), "A2:B4")
+        self.assertEqual(plan.get_range_arg("Sheet2"), "B1:C3")
+        self.assertIs(self._factory.compile_form("form1"), plan)
+
+    def test_compile_form__register_form(self) -> None:
+        plan = self._factory.compile_form("form1")
+        self._factory.register_form("form1", {"item1": FORM["item1"]})
+
+        plan2 = self._factory.compile_form("form1")
+        self.assertIsNot(plan2, plan)
+        self.assertEqual(plan2.get_sheet_names(), ["Sheet1"])
+        self.assertEqual(plan2.get_range_arg("Sheet1"), "B2:B2")
+
+    def test_new_form__compiled(self) -> None:
+        form = self._factory.new_form("form1", self._book)
+        expected = {
+            meta_level: form.get_form_doc(meta_level)
+            for meta_level in MetaLevel
+        }
+
+        factory = FormFactory()
+        factory.register_form("form1", FORM)
+        form = factory.new_form("form1", self._book, compiled=True)
+
+        for meta_level in MetaLevel:
+            with self.subTest(meta_level=meta_level):
+                self.assertEqual(
+                    form.get_form_doc(meta_level), expected[meta_level]
+                )
+
+    def test_new_form__compiled_served_from_grid(self) -> None:
+        form = self._factory.new_form("form1", self._book, compiled=True)
+        self._book.get_sheets()[0].get_cell(2, 2).set_value(20)
+
+        doc = form.get_form_doc(MetaLevel.VALUES)
+        self.assertEqual(doc["item1"]["result"], 10)
+        self.assertEqual(doc["item1"]["_meta"], {"B2": {"value": 10}})
+
+    def test_new_form__compiled_set_form_doc(self) -> None:
+        form = self._factory.new_form("form1", self._book, compiled=True)
+        form.set_form_doc({"item1": {"result": 20}})
+
+        self.assertEqual(form.get_form_doc()["item1"]["result"], 20)
+
+    def test_new_form__compiled_empty_cell(self) -> None:
+        self._factory.register_form(
+            "form1",
+            {
+                "item1": {
+                    "cls": FormItemCell,
+                    "kwargs": {"sheet_name": "Sheet1", "range_arg": "C3"},
+                },
+            },
+        )
+        form = self._factory.new_form("form1", self._book, compiled=True)
+
+        with self.assertRaises(XlFormException):
+            form.get_form_doc()
+
+    def test_new_form__compiled_read_only(self) -> None:
+        tmp_dir_path = Path(tempfile.mkdtemp(prefix="test_form_plan"))
+        path = tmp_dir_path / "book.xlsx"
+        self._book.save(path)
+
+        book: Book = EngineOpenpyxlReadOnly().open_book(path)
+        form = self._factory.new_form("form1", book, compiled=True)
+        doc = form.get_form_doc(MetaLevel.NONE)
+        book.close()
+
+        self.assertEqual(doc["item1"]["result"], 10)
+        self.assertEqual(doc["item2"]["result"], "value")
+        self.assertEqual(
+            doc["item3"]["result"],
+            [{"head1": 11, "head2": 12}, {"head1": 21, "head2": 22}],
+        )
+        self.assertEqual(doc["item4"]["result"], [[1], [2], [3]])
+
+
+class TestFormSessionPrefetch(unittest.TestCase):
+    def setUp(self) -> None:
+        self._engine: Engine = EngineOpenpyxl()
+        self._book: Book = self._engine.new_book()
+        self._sheet: Sheet = self._book.get_sheets()[0]
+        self._sheet.get_range("A1:C2").set_values([[11, 12, 13], [21, 22, 23]])
+
+    def test_prefetch(self) -> None:
+        session = FormSession(self._book)
+        session.prefetch("Sheet1", "A1:C3")
+        self._sheet.get_cell(2, 2).set_value(0)
+
+        r = session.get_range("Sheet1", "B2:C2")
+        self.assertEqual(r.get_values(), [[22, 23]])
+        self.assertEqual(r.get_cell(1, 1).get_value(), 22)
+        self.assertEqual(r.get_cell(1, 1).get_address(), "$B$2")
+
+    def test_prefetch__outside(self) -> None:
+        session = FormSession(self._book)
+        session.prefetch("Sheet1", "A1:B2")
+        self._sheet.get_cell(2, 2).set_value(0)
+
+        self.assertEqual(
+            session.get_range("Sheet1", "B2:C2").get_values(), [[0, 23]]
+        )
+
+    def test_prefetch__unbounded(self) -> None:
+        session = FormSession(self._book)
+
+        with self.assertRaises(XlFormArgumentException):
+            session.prefetch("Sheet1", "A:C")
+
+    def test_invalidate(self) -> None:
+        session = FormSession(self._book)
+        session.prefetch("Sheet1", "A1:C2")
+        self._sheet.get_cell(2, 2).set_value(0)
+        session.invalidate()
+
+        self.assertEqual(session.get_range("Sheet1", "B2").get_values(), [[0]])
+
+
+if __name__ == "__main__":
+    unittest.main()
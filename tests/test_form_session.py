@@ -0,0 +1,164 @@
+from xlform.engine.base import Book
+from xlform.engine.base import Engine
+from xlform.engine.base import Sheet
+from xlform.engine.openpyxl import EngineOpenpyxl
+from xlform.exception import XlFormArgumentException
+from xlform.form import FormFactory
+from xlform.form import FormItemCell
+from xlform.form import FormSession
+import unittest
+
+
+class TestFormSession(unittest.TestCase):
+    def setUp(self) -> None:
+        self._engine: Engine = EngineOpenpyxl()
+        self._book: Book = self._engine.new_book()
+        self._sheet: Sheet = self._book.get_sheets()[0]
+        self._sheet.get_cell(1, 1).set_value(10)
+
+    def test_get_range(self) -> None:
+        session = FormSession(self._book)
+        r = session.get_range("Sheet1", "A1:B2")
+
+        self.assertEqual(r.get_rows_count(), 2)
+        self.assertIs(session.get_range("Sheet1", "A1:B2"), r)
+
+    def test_invalidate(self) -> None:
+        session = FormSession(self._book)
+        r = session.get_range("Sheet1", "A1:B2")
+        session.invalidate()
+
+        self.assertIsNot(session.get_range("Sheet1", "A1:B2"), r)
+
+    def test_form_item__another_book(self) -> None:
+        book2: Book = self._engine.new_book()
+        session = FormSession(book2)
+
+        with self.assertRaises(XlFormArgumentException):
+            FormItemCell(self._book, "Sheet1", "A1", session=session)
+
+    def test_new_form__shared_session(self) -> None:
+        factory: FormFactory = FormFactory()
+        factory.register_form(
+            "form1",
+            {
+                "item1": {
+                    "cls": FormItemCell,
+                    "kwargs": {"sheet_name": "Sheet1", "range_arg": "A1"},
+                }
+            },
+        )
+        factory.new_form("form1", self._book)
+        session = factory.get_session(self._book)
+        r = session.get_range("Sheet1", "A1")
+        form = factory.new_form("form1", self._book)
+
+        self.assertIs(factory.get_session(self._book), session)
+        self.assertIs(session.get_range("Sheet1", "A1"), r)
+        self.assertEqual(form.get_form_doc()["item1"]["result"], 10)
+
+    def test_set_form_doc__invalidate(self) -> None:
+        factory: FormFactory = FormFactory()
+        factory.register_form(
+            "form1",
+            {
+                "item1": {
+                    "cls": FormItemCell,
+                    "kwargs": {"sheet_name": "Sheet1", "range_arg": "A1"},
+                }
+            },
+        )
+        form = factory.new_form("form1", self._book)
+        session = factory.get_session(self._book)
+        r = session.get_range("Sheet1", "A:A")
+        form.set_form_doc({"item1": {"result": 20}})
+
+        self.assertIsNot(session.get_range("Sheet1", "A:A"), r)
+        self.assertEqual(self._sheet.get_cell(1, 1).get_value(), 20)
+
+    def test_set_form_doc__keep_ranges(self) -> None:
+        factory: FormFactory = FormFactory()
+        factory.register_form(
+            "form1",
+            {
+                "item1": {
+                    "cls": FormItemCell,
+                    "kwargs": {"sheet_name": "Sheet1", "range_arg": "A1"},
+                }
+            },
+        )
+        form = factory.new_form("form1", self._book)
+        session = factory.get_session(self._book)
+        r = session.get_range("Sheet1", "B1:C2")
+        form.set_form_doc({"item1": {"result": 20}})
+
+        self.assertIs(session.get_range("Sheet1", "B1:C2"), r)
+        self.assertEqual(form.get_form_doc()["item1"]["result"], 20)
+
+    def test_set_form_doc__compiled(self) -> None:
+        self._sheet.get_cell(2, 1).set_value(30)
+        factory: FormFactory = FormFactory()
+        factory.register_form(
+            "form1",
+            {
+                "item1": {
+                    "cls": FormItemCell,
+                    "kwargs": {"sheet_name": "Sheet1", "range_arg": "A1"},
+                },
+                "item2": {
+                    "cls": FormItemCell,
+                    "kwargs": {"sheet_name": "Sheet1", "range_arg": "A2"},
+                },
+            },
+        )
+        form = factory.new_form("form1", self._book, compiled=True)
+        form.set_form_doc({"item1": {"result": 20}, "item2": {"result": 30}})
+        doc = factory.new_form("form1", self._book).get_form_doc()
+
+        self.assertEqual(doc["item1"]["result"], 20)
+        self.assertEqual(doc["item2"]["result"], 30)
+
+    def test_new_form__compiled_twice(self) -> None:
+        factory: FormFactory = FormFactory()
+        factory.register_form(
+            "form1",
+            {
+                "item1": {
+                    "cls": FormItemCell,
+                    "kwargs": {"sheet_name": "Sheet1", "range_arg": "A1"},
+                },
+            },
+        )
+        for _ in range(3):
+            form = factory.new_form("form1", self._book, compiled=True)
+        session = factory.get_session(self._book)
+        form.set_form_doc({"item1": {"result": 20}})
+        factory.new_form("form1", self._book, compiled=True)
+
+        self.assertEqual(len(session._grid_dic["Sheet1"]), 1)
+        self.assertEqual(form.get_form_doc()["item1"]["result"], 20)
+
+    def test_new_form__item_without_session(self) -> None:
+        class FormItemCellImpl(FormItemCell):
+            def __init__(
+                self, book: Book, sheet_name: str, range_arg: str
+            ) -> None:
+                super().__init__(book, sheet_name, range_arg)
+
+        factory: FormFactory = FormFactory()
+        factory.register_form(
+            "form1",
+            {
+                "item1": {
+                    "cls": FormItemCellImpl,
+                    "kwargs": {"sheet_name": "Sheet1", "range_arg": "A1"},
+                }
+            },
+        )
+        form = factory.new_form("form1", self._book)
+
+        self.assertEqual(form.get_form_doc()["item1"]["result"], 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
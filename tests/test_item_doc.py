@@ -15,6 +15,23 @@ class TestItemDoc(unittest.TestCase):
         item_doc = ItemDoc(meta={"x": 1}, result=1)
         self.assertEqual(item_doc.get_dict(), {"_meta": {"x": 1}, "result": 1})
 
+    def test_get_result__copy(self) -> None:
+        result = [[1, 2]]
+        item_doc = ItemDoc(result=result)
+        self.assertEqual(item_doc.get_result(), result)
+        self.assertIsNot(item_doc.get_result(), result)
+
+    def test_get_result__frozen(self) -> None:
+        result = [[1, 2]]
+        item_doc = ItemDoc(result=result, frozen=True)
+        self.assertTrue(item_doc.is_frozen())
+        self.assertIs(item_doc.get_result(), result)
+
+    def test_get_meta__frozen(self) -> None:
+        meta = {"x": 1}
+        item_doc = ItemDoc(meta=meta, result=1, frozen=True)
+        self.assertIs(item_doc.get_meta(), meta)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,127 @@
+from typing import List
+from xlform.engine.base import Engine
+from xlform.engine.openpyxl import EngineOpenpyxl
+from xlform.form import FormFactory
+from xlform.form import FormItemCell
+from xlform.form import FormItemTable
+from xlform.form import MetaLevel
+from xlform.trace import AggregateTracer
+from xlform.trace import CELLS_READ
+from xlform.trace import CELLS_WRITTEN
+from xlform.trace import NULL_TRACER
+from xlform.trace import WRAPPERS
+import unittest
+
+
+class TestAggregateTracer(unittest.TestCase):
+    def setUp(self) -> None:
+        self._times: List[float] = [0.0, 1.0, 1.5, 3.0]
+        self._tracer = AggregateTracer(clock=lambda: self._times.pop(0))
+
+    def test_span(self) -> None:
+        with self._tracer.span("a"):
+            self._tracer.count("x")
+            with self._tracer.span("b"):
+                self._tracer.count("x", 2)
+                self._tracer.count("y")
+
+        self.assertEqual(
+            self._tracer.get_span_dic(),
+            {("a",): (1, 3.0), ("a", "b"): (1, 0.5)},
+        )
+        self.assertEqual(self._tracer.get_counter_dic(), {"x": 3, "y": 1})
+        self.assertEqual(
+            self._tracer.get_counter_dic(("a", "b")), {"x": 2, "y": 1}
+        )
+
+    def test_span__exception(self) -> None:
+        with self.assertRaises(ValueError):
+            with self._tracer.span("a"):
+                raise ValueError()
+        with self._tracer.span("b"):
+            pass
+
+        self.assertEqual(
+            set(self._tracer.get_span_dic().keys()), {("a",), ("b",)}
+        )
+
+    def test_report(self) -> None:
+        with self._tracer.span("a"):
+            with self._tracer.span("b"):
+                self._tracer.count("x", 2)
+
+        lines = self._tracer.report().splitlines()
+        self.assertEqual(len(lines), 4)
+        self.assertTrue(lines[1].startswith("a "))
+        self.assertIn("2500.000 ms", lines[1])
+        self.assertTrue(lines[2].startswith("  b "))
+        self.assertTrue(lines[2].endswith("x=2"))
+        self.assertEqual(lines[3], "total: x=2")
+
+    def test_reset(self) -> None:
+        with self._tracer.span("a"):
+            self._tracer.count("x")
+        self._tracer.reset()
+
+        self.assertEqual(self._tracer.get_span_dic(), {})
+        self.assertEqual(self._tracer.get_counter_dic(), {})
+
+
+class TestTraceForm(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tracer = AggregateTracer()
+        self._engine: Engine = EngineOpenpyxl(tracer=self._tracer)
+        self._book = self._engine.new_book()
+        self._book.get_sheet("Sheet1").get_range("A1:B3").set_values(
+            [[1, 2], ["h1", "h2"], [11, 12]]
+        )
+        self._factory = FormFactory()
+        self._factory.register_form(
+            "form1",
+            {
+                "item1": {
+                    "cls": FormItemCell,
+                    "kwargs": {"sheet_name": "Sheet1", "range_arg": "A1"},
+                },
+                "item2": {
+                    "cls": FormItemTable,
+                    "kwargs": {
+                        "sheet_name": "Sheet1",
+                        "range_arg": "A2:B3",
+                        "header_rows_count": 1,
+                        "header_path_list": [["h1"], ["h2"]],
+                    },
+                },
+            },
+        )
+
+    def test_default(self) -> None:
+        self.assertIs(EngineOpenpyxl().get_tracer(), NULL_TRACER)
+        self.assertIs(EngineOpenpyxl().new_book().get_tracer(), NULL_TRACER)
+
+    def test_get_form_doc(self) -> None:
+        form = self._factory.new_form("form1", self._book)
+        self._tracer.reset()
+        form.get_form_doc(MetaLevel.FULL)
+
+        span_dic = self._tracer.get_span_dic()
+        self.assertIn(("item:item1", "get_item_doc", "dump"), span_dic)
+        self.assertIn(("item:item2", "get_item_doc", "dump"), span_dic)
+        self.assertIn(("item:item2", "deepcopy"), span_dic)
+        self.assertEqual(
+            self._tracer.get_counter_dic(("item:item2",))[CELLS_READ], 6
+        )
+        self.assertGreater(self._tracer.get_counter_dic()[WRAPPERS], 0)
+
+    def test_set_form_doc(self) -> None:
+        form = self._factory.new_form("form1", self._book)
+        self._tracer.reset()
+        form.set_form_doc({"item1": {"result": 3}})
+
+        self.assertIn(
+            ("item:item1", "set_item_doc"), self._tracer.get_span_dic()
+        )
+        self.assertEqual(self._tracer.get_counter_dic()[CELLS_WRITTEN], 1)
+
+    def test_new_book(self) -> None:
+        self.assertIn(("new_book",), self._tracer.get_span_dic())
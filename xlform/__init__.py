@@ -1,6 +1,9 @@
 from typing import Any
 from typing import Dict
+from typing import List
 from xlform.engine.base import Cell
+from xlform.engine.base import CellAttribute
+from xlform.engine.base import Range
 from xlform.exception import XlFormArgumentException
 from xlform.exception import XlFormException
 
@@ -12,21 +15,31 @@ def cell_dump(cell: Cell) -> Dict[str, Any]:
         raise XlFormArgumentException()
 
     addr: str = cell.get_address(column_absolute=False, row_absolute=False)
+    attributes = cell.get_attributes()
     value: Dict[str, Any] = dict()
-    try:
-        value["formula"] = cell.get_formula()
-    except XlFormException:
-        pass
-    try:
-        value["value"] = cell.get_value()
-    except XlFormException:
-        pass
-    try:
-        value["number_format"] = cell.get_number_format()
-    except XlFormException:
-        pass
-    try:
-        value["text"] = cell.get_text()
-    except XlFormException:
-        pass
+    for attribute in CellAttribute:
+        if attribute not in attributes:
+            continue
+        try:
+            value[attribute.value] = cell.get_attribute(attribute)
+        except XlFormException:
+            pass
     return {addr: value}
+
+
+def dump_range(range_: Range, row: int = 1) -> Dict[str, List[Any]]:
+    """Dump attributes of the cells of a range
+
+    See Range.dump for the format.
+
+    Args:
+        range_ (Range): Range
+        row (int, optional): Index of the first row starting from 1
+
+    Returns:
+        Dict[str, List[Any]]: Lists of the addresses and the attributes
+    """
+    if not isinstance(range_, Range):
+        raise XlFormArgumentException()
+
+    return range_.dump(row)
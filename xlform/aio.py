@@ -0,0 +1,139 @@
+from concurrent.futures import Executor
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Optional
+from xlform.batch import extract_form_doc
+from xlform.cache import FormDocCache
+from xlform.engine.base import AsyncRunner
+from xlform.engine.base import Book
+from xlform.engine.base import BookSource
+from xlform.engine.base import BookTarget
+from xlform.engine.base import Engine
+from xlform.exception import XlFormArgumentException
+from xlform.form import Form
+from xlform.form import FormFactory
+from xlform.form import MetaLevel
+
+
+class AsyncEngine(object):
+    """asyncio front-end of an engine
+
+    The blocking calls run in the executor, at most max_concurrency at a
+    time in each event loop. The books opened by the engine, and their
+    forms, run save_async and get_form_doc_async under the same limit.
+    Books stay in this process, so open_book, save_book and
+    get_form_doc need an executor running in this process, like a
+    ThreadPoolExecutor. extract_form_doc also works with a
+    ProcessPoolExecutor, since it opens and closes the book in the worker.
+    """
+
+    def __init__(
+        self,
+        engine: Engine,
+        executor: Optional[Executor] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> None:
+        """asyncio front-end of an engine
+
+        Args:
+            engine (Engine): Engine
+            executor (Optional[Executor]): Executor, the default executor
+            of the event loop by default
+            max_concurrency (Optional[int]): Maximum number of the calls
+            running at a time, unlimited by default
+        """
+        self._engine = engine
+        self._runner = AsyncRunner(executor, max_concurrency)
+
+    def _check_in_process(self) -> None:
+        if isinstance(self._runner.get_executor(), ProcessPoolExecutor):
+            raise XlFormArgumentException(
+                "Books can't be sent to worker processes."
+            )
+
+    async def new_book(self) -> Book:
+        """New book
+
+        Returns:
+            Book: Book
+        """
+        self._check_in_process()
+        book = await self._runner.run(self._engine.new_book)
+        book.set_async_runner(self._runner)
+        return book
+
+    async def open_book(
+        self, path: BookSource, sheets: Optional[Iterable[str]] = None
+    ) -> Book:
+        """Open book
+
+        Args:
+            path (BookSource): File path, buffer or seekable binary file
+            sheets (Optional[Iterable[str]]): Names of the sheets to load,
+            all sheets by default
+
+        Returns:
+            Book: Book
+        """
+        self._check_in_process()
+        book = await self._runner.run(self._engine.open_book, path, sheets)
+        book.set_async_runner(self._runner)
+        return book
+
+    async def save_book(self, book: Book, path: BookTarget) -> None:
+        """Save book
+
+        Args:
+            book (Book): Book
+            path (BookTarget): File path or writable binary file
+        """
+        self._check_in_process()
+        await self._runner.run(book.save, path)
+
+    async def get_form_doc(
+        self, form: Form, meta_level: MetaLevel = MetaLevel.FULL
+    ) -> Dict[str, Any]:
+        """Get form document from book
+
+        Args:
+            form (Form): Form
+            meta_level (MetaLevel, optional): Level of the meta data
+
+        Returns:
+            Dict[str, Any]: Item documents by the form item names
+        """
+        self._check_in_process()
+        return await self._runner.run(form.get_form_doc, meta_level)
+
+    async def extract_form_doc(
+        self,
+        factory: FormFactory,
+        name: str,
+        path: Path,
+        meta_level: MetaLevel = MetaLevel.FULL,
+        cache: Optional[FormDocCache] = None,
+    ) -> Dict[str, Any]:
+        """Open a book, get the form document and close the book
+
+        Args:
+            factory (FormFactory): Factory with the form registered
+            name (str): Form name
+            path (Path): File path
+            meta_level (MetaLevel, optional): Level of the meta data
+            cache (Optional[FormDocCache]): Cache of the form documents
+
+        Returns:
+            Dict[str, Any]: Form document
+        """
+        return await self._runner.run(
+            extract_form_doc,
+            factory,
+            name,
+            path,
+            self._engine,
+            meta_level,
+            cache,
+        )
@@ -0,0 +1,236 @@
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import IO
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Union
+from xlform.engine.base import CellValue
+from xlform.exception import XlFormArgumentException
+from xlform.exception import XlFormRuntimeException
+from xlform.exception import XlFormValidationException
+from xlform.form import FormItemTable
+import importlib
+import itertools
+
+DEFAULT_BATCH_ROWS_COUNT = 65536
+
+ArrowSink = Union[Path, IO[bytes]]
+
+
+def _import(name: str) -> Any:
+    # pyarrow is an optional dependency.
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        raise XlFormRuntimeException(
+            "pyarrow is required to export tables: pip install xlform[arrow]"
+        )
+
+
+def _get_sink(sink: ArrowSink) -> Union[str, IO[bytes]]:
+    return str(sink) if isinstance(sink, Path) else sink
+
+
+def _new_column_tree(paths: List[List[str]]) -> Dict[str, Any]:
+    # The leaves are the column indexes, and the nodes are the dicts of the
+    # next keys of the header paths.
+    tree: Dict[str, Any] = dict()
+    for index, path in enumerate(paths):
+        node = tree
+        for key in path[:-1]:
+            node = node.setdefault(key, dict())
+            if not isinstance(node, dict):
+                raise XlFormArgumentException(
+                    "Conflicting header path: %s" % (path)
+                )
+        if path[-1] in node:
+            raise XlFormArgumentException(
+                "Conflicting header path: %s" % (path)
+            )
+        node[path[-1]] = index
+    return tree
+
+
+class TableExporter(object):
+    def __init__(
+        self,
+        item: FormItemTable,
+        batch_rows_count: int = DEFAULT_BATCH_ROWS_COUNT,
+        nested: bool = False,
+        separator: str = ".",
+        column_types: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Exporter of the rows of a table item to Apache Arrow
+
+        The rows are read and converted batch by batch, and are never
+        built as the dicts of the header paths. The columns are the header
+        paths joined with the separator, or the struct columns of the
+        nested header paths. The tables without header paths have the
+        columns named by the column letters.
+
+        The types of the columns are inferred from the first batch unless
+        given, and the columns of the later batches are cast to them. Since
+        the types can't change once the first batch is written, the values
+        which the cast would change, like 2.5 in an integer column, raise
+        XlFormValidationException; give the types of such columns in
+        column_types.
+
+        Args:
+            item (FormItemTable): Table item
+            batch_rows_count (int, optional): Rows count of a batch
+            nested (bool, optional): Map the nested header paths to the
+            struct columns
+            separator (str, optional): Separator of the flattened header
+            paths
+            column_types (Optional[Dict[str, Any]], optional): pyarrow types
+            by the flattened header paths
+        """
+        if batch_rows_count < 1:
+            raise XlFormArgumentException("batch_rows_count < 1")
+        self._pa = _import("pyarrow")
+        self._item = item
+        self._batch_rows_count = batch_rows_count
+        self._nested = nested
+        self._separator = separator
+        self._column_types = dict() if column_types is None else column_types
+
+    def _get_names(self, paths: List[List[str]]) -> List[str]:
+        names: List[str] = list()
+        for path in paths:
+            if len(path) == 0:
+                raise XlFormArgumentException("Empty header path")
+            names.append(self._separator.join(path))
+        if len(set(names)) != len(names):
+            raise XlFormArgumentException("Duplicated column names")
+        return names
+
+    def _new_array(
+        self, name: str, column: List[CellValue], type_: Optional[Any]
+    ) -> Any:
+        # pa.array(column, type=type_) would truncate the floats converted
+        # to integers, so the inferred array is cast safely instead.
+        pa = self._pa
+        try:
+            array = pa.array(column)
+            if type_ is not None and array.type != type_:
+                array = array.cast(type_, safe=True)
+        except (pa.ArrowException, OverflowError) as e:
+            raise XlFormValidationException("Column %s: %s" % (name, e))
+        return array
+
+    def _nest(
+        self, tree: Dict[str, Any], arrays: List[Any]
+    ) -> Tuple[List[Any], List[str]]:
+        children: List[Any] = list()
+        for node in tree.values():
+            if isinstance(node, dict):
+                sub_arrays, sub_names = self._nest(node, arrays)
+                children.append(
+                    self._pa.StructArray.from_arrays(
+                        sub_arrays, names=sub_names
+                    )
+                )
+            else:
+                children.append(arrays[node])
+        return children, list(tree.keys())
+
+    def _new_batch(
+        self,
+        names: List[str],
+        tree: Optional[Dict[str, Any]],
+        arrays: List[Any],
+    ) -> Any:
+        pa = self._pa
+        if tree is None:
+            return pa.RecordBatch.from_arrays(arrays, names=names)
+        arrays, top_names = self._nest(tree, arrays)
+        return pa.RecordBatch.from_arrays(arrays, names=top_names)
+
+    def _new_empty_batch(self) -> Any:
+        # The columns of a table without rows have the declared types, or
+        # the null type since there are no values to infer the types from.
+        pa = self._pa
+        paths = self._item.get_column_paths()
+        names = self._get_names(paths)
+        tree = _new_column_tree(paths) if self._nested else None
+        arrays = [
+            pa.array(list(), type=self._column_types.get(name, pa.null()))
+            for name in names
+        ]
+        return self._new_batch(names, tree, arrays)
+
+    def iter_record_batches(self) -> Iterator[Any]:
+        """Iterate the record batches of the rows
+
+        Returns:
+            Iterator[pyarrow.RecordBatch]: Record batches
+        """
+        paths = self._item.get_column_paths()
+        names = self._get_names(paths)
+        tree = _new_column_tree(paths) if self._nested else None
+
+        rows = self._item.iter_row_values()
+        types = [self._column_types.get(name) for name in names]
+        while True:
+            chunk = list(itertools.islice(rows, self._batch_rows_count))
+            if len(chunk) == 0:
+                return
+            columns = [list(column) for column in zip(*chunk)]
+            arrays = [
+                self._new_array(name, column, type_)
+                for name, column, type_ in zip(names, columns, types)
+            ]
+            types = [array.type for array in arrays]
+            yield self._new_batch(names, tree, arrays)
+            if len(chunk) < self._batch_rows_count:
+                return
+
+    def write_ipc(self, sink: ArrowSink) -> int:
+        """Write the rows in the Arrow IPC stream format
+
+        A table without rows is written as an empty stream of its schema.
+
+        Args:
+            sink (ArrowSink): File path or binary stream
+
+        Returns:
+            int: Rows count
+        """
+        batches = self.iter_record_batches()
+        first = next(batches, None)
+        if first is None:
+            first = self._new_empty_batch()
+        rows_count = 0
+        with self._pa.ipc.new_stream(_get_sink(sink), first.schema) as writer:
+            for batch in itertools.chain([first], batches):
+                writer.write_batch(batch)
+                rows_count += batch.num_rows
+        return rows_count
+
+    def write_parquet(self, sink: ArrowSink, **kwargs: Any) -> int:
+        """Write the rows in the Parquet format
+
+        Each batch is written as a row group. A table without rows is
+        written as an empty file of its schema.
+
+        Args:
+            sink (ArrowSink): File path or binary stream
+            **kwargs: Arguments of pyarrow.parquet.ParquetWriter
+
+        Returns:
+            int: Rows count
+        """
+        pq = _import("pyarrow.parquet")
+        batches = self.iter_record_batches()
+        first = next(batches, None)
+        if first is None:
+            first = self._new_empty_batch()
+        rows_count = 0
+        with pq.ParquetWriter(_get_sink(sink), first.schema, **kwargs) as w:
+            for batch in itertools.chain([first], batches):
+                w.write_batch(batch)
+                rows_count += batch.num_rows
+        return rows_count
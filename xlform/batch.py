@@ -0,0 +1,307 @@
+from argparse import ArgumentParser
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from xlform.cache import DEFAULT_MAX_SIZE
+from xlform.cache import DirectoryDocStore
+from xlform.cache import FormDocCache
+from xlform.cache import hash_file
+from xlform.engine.base import Engine
+from xlform.engine.openpyxl import EngineOpenpyxlReadOnly
+from xlform.exception import XlFormArgumentException
+from xlform.form import FormFactory
+from xlform.form import MetaLevel
+import glob
+import importlib
+import json
+import queue
+import sys
+
+
+def extract_form_doc(
+    factory: FormFactory,
+    name: str,
+    path: Path,
+    engine: Engine,
+    meta_level: MetaLevel = MetaLevel.FULL,
+    cache: Optional[FormDocCache] = None,
+) -> Dict[str, Any]:
+    """Open a book and get the form document
+
+    If the document is cached, the book is not opened. Only the sheets
+    read by the form are loaded.
+
+    Args:
+        factory (FormFactory): Factory with the form registered
+        name (str): Form name
+        path (Path): File path
+        engine (Engine): Engine to open the book with
+        meta_level (MetaLevel, optional): Level of the meta data
+        cache (Optional[FormDocCache]): Cache of the form documents
+
+    Returns:
+        Dict[str, Any]: Form document
+    """
+    key: Optional[str] = None
+    if cache is not None:
+        key = cache.get_key(factory, name, path, engine, meta_level)
+        doc = cache.get(key)
+        if doc is not None:
+            return doc
+
+    book = engine.open_book(path, sheets=factory.get_sheet_names(name))
+    try:
+        form = factory.new_form(name, book, compiled=True)
+        doc = form.get_form_doc(meta_level)
+    finally:
+        book.close()
+
+    if cache is not None and key is not None:
+        cache.put(key, doc)
+    return doc
+
+
+def _extract_result(
+    factory: FormFactory,
+    name: str,
+    path: Path,
+    engine: Engine,
+    meta_level: MetaLevel,
+) -> Dict[str, Any]:
+    # Runs in the worker processes. Exceptions are returned as the results
+    # so that a failure doesn't depend on the exception being picklable.
+    try:
+        doc = extract_form_doc(factory, name, path, engine, meta_level)
+    except Exception as e:
+        return {"path": str(path), "error": _format_error(e)}
+    return {"path": str(path), "doc": doc}
+
+
+def _format_error(e: BaseException) -> str:
+    return "%s: %s" % (type(e).__name__, e)
+
+
+def iter_paths(patterns: Iterable[str]) -> Iterator[Path]:
+    """Expand glob patterns to file paths
+
+    Patterns without matches are yielded as paths, so that they are
+    reported as failures.
+
+    Args:
+        patterns (Iterable[str]): File paths or glob patterns
+
+    Returns:
+        Iterator[Path]: File paths
+    """
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern, recursive=True))
+        if len(matches) == 0:
+            yield Path(pattern)
+        for match in matches:
+            yield Path(match)
+
+
+def run_batch(
+    factory: FormFactory,
+    name: str,
+    paths: Iterable[Path],
+    engine: Optional[Engine] = None,
+    workers: Optional[int] = None,
+    meta_level: MetaLevel = MetaLevel.FULL,
+    cache: Optional[FormDocCache] = None,
+) -> Iterator[Dict[str, Any]]:
+    """Get the form documents of many books in worker processes
+
+    The results are yielded in the order of completion. Each result has
+    "path" and either "doc" with the form document or "error" with the
+    reason of the failure. A failure doesn't abort the other books.
+
+    The factory and the engine are pickled to the worker processes.
+
+    With the cache, the books are hashed in the worker processes. The
+    cached documents are yielded without opening the books, and the books
+    with the same bytes are processed only once. A failure to read the
+    cache is the error of the book, and the documents which fail to be
+    cached are yielded with "cache_error".
+
+    Args:
+        factory (FormFactory): Factory with the form registered
+        name (str): Form name
+        paths (Iterable[Path]): File paths
+        engine (Optional[Engine]): Engine, EngineOpenpyxlReadOnly by default
+        workers (Optional[int]): Number of the worker processes, the number
+        of the processors by default
+        meta_level (MetaLevel, optional): Level of the meta data
+        cache (Optional[FormDocCache]): Cache of the form documents
+
+    Returns:
+        Iterator[Dict[str, Any]]: Results
+    """
+    if engine is None:
+        engine = EngineOpenpyxlReadOnly()
+    if workers is not None and workers < 1:
+        raise XlFormArgumentException("workers must be positive.")
+
+    # The paths of the books by the keys, or by the paths without cache,
+    # and the errors by the keys of the failed books.
+    path_list_dic: Dict[str, List[Path]] = dict()
+    error_dic: Dict[str, Dict[str, Any]] = dict()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # The futures of the hashes have the paths, and the futures of the
+        # documents have the keys. The done futures are queued.
+        hash_future_dic: Dict["Future[Any]", Path] = dict()
+        doc_future_dic: Dict["Future[Any]", str] = dict()
+        done_queue: "queue.Queue[Future[Any]]" = queue.Queue()
+
+        def submit(key: str, path: Path) -> None:
+            path_list_dic[key] = [path]
+            future = executor.submit(
+                _extract_result, factory, name, path, engine, meta_level
+            )
+            doc_future_dic[future] = key
+            future.add_done_callback(done_queue.put)
+
+        for path in paths:
+            if cache is not None:
+                hash_future = executor.submit(hash_file, path)
+                hash_future_dic[hash_future] = path
+                hash_future.add_done_callback(done_queue.put)
+            elif str(path) in path_list_dic:
+                path_list_dic[str(path)].append(path)
+            else:
+                submit(str(path), path)
+
+        while len(hash_future_dic) > 0 or len(doc_future_dic) > 0:
+            future = done_queue.get()
+            if future in hash_future_dic:
+                path = hash_future_dic.pop(future)
+                assert cache is not None
+                exc = future.exception()
+                if exc is not None:
+                    yield {"path": str(path), "error": _format_error(exc)}
+                    continue
+                try:
+                    key = cache.get_hash_key(
+                        factory, name, future.result(), engine, meta_level
+                    )
+                    if key in path_list_dic:
+                        path_list_dic[key].append(path)
+                        continue
+                    if key in error_dic:
+                        yield dict(error_dic[key], path=str(path))
+                        continue
+                    doc = cache.get(key)
+                except Exception as e:
+                    yield {"path": str(path), "error": _format_error(e)}
+                    continue
+                if doc is not None:
+                    yield {"path": str(path), "doc": doc}
+                    continue
+                submit(key, path)
+                continue
+
+            key = doc_future_dic.pop(future)
+            exc = future.exception()
+            result: Dict[str, Any]
+            if exc is not None:
+                result = {"error": _format_error(exc)}
+            else:
+                result = future.result()
+            if cache is not None:
+                if "doc" in result:
+                    try:
+                        cache.put(key, result["doc"])
+                    except Exception as e:
+                        result = dict(result, cache_error=_format_error(e))
+                else:
+                    error_dic[key] = result
+            for path in path_list_dic.pop(key):
+                yield dict(result, path=str(path))
+
+
+def load_factory(spec: str) -> FormFactory:
+    """Load a factory from a 'module:attribute' spec
+
+    Args:
+        spec (str): Spec like 'package.module:factory'
+
+    Returns:
+        FormFactory: Factory
+    """
+    module_name, sep, attribute = spec.partition(":")
+    if sep == "" or module_name == "" or attribute == "":
+        raise XlFormArgumentException("Illegal spec: %s" % (spec))
+    factory = getattr(importlib.import_module(module_name), attribute)
+    if not isinstance(factory, FormFactory):
+        raise XlFormArgumentException("Not a FormFactory: %s" % (spec))
+    return factory
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point
+
+    Writes a JSON line for each book, and returns 1 if any book fails.
+    """
+    parser = ArgumentParser(
+        description="Get the form documents of books as JSON Lines."
+    )
+    parser.add_argument("factory", help="FormFactory like 'module:factory'")
+    parser.add_argument("form", help="Form name")
+    parser.add_argument("paths", nargs="+", help="File paths or globs")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument(
+        "--meta-level",
+        choices=[meta_level.value for meta_level in MetaLevel],
+        default=MetaLevel.FULL.value,
+    )
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument(
+        "--cache-dir", type=Path, default=None, help="Cache directory"
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_MAX_SIZE,
+        help="Max size of the cache in bytes",
+    )
+    args = parser.parse_args(argv)
+
+    factory = load_factory(args.factory)
+    cache: Optional[FormDocCache] = None
+    if args.cache_dir is not None:
+        store = DirectoryDocStore(args.cache_dir, args.cache_size)
+        cache = FormDocCache(store)
+    results = run_batch(
+        factory,
+        args.form,
+        iter_paths(args.paths),
+        workers=args.workers,
+        meta_level=MetaLevel(args.meta_level),
+        cache=cache,
+    )
+
+    exit_code = 0
+    output = sys.stdout
+    if args.output is not None:
+        output = args.output.open("w", encoding="utf-8")
+    try:
+        for result in results:
+            if "error" in result:
+                exit_code = 1
+            output.write(json.dumps(result, default=str) + "\n")
+            output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,445 @@
+from pathlib import Path
+from typing import Any
+from typing import Dict
+from typing import Optional
+from xlform.engine.base import Engine
+from xlform.exception import XlFormArgumentException
+from xlform.exception import XlFormNotImplementedException
+from xlform.exception import XlFormRuntimeException
+from xlform.form import FormFactory
+from xlform.form import MetaLevel
+from xlform import __version__
+import array
+import base64
+import datetime
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+
+_CHUNK_SIZE = 1024 * 1024
+
+# The key of the tagged values in the JSON of the documents.
+_TAG = "__xlform__"
+
+DEFAULT_MAX_SIZE = 1024 * 1024 * 1024
+
+
+def hash_file(path: Path) -> str:
+    """Get the hash of the bytes of the file
+
+    Args:
+        path (Path): File path
+
+    Returns:
+        str: Hex digest of SHA-256
+    """
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _encode_value(value: Any) -> Any:
+    # Values which JSON doesn't have are tagged dicts.
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, list):
+        return [_encode_value(v) for v in value]
+    if isinstance(value, dict):
+        if _TAG not in value and all(isinstance(k, str) for k in value):
+            return {k: _encode_value(v) for k, v in value.items()}
+        items = [
+            [_encode_value(k), _encode_value(v)] for k, v in value.items()
+        ]
+        return {_TAG: "dict", "items": items}
+    if isinstance(value, tuple):
+        return {_TAG: "tuple", "items": [_encode_value(v) for v in value]}
+    if isinstance(value, datetime.datetime):
+        return {
+            _TAG: "datetime",
+            "value": [
+                value.year,
+                value.month,
+                value.day,
+                value.hour,
+                value.minute,
+                value.second,
+                value.microsecond,
+            ],
+            "utcoffset": _encode_utcoffset(value.utcoffset()),
+        }
+    if isinstance(value, datetime.date):
+        return {_TAG: "date", "value": [value.year, value.month, value.day]}
+    if isinstance(value, datetime.time):
+        return {
+            _TAG: "time",
+            "value": [
+                value.hour,
+                value.minute,
+                value.second,
+                value.microsecond,
+            ],
+            "utcoffset": _encode_utcoffset(value.utcoffset()),
+        }
+    if isinstance(value, datetime.timedelta):
+        return {
+            _TAG: "timedelta",
+            "value": [value.days, value.seconds, value.microseconds],
+        }
+    if isinstance(value, bytes):
+        return {_TAG: "bytes", "value": base64.b64encode(value).decode()}
+    if isinstance(value, array.array):
+        return {
+            _TAG: "array",
+            "typecode": value.typecode,
+            "items": value.tolist(),
+        }
+    raise XlFormArgumentException(
+        "The value can't be cached: %s" % (type(value).__name__)
+    )
+
+
+def _encode_utcoffset(offset: Optional[datetime.timedelta]) -> Any:
+    return None if offset is None else _encode_value(offset)
+
+
+def _decode_tzinfo(offset: Any) -> Optional[datetime.tzinfo]:
+    if offset is None:
+        return None
+    return datetime.timezone(offset)
+
+
+def _decode_value(value: Dict[str, Any]) -> Any:
+    # The nested values are decoded before the values containing them.
+    tag = value.get(_TAG)
+    if tag is None:
+        return value
+    if tag == "dict":
+        return {k: v for k, v in value["items"]}
+    if tag == "tuple":
+        return tuple(value["items"])
+    if tag == "datetime":
+        return datetime.datetime(*value["value"]).replace(
+            tzinfo=_decode_tzinfo(value["utcoffset"])
+        )
+    if tag == "date":
+        return datetime.date(*value["value"])
+    if tag == "time":
+        return datetime.time(*value["value"]).replace(
+            tzinfo=_decode_tzinfo(value["utcoffset"])
+        )
+    if tag == "timedelta":
+        return datetime.timedelta(*value["value"])
+    if tag == "bytes":
+        return base64.b64decode(value["value"])
+    if tag == "array":
+        return array.array(value["typecode"], value["items"])
+    raise XlFormRuntimeException("Unknown tag in the cache: %s" % (tag))
+
+
+def encode_doc(doc: Dict[str, Any]) -> bytes:
+    """Encode a document to JSON
+
+    The values which JSON doesn't have, like datetime, are tagged.
+
+    Args:
+        doc (Dict[str, Any]): Document
+
+    Returns:
+        bytes: UTF-8 JSON
+    """
+    return json.dumps(_encode_value(doc), separators=(",", ":")).encode(
+        "utf-8"
+    )
+
+
+def decode_doc(data: bytes) -> Dict[str, Any]:
+    """Decode a document encoded by encode_doc
+
+    Args:
+        data (bytes): UTF-8 JSON
+
+    Returns:
+        Dict[str, Any]: Document
+    """
+    doc = json.loads(data.decode("utf-8"), object_hook=_decode_value)
+    if not isinstance(doc, dict):
+        raise XlFormRuntimeException("The cached document is not a dict.")
+    return doc
+
+
+class DocStore(object):
+    """Store of the form documents by the keys
+
+    The stores evict the least recently used documents when the total size
+    exceeds the max size.
+    """
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the document
+
+        Args:
+            key (str): Key
+
+        Returns:
+            Optional[Dict[str, Any]]: Document, None if not stored
+        """
+        raise XlFormNotImplementedException()
+
+    def put(self, key: str, doc: Dict[str, Any]) -> None:
+        """Store the document
+
+        Args:
+            key (str): Key
+            doc (Dict[str, Any]): Document
+        """
+        raise XlFormNotImplementedException()
+
+    def get_size(self) -> int:
+        """Get the total size of the stored documents in bytes"""
+        raise XlFormNotImplementedException()
+
+
+def _check_max_size(max_size: int) -> None:
+    if max_size < 0:
+        raise XlFormArgumentException("max_size must not be negative.")
+
+
+class DirectoryDocStore(DocStore):
+    def __init__(self, path: Path, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """Store of the documents in the files of a directory
+
+        The modification times of the files are the last used times.
+
+        Args:
+            path (Path): Directory path, created if not exists
+            max_size (int, optional): Max total size in bytes
+        """
+        _check_max_size(max_size)
+        self._path = path
+        self._max_size = max_size
+        self._path.mkdir(parents=True, exist_ok=True)
+
+    def _get_file_path(self, key: str) -> Path:
+        return self._path / ("%s.json" % (key))
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        file_path = self._get_file_path(key)
+        try:
+            data = file_path.read_bytes()
+            os.utime(str(file_path))
+        except FileNotFoundError:
+            return None  # Not stored, or evicted by another process.
+        return decode_doc(data)
+
+    def put(self, key: str, doc: Dict[str, Any]) -> None:
+        data = encode_doc(doc)
+        fd, tmp_path = tempfile.mkstemp(dir=str(self._path), suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, str(self._get_file_path(key)))
+        self._evict()
+
+    def get_size(self) -> int:
+        return sum(p.stat().st_size for p in self._path.glob("*.json"))
+
+    def _evict(self) -> None:
+        entries = list()
+        for file_path in self._path.glob("*.json"):
+            try:
+                stat = file_path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, file_path))
+        size = sum(entry[1] for entry in entries)
+        for _, file_size, file_path in sorted(entries):
+            if size <= self._max_size:
+                break
+            try:
+                file_path.unlink()
+            except FileNotFoundError:
+                pass
+            size -= file_size
+
+
+class SqliteDocStore(DocStore):
+    def __init__(self, path: Path, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        """Store of the documents in a SQLite database
+
+        The store can be pickled to other processes, which open the
+        database again.
+
+        Args:
+            path (Path): Database file path
+            max_size (int, optional): Max total size in bytes
+        """
+        _check_max_size(max_size)
+        self._path = path
+        self._max_size = max_size
+        self._open()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {"path": self._path, "max_size": self._max_size}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self._path = state["path"]
+        self._max_size = state["max_size"]
+        self._open()
+
+    def _open(self) -> None:
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            str(self._path), check_same_thread=False, isolation_level=None
+        )
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS docs ("
+            "key TEXT PRIMARY KEY, doc BLOB NOT NULL, "
+            "size INTEGER NOT NULL, used REAL NOT NULL)"
+        )
+        self._connection.execute(
+            "CREATE INDEX IF NOT EXISTS docs_used ON docs (used)"
+        )
+
+    def close(self) -> None:
+        """Close the database"""
+        self._connection.close()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT doc FROM docs WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._connection.execute(
+                "UPDATE docs SET used = ? WHERE key = ?", (time.time(), key)
+            )
+        return decode_doc(row[0])
+
+    def put(self, key: str, doc: Dict[str, Any]) -> None:
+        data = encode_doc(doc)
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO docs (key, doc, size, used) "
+                "VALUES (?, ?, ?, ?)",
+                (key, data, len(data), time.time()),
+            )
+            self._evict()
+
+    def get_size(self) -> int:
+        with self._lock:
+            return self._get_size()
+
+    def _get_size(self) -> int:
+        row = self._connection.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM docs"
+        ).fetchone()
+        return int(row[0])
+
+    def _evict(self) -> None:
+        size = self._get_size()
+        if size <= self._max_size:
+            return
+        rows = self._connection.execute(
+            "SELECT key, size FROM docs ORDER BY used"
+        ).fetchall()
+        for key, doc_size in rows:
+            if size <= self._max_size:
+                break
+            self._connection.execute("DELETE FROM docs WHERE key = ?", (key,))
+            size -= doc_size
+
+
+class FormDocCache(object):
+    def __init__(self, store: DocStore) -> None:
+        """Cache of the form documents by the contents of the books
+
+        The key of a document is the hash of the bytes of the book, the
+        fingerprint of the registration of the form, the engine, the level
+        of the meta data and the version of xlform.
+
+        Args:
+            store (DocStore): Store
+        """
+        self._store = store
+
+    def get_key(
+        self,
+        factory: FormFactory,
+        name: str,
+        path: Path,
+        engine: Engine,
+        meta_level: MetaLevel = MetaLevel.FULL,
+    ) -> str:
+        """Get the key of the form document of the book
+
+        Args:
+            factory (FormFactory): Factory with the form registered
+            name (str): Form name
+            path (Path): File path
+            engine (Engine): Engine to open the book with
+            meta_level (MetaLevel, optional): Level of the meta data
+
+        Returns:
+            str: Key
+        """
+        return self.get_hash_key(
+            factory, name, hash_file(path), engine, meta_level
+        )
+
+    def get_hash_key(
+        self,
+        factory: FormFactory,
+        name: str,
+        file_hash: str,
+        engine: Engine,
+        meta_level: MetaLevel = MetaLevel.FULL,
+    ) -> str:
+        """Get the key of the form document of the book with the hash
+
+        Args:
+            factory (FormFactory): Factory with the form registered
+            name (str): Form name
+            file_hash (str): Hash of the book by hash_file()
+            engine (Engine): Engine to open the book with
+            meta_level (MetaLevel, optional): Level of the meta data
+
+        Returns:
+            str: Key
+        """
+        engine_cls = type(engine)
+        data = json.dumps(
+            [
+                file_hash,
+                factory.get_fingerprint(name),
+                "%s.%s" % (engine_cls.__module__, engine_cls.__qualname__),
+                meta_level.value,
+                __version__,
+            ]
+        )
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Get the form document
+
+        Args:
+            key (str): Key
+
+        Returns:
+            Optional[Dict[str, Any]]: Form document, None if not cached
+        """
+        return self._store.get(key)
+
+    def put(self, key: str, doc: Dict[str, Any]) -> None:
+        """Cache the form document
+
+        Args:
+            key (str): Key
+            doc (Dict[str, Any]): Form document
+        """
+        self._store.put(key, doc)
@@ -1,15 +1,40 @@
+from concurrent.futures import Executor
 from pathlib import Path
 from typing_extensions import final
 from typing import Any
+from typing import Callable
+from typing import cast
+from typing import Dict
+from typing import FrozenSet
+from typing import IO
+from typing import Iterable
 from typing import Iterator
 from typing import List
+from typing import MutableMapping
+from typing import Optional
+from typing import Tuple
+from typing import TypeVar
 from typing import Union
+from xlform.exception import XlFormArgumentException
+from xlform.exception import XlFormException
 from xlform.exception import XlFormInternalException
 from xlform.exception import XlFormNotImplementedException
+from xlform.exception import XlFormRuntimeException
+from xlform.trace import EXCEPTIONS
+from xlform.trace import NULL_TRACER
+from xlform.trace import Tracer
+import asyncio
 import datetime
+import enum
+import io
+import mmap
+import re
+import weakref
 
 CellValue = Union[str, float, int, datetime.datetime]
 
+T = TypeVar("T")
+
 
 def safe_cast_cell_value(value: Any) -> CellValue:
     if isinstance(value, str):
@@ -23,7 +48,140 @@ def safe_cast_cell_value(value: Any) -> CellValue:
     raise XlFormInternalException("Unknown type: %s" % (type(value)))
 
 
+class CellAttribute(enum.Enum):
+    """Attribute of cells
+
+    The values are the keys of the attributes in dumps.
+    """
+
+    FORMULA = "formula"
+    VALUE = "value"
+    NUMBER_FORMAT = "number_format"
+    TEXT = "text"
+
+
+def get_column_letter(column: int) -> str:
+    """Get column letter
+
+    Args:
+        column (int): Column index starting from 1
+
+    Returns:
+        str: Column letter like 'A', 'AB'
+    """
+    if column < 1:
+        raise XlFormArgumentException()
+    letters = ""
+    while column > 0:
+        column, remainder = divmod(column - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+
+_RANGE_PART_RE = re.compile(r"^\$?([A-Za-z]{0,3})\$?([0-9]*)$")
+
+RangeBoundaries = Tuple[
+    Optional[int], Optional[int], Optional[int], Optional[int]
+]
+
+
+def get_column_index(column_letter: str) -> int:
+    """Get column index
+
+    Args:
+        column_letter (str): Column letter like 'A', 'AB'
+
+    Returns:
+        int: Column index starting from 1
+    """
+    if len(column_letter) == 0 or not column_letter.isalpha():
+        raise XlFormArgumentException()
+    column = 0
+    for letter in column_letter.upper():
+        column = column * 26 + ord(letter) - ord("A") + 1
+    return column
+
+
+def _parse_range_part(part: str) -> Tuple[Optional[int], Optional[int]]:
+    m = _RANGE_PART_RE.match(part)
+    if m is None or part.strip("$") == "":
+        raise XlFormArgumentException("Illegal range: %s" % (part))
+    column_letter, row_digits = m.groups()
+    column = get_column_index(column_letter) if column_letter else None
+    row = int(row_digits) if row_digits else None
+    if row == 0:
+        raise XlFormArgumentException("Illegal range: %s" % (part))
+    return column, row
+
+
+def parse_range_arg(arg: str) -> RangeBoundaries:
+    """Parse range
+
+    The boundaries are None where the range is unbounded, like the rows of
+    'A:C', the columns of '1:3' and the last row of 'A3:C'.
+
+    Args:
+        arg (str): range like 'A1', 'A1:C3', 'A:C', '1:3', 'A3:C'
+
+    Returns:
+        RangeBoundaries: Min column, min row, max column and max row
+    """
+    parts = arg.split(":")
+    if len(parts) == 1:
+        column, row = _parse_range_part(parts[0])
+        if column is None or row is None:
+            raise XlFormArgumentException("Illegal range: %s" % (arg))
+        return column, row, column, row
+    if len(parts) != 2:
+        raise XlFormArgumentException("Illegal range: %s" % (arg))
+    min_column, min_row = _parse_range_part(parts[0])
+    max_column, max_row = _parse_range_part(parts[1])
+    if (min_column is None) != (max_column is None):
+        raise XlFormArgumentException("Illegal range: %s" % (arg))
+    if min_row is None and max_row is not None:
+        raise XlFormArgumentException("Illegal range: %s" % (arg))
+    if min_column is not None and max_column is not None:
+        if min_column > max_column:
+            raise XlFormArgumentException("Illegal range: %s" % (arg))
+    if min_row is not None and max_row is not None:
+        if min_row > max_row:
+            raise XlFormArgumentException("Illegal range: %s" % (arg))
+    return min_column, min_row, max_column, max_row
+
+
+def format_range_arg(
+    min_column: int, min_row: int, max_column: int, max_row: int
+) -> str:
+    """Format range
+
+    Args:
+        min_column (int): Min column index starting from 1
+        min_row (int): Min row index starting from 1
+        max_column (int): Max column index starting from 1
+        max_row (int): Max row index starting from 1
+
+    Returns:
+        str: range like 'A1:C3'
+    """
+    return "%s%d:%s%d" % (
+        get_column_letter(min_column),
+        min_row,
+        get_column_letter(max_column),
+        max_row,
+    )
+
+
 class Cell(object):
+    __slots__ = ()
+
+    def get_tracer(self) -> Tracer:
+        """Get the tracer of the engine
+
+        Returns:
+            Tracer: Tracer
+        """
+        return NULL_TRACER
+
     def get_row(self) -> int:
         """Get row number
 
@@ -80,6 +238,38 @@ class Cell(object):
         """
         raise XlFormNotImplementedException()
 
+    def get_attributes(self) -> FrozenSet[CellAttribute]:
+        """Get attributes that can be read from the cell
+
+        Engines should override this so that the getters of the returned
+        attributes don't raise exceptions. By default all attributes are
+        returned, and the getters may raise exceptions.
+
+        Returns:
+            FrozenSet[CellAttribute]: Attributes
+        """
+        return frozenset(CellAttribute)
+
+    @final
+    def get_attribute(self, attribute: CellAttribute) -> Any:
+        """Get attribute
+
+        Args:
+            attribute (CellAttribute): Attribute
+
+        Returns:
+            Any: Value of the attribute
+        """
+        if attribute == CellAttribute.FORMULA:
+            return self.get_formula()
+        if attribute == CellAttribute.VALUE:
+            return self.get_value()
+        if attribute == CellAttribute.NUMBER_FORMAT:
+            return self.get_number_format()
+        if attribute == CellAttribute.TEXT:
+            return self.get_text()
+        raise XlFormArgumentException()
+
     def get_address(
         self, column_absolute: bool = True, row_absolute: bool = True
     ) -> str:
@@ -104,6 +294,16 @@ class Cell(object):
 
 
 class Range(object):
+    __slots__ = ()
+
+    def get_tracer(self) -> Tracer:
+        """Get the tracer of the engine
+
+        Returns:
+            Tracer: Tracer
+        """
+        return NULL_TRACER
+
     def get_rows_count(self) -> int:
         """Get rows count
 
@@ -132,8 +332,145 @@ class Range(object):
         """
         raise XlFormNotImplementedException()
 
+    def get_values(self, row: int = 1) -> List[List[CellValue]]:
+        """Get values of the rows
+
+        Engines should override this to read the values without creating
+        a Cell for each cell.
+
+        Args:
+            row (int, optional): Index of the first row starting from 1
+
+        Returns:
+            List[List[CellValue]]: Values from the row to the last row
+        """
+        if row < 1:
+            raise XlFormArgumentException()
+        columns_count = self.get_columns_count()
+        return [
+            [
+                self.get_cell(row_index, col_index).get_value()
+                for col_index in range(1, columns_count + 1)
+            ]
+            for row_index in range(row, self.get_rows_count() + 1)
+        ]
+
+    def get_values_or_none(
+        self, row: int = 1
+    ) -> List[List[Optional[CellValue]]]:
+        """Get values of the rows, with None for the unreadable cells
+
+        Unlike get_values, no exception is raised for the cells whose values
+        can't be read, like empty cells.
+
+        Args:
+            row (int, optional): Index of the first row starting from 1
+
+        Returns:
+            List[List[Optional[CellValue]]]: Values from the row to the last
+            row
+        """
+        if row < 1:
+            raise XlFormArgumentException()
+        values: List[List[Optional[CellValue]]] = list()
+        for row_index in range(row, self.get_rows_count() + 1):
+            row_values: List[Optional[CellValue]] = list()
+            for col_index in range(1, self.get_columns_count() + 1):
+                cell = self.get_cell(row_index, col_index)
+                if CellAttribute.VALUE not in cell.get_attributes():
+                    row_values.append(None)
+                    continue
+                try:
+                    row_values.append(cell.get_value())
+                except XlFormException:
+                    self.get_tracer().count(EXCEPTIONS)
+                    row_values.append(None)
+            values.append(row_values)
+        return values
+
+    def set_values(self, values: List[List[CellValue]], row: int = 1) -> None:
+        """Set values of the rows
+
+        Engines should override this to write the values without creating
+        a Cell for each cell.
+
+        Args:
+            values (List[List[CellValue]]): Values of the rows
+            row (int, optional): Index of the first row starting from 1
+        """
+        check_range_values(self, values, row)
+        for row_index, row_values in enumerate(values, start=row):
+            for col_index, value in enumerate(row_values, start=1):
+                self.get_cell(row_index, col_index).set_value(value)
+
+    def dump(self, row: int = 1) -> Dict[str, List[Any]]:
+        """Dump attributes of the cells of the rows
+
+        The dump is columnar. "address" has the relative addresses of the
+        cells in row-major order, and each attribute has the values of the
+        cells in the same order. The value is None if the attribute can't
+        be read from the cell. The attributes not supported by the engine
+        may be omitted.
+
+        Engines should override this to dump the cells without creating a
+        Cell for each cell.
+
+        Args:
+            row (int, optional): Index of the first row starting from 1
+
+        Returns:
+            Dict[str, List[Any]]: Lists of the addresses and the attributes
+        """
+        if row < 1:
+            raise XlFormArgumentException()
+        dump: Dict[str, List[Any]] = {"address": list()}
+        for attribute in CellAttribute:
+            dump[attribute.value] = list()
+        for row_index in range(row, self.get_rows_count() + 1):
+            for col_index in range(1, self.get_columns_count() + 1):
+                cell = self.get_cell(row_index, col_index)
+                dump["address"].append(
+                    cell.get_address(column_absolute=False, row_absolute=False)
+                )
+                attributes = cell.get_attributes()
+                for attribute in CellAttribute:
+                    value = None
+                    if attribute in attributes:
+                        try:
+                            value = cell.get_attribute(attribute)
+                        except XlFormException:
+                            self.get_tracer().count(EXCEPTIONS)
+                    dump[attribute.value].append(value)
+        return dump
+
+
+def check_range_values(
+    range_: Range, values: List[List[CellValue]], row: int
+) -> None:
+    """Check that the values fit the rows of the range
+
+    Args:
+        range_ (Range): Range
+        values (List[List[CellValue]]): Values of the rows
+        row (int): Index of the first row starting from 1
+    """
+    if row < 1 or range_.get_rows_count() < row + len(values) - 1:
+        raise XlFormArgumentException()
+    columns_count = range_.get_columns_count()
+    for row_values in values:
+        if len(row_values) != columns_count:
+            raise XlFormArgumentException()
+
 
 class Sheet(object):
+    def get_tracer(self) -> Tracer:
+        """Get the tracer of the engine
+
+        Returns:
+            Tracer: Tracer
+        """
+        return NULL_TRACER
+
     def get_name(self) -> str:
         """Get sheet name
 
@@ -142,6 +479,15 @@ class Sheet(object):
         """
         raise XlFormNotImplementedException()
 
+    def is_loaded(self) -> bool:
+        """Whether the sheet is loaded
+
+        Returns:
+            bool: False if the sheet was not selected when the book was
+            opened
+        """
+        return True
+
     def get_range(self, arg: str) -> Range:
         """Get range
 
@@ -165,6 +511,54 @@ class Sheet(object):
         """
         raise XlFormNotImplementedException()
 
+    def get_max_row(self) -> int:
+        """Get the index of the last row with cells
+
+        Returns:
+            int: Row index starting from 1
+        """
+        raise XlFormNotImplementedException()
+
+    def iter_values(
+        self,
+        min_row: int,
+        min_column: int,
+        max_column: int,
+        max_row: Optional[int] = None,
+    ) -> Iterator[List[Optional[CellValue]]]:
+        """Iterate the values of the rows, with None for the unreadable cells
+
+        The rows are read as they are iterated, so that the iteration can
+        stop before the end of the sheet.
+
+        Args:
+            min_row (int): Index of the first row starting from 1
+            min_column (int): Index of the first column starting from 1
+            max_column (int): Index of the last column starting from 1
+            max_row (Optional[int]): Index of the last row starting from 1,
+            the last row of the sheet by default
+
+        Returns:
+            Iterator[List[Optional[CellValue]]]: Values of the rows
+        """
+        if min_row < 1 or min_column < 1 or max_column < min_column:
+            raise XlFormArgumentException()
+        if max_row is None:
+            max_row = self.get_max_row()
+        for row in range(min_row, max_row + 1):
+            row_values: List[Optional[CellValue]] = list()
+            for column in range(min_column, max_column + 1):
+                cell = self.get_cell(row, column)
+                if CellAttribute.VALUE not in cell.get_attributes():
+                    row_values.append(None)
+                    continue
+                try:
+                    row_values.append(cell.get_value())
+                except XlFormException:
+                    self.get_tracer().count(EXCEPTIONS)
+                    row_values.append(None)
+            yield row_values
+
     def protect(self) -> None:
         """Protect"""
         raise XlFormNotImplementedException()
@@ -178,15 +572,326 @@ class Sheet(object):
         raise XlFormNotImplementedException()
 
 
+class UnloadedSheet(Sheet):
+    """Sheet which was not selected when the book was opened
+
+    Only the name is available. The other methods raise
+    XlFormRuntimeException.
+    """
+
+    def __init__(self, name: str, tracer: Tracer = NULL_TRACER) -> None:
+        self._name = name
+        self._tracer = tracer
+
+    def _new_unloaded_exception(self) -> XlFormRuntimeException:
+        return XlFormRuntimeException("Sheet not loaded: %s" % (self._name))
+
+    def get_tracer(self) -> Tracer:
+        return self._tracer
+
+    def get_name(self) -> str:
+        return self._name
+
+    def is_loaded(self) -> bool:
+        return False
+
+    def get_range(self, arg: str) -> Range:
+        raise self._new_unloaded_exception()
+
+    def get_cell(self, row: int, column: int) -> Cell:
+        raise self._new_unloaded_exception()
+
+    def get_max_row(self) -> int:
+        raise self._new_unloaded_exception()
+
+    def iter_values(
+        self,
+        min_row: int,
+        min_column: int,
+        max_column: int,
+        max_row: Optional[int] = None,
+    ) -> Iterator[List[Optional[CellValue]]]:
+        raise self._new_unloaded_exception()
+
+    def protect(self) -> None:
+        raise self._new_unloaded_exception()
+
+    def unprotect(self) -> None:
+        raise self._new_unloaded_exception()
+
+    def calculate(self) -> None:
+        raise self._new_unloaded_exception()
+
+
+def get_loaded_sheet_names(
+    sheet_names: List[str], sheets: Optional[Iterable[str]]
+) -> FrozenSet[str]:
+    """Get the names of the sheets to load
+
+    Args:
+        sheet_names (List[str]): Names of the sheets of the book
+        sheets (Optional[Iterable[str]]): Names of the selected sheets, all
+        sheets if None
+
+    Returns:
+        FrozenSet[str]: Names of the sheets to load
+    """
+    if sheets is None:
+        return frozenset(sheet_names)
+    loaded = frozenset(sheets)
+    unknown = loaded - frozenset(sheet_names)
+    if len(unknown) > 0:
+        raise XlFormArgumentException(
+            "Sheet not found: %s" % (", ".join(sorted(unknown)))
+        )
+    return loaded
+
+
+# Sources to open books from.
+BookSource = Union[Path, bytes, bytearray, memoryview, mmap.mmap, IO[bytes]]
+
+# Targets to save books to.
+BookTarget = Union[Path, IO[bytes]]
+
+
+class BufferReader(io.RawIOBase):
+    """Seekable binary file over a buffer, without copying the buffer
+
+    Only the bytes read are copied. The buffer must not be modified while
+    the file is read.
+    """
+
+    def __init__(
+        self, buffer: Union[bytes, bytearray, memoryview, mmap.mmap]
+    ) -> None:
+        # The slices of bytes and mmap are bytes. An mmap is not exported
+        # to a memoryview, so that it can be closed before this file.
+        self._buffer: Union[bytes, memoryview, mmap.mmap]
+        if isinstance(buffer, (bytes, mmap.mmap)):
+            self._buffer = buffer
+        else:
+            self._buffer = memoryview(buffer).cast("B")
+        self._position = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        start = self._position
+        length = len(self._buffer)
+        end = length if size < 0 else min(start + size, length)
+        self._position = max(start, end)
+        data = self._buffer[start:end]
+        if isinstance(data, memoryview):
+            return data.tobytes()
+        return data
+
+    def readall(self) -> bytes:
+        return self.read()
+
+    def readinto(self, b: Any) -> int:
+        data = self.read(len(b))
+        b[: len(data)] = data
+        return len(data)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._buffer) + offset
+        else:
+            raise XlFormArgumentException("Illegal whence: %s" % (whence))
+        if position < 0:
+            raise XlFormArgumentException("Illegal offset: %s" % (offset))
+        self._position = position
+        return position
+
+    def tell(self) -> int:
+        return self._position
+
+    def close(self) -> None:
+        if not self.closed and isinstance(self._buffer, memoryview):
+            self._buffer.release()
+        super().close()
+
+
+def get_book_file(source: BookSource) -> Union[str, IO[bytes]]:
+    """Get the file name or the binary file to open a book from
+
+    The buffers are wrapped without copying, and the binary files are
+    returned as they are.
+
+    Args:
+        source (BookSource): File path, buffer or seekable binary file
+
+    Returns:
+        Union[str, IO[bytes]]: File name or binary file
+    """
+    if isinstance(source, Path):
+        return str(source.resolve())
+    if isinstance(source, (bytes, bytearray, memoryview, mmap.mmap)):
+        return cast(IO[bytes], BufferReader(source))
+    return source
+
+
+def get_book_target(target: BookTarget) -> Union[str, IO[bytes]]:
+    """Get the file name or the binary file to save a book to
+
+    Args:
+        target (BookTarget): File path or writable binary file
+
+    Returns:
+        Union[str, IO[bytes]]: File name or binary file
+    """
+    if isinstance(target, Path):
+        return str(target)
+    return target
+
+
+class AsyncRunner(object):
+    """Runner of blocking calls in an executor
+
+    At most max_concurrency calls run at a time. A semaphore is created
+    for each running event loop, since a semaphore can't be shared by the
+    event loops.
+    """
+
+    def __init__(
+        self,
+        executor: Optional[Executor] = None,
+        max_concurrency: Optional[int] = None,
+    ) -> None:
+        """Runner of blocking calls in an executor
+
+        Args:
+            executor (Optional[Executor]): Executor, the default executor
+            of the event loop by default
+            max_concurrency (Optional[int]): Maximum number of the calls
+            running at a time, unlimited by default
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise XlFormArgumentException("max_concurrency must be positive.")
+        self._executor = executor
+        self._max_concurrency = max_concurrency
+        self._semaphore_dic: MutableMapping[
+            asyncio.AbstractEventLoop, asyncio.Semaphore
+        ] = weakref.WeakKeyDictionary()
+
+    def get_executor(self) -> Optional[Executor]:
+        """Get the executor
+
+        Returns:
+            Optional[Executor]: Executor
+        """
+        return self._executor
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking call in the executor
+
+        Args:
+            func (Callable[..., T]): Function
+            *args: Arguments of the function
+
+        Returns:
+            T: Return value of the function
+        """
+        loop = asyncio.get_event_loop()
+        if self._max_concurrency is None:
+            return await loop.run_in_executor(self._executor, func, *args)
+        semaphore = self._semaphore_dic.get(loop)
+        if semaphore is None:
+            # Created in the running event loop, which it is bound to.
+            semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._semaphore_dic[loop] = semaphore
+        async with semaphore:
+            return await loop.run_in_executor(self._executor, func, *args)
+
+
 class Book(object):
-    def save(self, path: Path) -> None:
+    _async_runner: Optional[AsyncRunner] = None
+
+    def get_tracer(self) -> Tracer:
+        """Get the tracer of the engine
+
+        Returns:
+            Tracer: Tracer
+        """
+        return NULL_TRACER
+
+    @final
+    def get_async_runner(self) -> AsyncRunner:
+        """Get the runner of the blocking calls of the async methods
+
+        Returns:
+            AsyncRunner: Runner set to the book, or a runner in the default
+            executor
+        """
+        if self._async_runner is None:
+            return AsyncRunner()
+        return self._async_runner
+
+    @final
+    def set_async_runner(self, runner: AsyncRunner) -> None:
+        """Set the runner of the blocking calls of the async methods
+
+        Args:
+            runner (AsyncRunner): Runner
+        """
+        self._async_runner = runner
+
+    def get_cell_attributes(self) -> FrozenSet[CellAttribute]:
+        """Get attributes of cells supported by the engine of the book
+
+        Returns:
+            FrozenSet[CellAttribute]: Attributes
+        """
+        return frozenset(CellAttribute)
+
+    def save(self, path: BookTarget) -> None:
         """Save book
 
         Args:
-            path (Path): File path
+            path (BookTarget): File path or writable binary file
         """
         raise XlFormNotImplementedException()
 
+    @final
+    def save_bytes(self) -> bytes:
+        """Save book to bytes
+
+        Returns:
+            bytes: Content of the file
+        """
+        f = io.BytesIO()
+        self.save(f)
+        return f.getvalue()
+
+    @final
+    async def save_async(
+        self, path: BookTarget, executor: Optional[Executor] = None
+    ) -> None:
+        """Save book in an executor
+
+        The executor must run in this process, since the book can't be sent
+        to another process. Without the executor, the book is saved by the
+        runner of the book.
+
+        Args:
+            path (BookTarget): File path or writable binary file
+            executor (Optional[Executor]): Executor, the runner of the book
+            by default
+        """
+        if executor is None:
+            runner = self.get_async_runner()
+        else:
+            runner = AsyncRunner(executor)
+        await runner.run(self.save, path)
+
     def close(self) -> None:
         """Close book"""
         raise XlFormNotImplementedException()
@@ -208,6 +913,23 @@ class Book(object):
         """
         return list(self.iter_sheets())
 
+    def get_sheet(self, name: str) -> Sheet:
+        """Get sheet by name
+
+        Engines should override this to look up the sheet without creating
+        a Sheet for each sheet of the book.
+
+        Args:
+            name (str): Sheet name
+
+        Returns:
+            Sheet: Sheet
+        """
+        for sheet in self.iter_sheets():
+            if sheet.get_name() == name:
+                return sheet
+        raise XlFormArgumentException("Sheet not found: %s" % (name))
+
     def add_sheet(self, name: str) -> None:
         """Add sheet
 
@@ -218,6 +940,24 @@ class Book(object):
 
 
 class Engine(object):
+    _tracer: Tracer = NULL_TRACER
+
+    def get_tracer(self) -> Tracer:
+        """Get tracer
+
+        Returns:
+            Tracer: Tracer, the no-op tracer by default
+        """
+        return self._tracer
+
+    def set_tracer(self, tracer: Tracer) -> None:
+        """Set the tracer of the books opened after this
+
+        Args:
+            tracer (Tracer): Tracer
+        """
+        self._tracer = tracer
+
     def new_book(self) -> Book:
         """New book
 
@@ -226,11 +966,27 @@ class Engine(object):
         """
         raise XlFormNotImplementedException()
 
-    def open_book(self, path: Path) -> Book:
+    def get_cell_attributes(self) -> FrozenSet[CellAttribute]:
+        """Get attributes of cells supported by the engine
+
+        Returns:
+            FrozenSet[CellAttribute]: Attributes
+        """
+        return frozenset(CellAttribute)
+
+    def open_book(
+        self, path: BookSource, sheets: Optional[Iterable[str]] = None
+    ) -> Book:
         """Open book
 
+        The sheets which are not selected are not parsed. They are still
+        listed by Book.iter_sheets, as UnloadedSheet.
+
         Args:
-            path (Path): File path
+            path (BookSource): File path, buffer like bytes and mmap, or
+            seekable binary file. The buffers are not copied.
+            sheets (Optional[Iterable[str]]): Names of the sheets to load,
+            all sheets by default
 
         Returns:
             Book: Book
@@ -0,0 +1,667 @@
+from pathlib import Path
+from typing import Any
+from typing import cast
+from typing import Dict
+from typing import FrozenSet
+from typing import IO
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from xlform.engine.base import Book
+from xlform.engine.base import BookSource
+from xlform.engine.base import BookTarget
+from xlform.engine.base import Cell
+from xlform.engine.base import CellAttribute
+from xlform.engine.base import CellValue
+from xlform.engine.base import check_range_values
+from xlform.engine.base import Engine
+from xlform.engine.base import get_book_file
+from xlform.engine.base import get_column_letter
+from xlform.engine.base import get_loaded_sheet_names
+from xlform.engine.base import parse_range_arg
+from xlform.engine.base import Range
+from xlform.engine.base import safe_cast_cell_value
+from xlform.engine.base import Sheet
+from xlform.engine.base import UnloadedSheet
+from xlform.exception import XlFormArgumentException
+from xlform.exception import XlFormNotImplementedException
+from xlform.exception import XlFormRuntimeException
+from xlform.trace import CELLS_READ
+from xlform.trace import CELLS_WRITTEN
+from xlform.trace import NULL_TRACER
+from xlform.trace import SPAN_NEW_BOOK
+from xlform.trace import SPAN_OPEN_BOOK
+from xlform.trace import SPAN_SAVE
+from xlform.trace import Tracer
+from xlform.trace import WRAPPERS
+import csv
+import datetime
+import io
+import itertools
+import re
+
+_CELL_ATTRIBUTES = frozenset(
+    [
+        CellAttribute.FORMULA,
+        CellAttribute.VALUE,
+        CellAttribute.NUMBER_FORMAT,
+        CellAttribute.TEXT,
+    ]
+)
+_FORMULA_CELL_ATTRIBUTES = frozenset(
+    [CellAttribute.FORMULA, CellAttribute.NUMBER_FORMAT, CellAttribute.TEXT]
+)
+_EMPTY_CELL_ATTRIBUTES = frozenset(
+    [CellAttribute.NUMBER_FORMAT, CellAttribute.TEXT]
+)
+
+_GENERAL_NUMBER_FORMAT = "General"
+
+_DEFAULT_SHEET_NAME = "Sheet1"
+
+# The number is an int without the fraction and the exponent.
+_NUMBER_RE = re.compile(r"[+-]?(?:\d+(\.\d*)?|(\.\d+))([eE][+-]?\d+)?\Z")
+
+
+def _parse_field(raw_value: Any) -> Any:
+    # The fields of the file are parsed as they are read, like a
+    # spreadsheet application opening the file. The written values are kept
+    # as they are.
+    if not isinstance(raw_value, str):
+        return raw_value
+    if raw_value == "":
+        return None
+    m = _NUMBER_RE.match(raw_value)
+    if m is None:
+        return raw_value
+    if m.lastindex is None:
+        return int(raw_value)
+    return float(raw_value)
+
+
+def _format_field(raw_value: Any) -> str:
+    if raw_value is None:
+        return ""
+    return str(raw_value)
+
+
+def _get_attributes(raw_value: Any) -> FrozenSet[CellAttribute]:
+    if isinstance(raw_value, str) and raw_value.startswith("="):
+        return _FORMULA_CELL_ATTRIBUTES
+    if isinstance(raw_value, (str, float, int, datetime.datetime)):
+        return _CELL_ATTRIBUTES
+    return _EMPTY_CELL_ATTRIBUTES
+
+
+def _get_value(raw_value: Any) -> CellValue:
+    value = safe_cast_cell_value(raw_value)
+    if isinstance(value, str) and value.startswith("="):
+        raise XlFormNotImplementedException()
+    return value
+
+
+def _get_value_or_none(raw_value: Any) -> Optional[CellValue]:
+    if CellAttribute.VALUE in _get_attributes(raw_value):
+        return safe_cast_cell_value(raw_value)
+    return None
+
+
+class CellCsv(Cell):
+    """Cell of a CSV sheet
+
+    Cells are created on demand and keep only the coordinates. The fields
+    are kept by the sheet.
+    """
+
+    __slots__ = ("_sheet", "_row", "_column")
+
+    def __init__(self, sheet: "SheetCsv", row: int, column: int) -> None:
+        self._sheet = sheet
+        self._row = row
+        self._column = column
+        sheet.get_tracer().count(WRAPPERS)
+
+    def get_tracer(self) -> Tracer:
+        return self._sheet.get_tracer()
+
+    def get_row(self) -> int:
+        return self._row
+
+    def get_column(self) -> int:
+        return self._column
+
+    def get_formula(self) -> CellValue:
+        return safe_cast_cell_value(
+            _parse_field(self._sheet.get_field(self._row, self._column))
+        )
+
+    def get_value(self) -> CellValue:
+        self._sheet.get_tracer().count(CELLS_READ)
+        return _get_value(
+            _parse_field(self._sheet.get_field(self._row, self._column))
+        )
+
+    def get_number_format(self) -> str:
+        return _GENERAL_NUMBER_FORMAT
+
+    def get_text(self) -> str:
+        return _format_field(self._sheet.get_field(self._row, self._column))
+
+    def get_attributes(self) -> FrozenSet[CellAttribute]:
+        return _get_attributes(
+            _parse_field(self._sheet.get_field(self._row, self._column))
+        )
+
+    def get_address(
+        self, column_absolute: bool = True, row_absolute: bool = True
+    ) -> str:
+        return "%s%s%s%d" % (
+            "$" if column_absolute else "",
+            get_column_letter(self._column),
+            "$" if row_absolute else "",
+            self._row,
+        )
+
+    def set_value(self, value: CellValue) -> None:
+        self._sheet.get_tracer().count(CELLS_WRITTEN)
+        self._sheet.set_fields(self._row, self._column, [value])
+
+
+class RangeCsv(Range):
+    __slots__ = (
+        "_sheet",
+        "_min_row",
+        "_min_column",
+        "_max_row",
+        "_max_column",
+    )
+
+    def __init__(
+        self,
+        sheet: "SheetCsv",
+        min_row: int,
+        min_column: int,
+        max_row: int,
+        max_column: int,
+    ) -> None:
+        if min_row < 1 or min_column < 1:
+            raise XlFormArgumentException()
+        if max_row < min_row or max_column < min_column:
+            raise XlFormArgumentException()
+        self._sheet = sheet
+        self._min_row = min_row
+        self._min_column = min_column
+        self._max_row = max_row
+        self._max_column = max_column
+        sheet.get_tracer().count(WRAPPERS)
+
+    def get_tracer(self) -> Tracer:
+        return self._sheet.get_tracer()
+
+    def get_rows_count(self) -> int:
+        return self._max_row - self._min_row + 1
+
+    def get_columns_count(self) -> int:
+        return self._max_column - self._min_column + 1
+
+    def get_cell(self, row: int, column: int) -> Cell:
+        if (
+            row < 1
+            or self.get_rows_count() < row
+            or column < 1
+            or self.get_columns_count() < column
+        ):
+            raise XlFormArgumentException()
+        return CellCsv(
+            self._sheet, self._min_row + row - 1, self._min_column + column - 1
+        )
+
+    def _iter_fields(self, row: int) -> Iterator[List[Any]]:
+        if row < 1:
+            raise XlFormArgumentException()
+        return self._sheet.iter_fields(
+            self._min_row + row - 1,
+            self._min_column,
+            self._max_column,
+            self._max_row,
+        )
+
+    def _iter_raw_rows(self, row: int) -> Iterator[List[Any]]:
+        for fields in self._iter_fields(row):
+            yield [_parse_field(field) for field in fields]
+
+    def get_values(self, row: int = 1) -> List[List[CellValue]]:
+        values = [
+            [_get_value(raw_value) for raw_value in raw_row]
+            for raw_row in self._iter_raw_rows(row)
+        ]
+        self.get_tracer().count(
+            CELLS_READ, len(values) * self.get_columns_count()
+        )
+        return values
+
+    def get_values_or_none(
+        self, row: int = 1
+    ) -> List[List[Optional[CellValue]]]:
+        values = [
+            [_get_value_or_none(raw_value) for raw_value in raw_row]
+            for raw_row in self._iter_raw_rows(row)
+        ]
+        self.get_tracer().count(
+            CELLS_READ, len(values) * self.get_columns_count()
+        )
+        return values
+
+    def set_values(self, values: List[List[CellValue]], row: int = 1) -> None:
+        check_range_values(self, values, row)
+        self.get_tracer().count(
+            CELLS_WRITTEN, len(values) * self.get_columns_count()
+        )
+        for row_index, row_values in enumerate(
+            values, start=self._min_row + row - 1
+        ):
+            self._sheet.set_fields(row_index, self._min_column, row_values)
+
+    def dump(self, row: int = 1) -> Dict[str, List[Any]]:
+        column_letters = [
+            get_column_letter(col_index)
+            for col_index in range(self._min_column, self._max_column + 1)
+        ]
+        address: List[str] = list()
+        formula: List[Any] = list()
+        value: List[Any] = list()
+        number_format: List[str] = list()
+        text: List[str] = list()
+        start = self._min_row + row - 1
+        # The text is the field, like 007 of the number 7.
+        for row_index, fields in enumerate(self._iter_fields(row), start):
+            for column_letter, field in zip(column_letters, fields):
+                raw_value = _parse_field(field)
+                address.append("%s%d" % (column_letter, row_index))
+                attributes = _get_attributes(raw_value)
+                if CellAttribute.FORMULA in attributes:
+                    formula.append(raw_value)
+                else:
+                    formula.append(None)
+                if CellAttribute.VALUE in attributes:
+                    value.append(raw_value)
+                else:
+                    value.append(None)
+                number_format.append(_GENERAL_NUMBER_FORMAT)
+                text.append(_format_field(field))
+        self.get_tracer().count(CELLS_READ, len(address))
+        return {
+            "address": address,
+            CellAttribute.FORMULA.value: formula,
+            CellAttribute.VALUE.value: value,
+            CellAttribute.NUMBER_FORMAT.value: number_format,
+            CellAttribute.TEXT.value: text,
+        }
+
+
+class SheetCsv(Sheet):
+    def __init__(
+        self,
+        name: str,
+        reader: Optional[Iterator[List[str]]] = None,
+        tracer: Tracer = NULL_TRACER,
+        chunk_rows: int = 1024,
+        f: Optional[io.TextIOWrapper] = None,
+        detach: bool = False,
+    ) -> None:
+        """Sheet of the rows of a CSV file
+
+        The rows are parsed from the reader in chunks, as far as the rows
+        are requested, and the parsed rows are kept as the lists of the
+        fields. The fields are converted to the values when they are read.
+        The file is closed when the last row is parsed.
+
+        Args:
+            name (str): Sheet name
+            reader (Optional[Iterator[List[str]]]): Rows of the file, no
+            rows by default
+            tracer (Tracer, optional): Tracer
+            chunk_rows (int, optional): Number of the rows parsed at a time
+            f (Optional[io.TextIOWrapper]): Text file which the reader reads
+            detach (bool, optional): True to detach the text file from the
+            binary file instead of closing it, since the binary file belongs
+            to the caller
+        """
+        if chunk_rows < 1:
+            raise XlFormArgumentException()
+        self._name = name
+        self._reader = reader
+        self._tracer = tracer
+        self._chunk_rows = chunk_rows
+        self._file = f
+        self._detach = detach
+        self._rows: List[List[Any]] = list()
+        self._max_column = 0
+        tracer.count(WRAPPERS)
+
+    def get_tracer(self) -> Tracer:
+        return self._tracer
+
+    def get_name(self) -> str:
+        return self._name
+
+    def _load(self, max_row: Optional[int] = None) -> None:
+        # Parse the chunks of the rows until max_row, or the end of the
+        # file if None.
+        while self._reader is not None and (
+            max_row is None or len(self._rows) < max_row
+        ):
+            chunk = list(itertools.islice(self._reader, self._chunk_rows))
+            for fields in chunk:
+                self._max_column = max(self._max_column, len(fields))
+            self._rows.extend(chunk)
+            if len(chunk) < self._chunk_rows:
+                self._reader = None
+                self.close()
+
+    def close(self) -> None:
+        """Close the file of the rows"""
+        if self._file is None:
+            return
+        if self._detach:
+            self._file.detach()
+        else:
+            self._file.close()
+        self._file = None
+
+    def get_field(self, row: int, column: int) -> Any:
+        """Get the field of a cell
+
+        Args:
+            row (int): Row index starting from 1
+            column (int): Column index starting from 1
+
+        Returns:
+            Any: Text of the file, written value or None if the cell is
+            empty
+        """
+        self._load(row)
+        if len(self._rows) < row:
+            return None
+        fields = self._rows[row - 1]
+        if len(fields) < column:
+            return None
+        return fields[column - 1]
+
+    def iter_fields(
+        self,
+        min_row: int,
+        min_column: int,
+        max_column: int,
+        max_row: Optional[int] = None,
+    ) -> Iterator[List[Any]]:
+        """Iterate the fields of the rows
+
+        The rows are parsed as they are iterated.
+
+        Args:
+            min_row (int): Index of the first row starting from 1
+            min_column (int): Index of the first column starting from 1
+            max_column (int): Index of the last column starting from 1
+            max_row (Optional[int]): Index of the last row starting from 1,
+            the last row of the file by default
+
+        Returns:
+            Iterator[List[Any]]: Fields of the rows, with None for the empty
+            cells
+        """
+        start = min_column - 1
+        columns_count = max_column - start
+        row = min_row
+        while max_row is None or row <= max_row:
+            if len(self._rows) < row:
+                self._load(row)
+            if len(self._rows) < row:
+                if max_row is None:
+                    return
+                fields: List[Any] = list()
+            else:
+                fields = self._rows[row - 1][start:max_column]
+            if len(fields) < columns_count:
+                fields.extend([None] * (columns_count - len(fields)))
+            yield fields
+            row += 1
+
+    def set_fields(self, row: int, column: int, values: List[Any]) -> None:
+        """Set the fields of the cells of a row
+
+        Args:
+            row (int): Row index starting from 1
+            column (int): Index of the first column starting from 1
+            values (List[Any]): Values or None to clear the cells
+        """
+        if row < 1 or column < 1:
+            raise XlFormArgumentException()
+        self._load(row)
+        if len(self._rows) < row:
+            self._rows.extend([list() for _ in range(row - len(self._rows))])
+        fields = self._rows[row - 1]
+        last_column = column + len(values) - 1
+        if len(fields) < last_column:
+            fields.extend([None] * (last_column - len(fields)))
+        start = column - 1
+        fields[start:last_column] = values
+        self._max_column = max(self._max_column, len(fields))
+
+    def get_cell(self, row: int, column: int) -> Cell:
+        if row < 1 or column < 1:
+            raise XlFormArgumentException()
+        return CellCsv(self, row, column)
+
+    def get_range(self, arg: str) -> Range:
+        min_column, min_row, max_column, max_row = parse_range_arg(arg)
+        if min_row is None:
+            min_row = 1  # 'A:A'
+        if max_row is None:
+            max_row = max(self.get_max_row(), min_row)  # 'A:A', 'A3:A'
+        if min_column is None or max_column is None:
+            min_column, max_column = 1, max(self.get_max_column(), 1)  # '1:1'
+        return RangeCsv(self, min_row, min_column, max_row, max_column)
+
+    def get_max_row(self) -> int:
+        self._load()
+        return len(self._rows)
+
+    def get_max_column(self) -> int:
+        """Get the index of the last column with fields
+
+        The whole file is parsed.
+
+        Returns:
+            int: Column index starting from 1, 0 if the sheet is empty
+        """
+        self._load()
+        return self._max_column
+
+    def iter_values(
+        self,
+        min_row: int,
+        min_column: int,
+        max_column: int,
+        max_row: Optional[int] = None,
+    ) -> Iterator[List[Optional[CellValue]]]:
+        if min_row < 1 or min_column < 1 or max_column < min_column:
+            raise XlFormArgumentException()
+        for fields in self.iter_fields(
+            min_row, min_column, max_column, max_row
+        ):
+            self._tracer.count(CELLS_READ, len(fields))
+            yield [_get_value_or_none(_parse_field(f)) for f in fields]
+
+    def protect(self) -> None:
+        raise XlFormNotImplementedException()
+
+    def unprotect(self) -> None:
+        raise XlFormNotImplementedException()
+
+
+def _write_sheet(f: IO[str], sheet: "SheetCsv", dialect: str) -> None:
+    writer = csv.writer(f, dialect=dialect)
+    max_column = max(sheet.get_max_column(), 1)
+    for fields in sheet.iter_fields(1, 1, max_column):
+        writer.writerow([_format_field(field) for field in fields])
+
+
+class BookCsv(Book):
+    def __init__(
+        self,
+        sheet: Sheet,
+        dialect: str = "excel",
+        encoding: str = "utf-8",
+        tracer: Tracer = NULL_TRACER,
+    ) -> None:
+        """Book of a CSV file, with one sheet
+
+        Args:
+            sheet (Sheet): Sheet
+            dialect (str, optional): Dialect of the csv module
+            encoding (str, optional): Encoding of the file
+            tracer (Tracer, optional): Tracer
+        """
+        self._sheet = sheet
+        self._dialect = dialect
+        self._encoding = encoding
+        self._tracer = tracer
+
+    def get_tracer(self) -> Tracer:
+        return self._tracer
+
+    def get_cell_attributes(self) -> FrozenSet[CellAttribute]:
+        return _CELL_ATTRIBUTES
+
+    def save(self, path: BookTarget) -> None:
+        sheet = self._sheet
+        if not isinstance(sheet, SheetCsv):
+            raise XlFormRuntimeException(
+                "Can't save the book with unloaded sheets: %s"
+                % (sheet.get_name())
+            )
+        with self._tracer.span(SPAN_SAVE):
+            # The rest of the file is parsed before the file is written,
+            # since the file may be the same.
+            sheet.get_max_row()
+            if isinstance(path, Path):
+                with path.open("w", encoding=self._encoding, newline="") as f:
+                    _write_sheet(f, sheet, self._dialect)
+                return
+            # The binary file belongs to the caller.
+            wrapper = io.TextIOWrapper(
+                path, encoding=self._encoding, newline=""
+            )
+            try:
+                _write_sheet(wrapper, sheet, self._dialect)
+            finally:
+                wrapper.flush()
+                wrapper.detach()
+
+    def close(self) -> None:
+        if isinstance(self._sheet, SheetCsv):
+            self._sheet.close()
+
+    def iter_sheets(self) -> Iterator[Sheet]:
+        yield self._sheet
+
+    def get_sheet(self, name: str) -> Sheet:
+        if name != self._sheet.get_name():
+            raise XlFormArgumentException("Sheet not found: %s" % (name))
+        return self._sheet
+
+    def add_sheet(self, name: str) -> None:
+        raise XlFormNotImplementedException()
+
+
+def _get_sheet_name(source: BookSource) -> str:
+    # The sheet is named after the file, like a spreadsheet application
+    # opening the file.
+    if isinstance(source, Path):
+        return source.stem
+    name = getattr(source, "name", None)
+    if isinstance(name, str):
+        return Path(name).stem
+    return _DEFAULT_SHEET_NAME
+
+
+class EngineCsv(Engine):
+    """Engine of CSV files with the csv module
+
+    A book is a CSV file with one sheet named after the file, or with the
+    given sheet name. The rows are
+    parsed lazily in chunks, so that the forms reading the top of a big
+    file don't parse the rest of it. The fields which look like numbers
+    are read as numbers, and the fields starting with '=' as formulas.
+    Number formats and protection are not supported.
+    """
+
+    def __init__(
+        self,
+        tracer: Tracer = NULL_TRACER,
+        dialect: str = "excel",
+        encoding: str = "utf-8",
+        chunk_rows: int = 1024,
+        sheet_name: Optional[str] = None,
+    ) -> None:
+        """Engine of CSV files with the csv module
+
+        Args:
+            tracer (Tracer, optional): Tracer
+            dialect (str, optional): Dialect of the csv module, like
+            'excel-tab' for TSV files
+            encoding (str, optional): Encoding of the files
+            chunk_rows (int, optional): Number of the rows parsed at a time
+            sheet_name (Optional[str], optional): Name of the sheet of every
+            book, like the sheet name of the registered forms. The sheets
+            are named after the files by default
+        """
+        self.set_tracer(tracer)
+        self._dialect = dialect
+        self._encoding = encoding
+        self._chunk_rows = chunk_rows
+        self._sheet_name = sheet_name
+
+    def get_cell_attributes(self) -> FrozenSet[CellAttribute]:
+        return _CELL_ATTRIBUTES
+
+    def new_book(self) -> Book:
+        tracer = self.get_tracer()
+        with tracer.span(SPAN_NEW_BOOK):
+            name = self._sheet_name
+            if name is None:
+                name = _DEFAULT_SHEET_NAME
+            sheet = SheetCsv(name, tracer=tracer, chunk_rows=self._chunk_rows)
+            return BookCsv(sheet, self._dialect, self._encoding, tracer)
+
+    def open_book(
+        self, path: BookSource, sheets: Optional[Iterable[str]] = None
+    ) -> Book:
+        tracer = self.get_tracer()
+        with tracer.span(SPAN_OPEN_BOOK):
+            name = self._sheet_name
+            if name is None:
+                name = _get_sheet_name(path)
+            if name not in get_loaded_sheet_names([name], sheets):
+                return BookCsv(
+                    UnloadedSheet(name, tracer),
+                    self._dialect,
+                    self._encoding,
+                    tracer,
+                )
+            if isinstance(path, Path):
+                f = path.open("r", encoding=self._encoding, newline="")
+                detach = False
+            else:
+                binary = get_book_file(path)
+                f = io.TextIOWrapper(
+                    cast(IO[bytes], binary),
+                    encoding=self._encoding,
+                    newline="",
+                )
+                detach = binary is path
+            reader = csv.reader(f, dialect=self._dialect)
+            sheet = SheetCsv(name, reader, tracer, self._chunk_rows, f, detach)
+            return BookCsv(sheet, self._dialect, self._encoding, tracer)
@@ -0,0 +1,573 @@
+from typing import Any
+from typing import Dict
+from typing import FrozenSet
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from xlform.engine.base import Book
+from xlform.engine.base import BookSource
+from xlform.engine.base import BookTarget
+from xlform.engine.base import Cell
+from xlform.engine.base import CellAttribute
+from xlform.engine.base import CellValue
+from xlform.engine.base import check_range_values
+from xlform.engine.base import Engine
+from xlform.engine.base import get_book_file
+from xlform.engine.base import get_book_target
+from xlform.engine.base import get_column_letter
+from xlform.engine.base import get_loaded_sheet_names
+from xlform.engine.base import parse_range_arg
+from xlform.engine.base import Range
+from xlform.engine.base import safe_cast_cell_value
+from xlform.engine.base import Sheet
+from xlform.engine.base import UnloadedSheet
+from xlform.exception import XlFormArgumentException
+from xlform.exception import XlFormNotImplementedException
+from xlform.exception import XlFormRuntimeException
+from xlform.trace import CELLS_READ
+from xlform.trace import CELLS_WRITTEN
+from xlform.trace import NULL_TRACER
+from xlform.trace import SPAN_NEW_BOOK
+from xlform.trace import SPAN_OPEN_BOOK
+from xlform.trace import SPAN_SAVE
+from xlform.trace import Tracer
+from xlform.trace import WRAPPERS
+import datetime
+import openpyxl  # type: ignore
+
+_CELL_ATTRIBUTES = frozenset(
+    [CellAttribute.FORMULA, CellAttribute.VALUE, CellAttribute.NUMBER_FORMAT]
+)
+_FORMULA_CELL_ATTRIBUTES = frozenset(
+    [CellAttribute.FORMULA, CellAttribute.NUMBER_FORMAT]
+)
+_EMPTY_CELL_ATTRIBUTES = frozenset([CellAttribute.NUMBER_FORMAT])
+
+_GENERAL_NUMBER_FORMAT = "General"
+
+
+def _get_attributes(raw_value: Any) -> FrozenSet[CellAttribute]:
+    if isinstance(raw_value, str) and raw_value.startswith("="):
+        return _FORMULA_CELL_ATTRIBUTES
+    if isinstance(raw_value, (str, float, int, datetime.datetime)):
+        return _CELL_ATTRIBUTES
+    return _EMPTY_CELL_ATTRIBUTES
+
+
+def _get_value(raw_value: Any) -> CellValue:
+    value = safe_cast_cell_value(raw_value)
+    if isinstance(value, str) and value.startswith("="):
+        raise XlFormNotImplementedException()
+    return value
+
+
+def _get_value_or_none(raw_value: Any) -> Optional[CellValue]:
+    if CellAttribute.VALUE in _get_attributes(raw_value):
+        return safe_cast_cell_value(raw_value)
+    return None
+
+
+class CellMemory(Cell):
+    """Cell of a memory sheet
+
+    Cells are created on demand and keep only the coordinates. The values
+    are kept by the sheet.
+    """
+
+    __slots__ = ("_sheet", "_row", "_column")
+
+    def __init__(self, sheet: "SheetMemory", row: int, column: int) -> None:
+        self._sheet = sheet
+        self._row = row
+        self._column = column
+        sheet.get_tracer().count(WRAPPERS)
+
+    def get_tracer(self) -> Tracer:
+        return self._sheet.get_tracer()
+
+    def get_row(self) -> int:
+        return self._row
+
+    def get_column(self) -> int:
+        return self._column
+
+    def get_formula(self) -> CellValue:
+        return safe_cast_cell_value(
+            self._sheet.get_raw_value(self._row, self._column)
+        )
+
+    def get_value(self) -> CellValue:
+        self._sheet.get_tracer().count(CELLS_READ)
+        return _get_value(self._sheet.get_raw_value(self._row, self._column))
+
+    def get_number_format(self) -> str:
+        return self._sheet.get_number_format(self._row, self._column)
+
+    def get_text(self) -> str:
+        raise XlFormNotImplementedException()
+
+    def get_attributes(self) -> FrozenSet[CellAttribute]:
+        return _get_attributes(
+            self._sheet.get_raw_value(self._row, self._column)
+        )
+
+    def get_address(
+        self, column_absolute: bool = True, row_absolute: bool = True
+    ) -> str:
+        return "%s%s%s%d" % (
+            "$" if column_absolute else "",
+            get_column_letter(self._column),
+            "$" if row_absolute else "",
+            self._row,
+        )
+
+    def set_value(self, value: CellValue) -> None:
+        self._sheet.get_tracer().count(CELLS_WRITTEN)
+        self._sheet.set_raw_value(self._row, self._column, value)
+
+
+class RangeMemory(Range):
+    __slots__ = (
+        "_sheet",
+        "_min_row",
+        "_min_column",
+        "_max_row",
+        "_max_column",
+    )
+
+    def __init__(
+        self,
+        sheet: "SheetMemory",
+        min_row: int,
+        min_column: int,
+        max_row: int,
+        max_column: int,
+    ) -> None:
+        if min_row < 1 or min_column < 1:
+            raise XlFormArgumentException()
+        if max_row < min_row or max_column < min_column:
+            raise XlFormArgumentException()
+        self._sheet = sheet
+        self._min_row = min_row
+        self._min_column = min_column
+        self._max_row = max_row
+        self._max_column = max_column
+        sheet.get_tracer().count(WRAPPERS)
+
+    def get_tracer(self) -> Tracer:
+        return self._sheet.get_tracer()
+
+    def get_rows_count(self) -> int:
+        return self._max_row - self._min_row + 1
+
+    def get_columns_count(self) -> int:
+        return self._max_column - self._min_column + 1
+
+    def get_cell(self, row: int, column: int) -> Cell:
+        if (
+            row < 1
+            or self.get_rows_count() < row
+            or column < 1
+            or self.get_columns_count() < column
+        ):
+            raise XlFormArgumentException()
+        return CellMemory(
+            self._sheet, self._min_row + row - 1, self._min_column + column - 1
+        )
+
+    def _iter_raw_rows(self, row: int) -> Iterator[List[Any]]:
+        if row < 1:
+            raise XlFormArgumentException()
+        return self._sheet.iter_raw_rows(
+            self._min_row + row - 1,
+            self._min_column,
+            self._max_column,
+            self._max_row,
+        )
+
+    def get_values(self, row: int = 1) -> List[List[CellValue]]:
+        values = [
+            [_get_value(raw_value) for raw_value in raw_row]
+            for raw_row in self._iter_raw_rows(row)
+        ]
+        self.get_tracer().count(
+            CELLS_READ, len(values) * self.get_columns_count()
+        )
+        return values
+
+    def get_values_or_none(
+        self, row: int = 1
+    ) -> List[List[Optional[CellValue]]]:
+        values = [
+            [_get_value_or_none(raw_value) for raw_value in raw_row]
+            for raw_row in self._iter_raw_rows(row)
+        ]
+        self.get_tracer().count(
+            CELLS_READ, len(values) * self.get_columns_count()
+        )
+        return values
+
+    def set_values(self, values: List[List[CellValue]], row: int = 1) -> None:
+        check_range_values(self, values, row)
+        self.get_tracer().count(
+            CELLS_WRITTEN, len(values) * self.get_columns_count()
+        )
+        for row_index, row_values in enumerate(
+            values, start=self._min_row + row - 1
+        ):
+            self._sheet.set_raw_values(row_index, self._min_column, row_values)
+
+    def dump(self, row: int = 1) -> Dict[str, List[Any]]:
+        column_letters = [
+            get_column_letter(col_index)
+            for col_index in range(self._min_column, self._max_column + 1)
+        ]
+        address: List[str] = list()
+        formula: List[Any] = list()
+        value: List[Any] = list()
+        number_format: List[str] = list()
+        start = self._min_row + row - 1
+        for row_index, raw_row in enumerate(self._iter_raw_rows(row), start):
+            for col_index, (column_letter, raw_value) in enumerate(
+                zip(column_letters, raw_row), self._min_column
+            ):
+                address.append("%s%d" % (column_letter, row_index))
+                attributes = _get_attributes(raw_value)
+                if CellAttribute.FORMULA in attributes:
+                    formula.append(raw_value)
+                else:
+                    formula.append(None)
+                if CellAttribute.VALUE in attributes:
+                    value.append(raw_value)
+                else:
+                    value.append(None)
+                number_format.append(
+                    self._sheet.get_number_format(row_index, col_index)
+                )
+        self.get_tracer().count(CELLS_READ, len(address))
+        return {
+            "address": address,
+            CellAttribute.FORMULA.value: formula,
+            CellAttribute.VALUE.value: value,
+            CellAttribute.NUMBER_FORMAT.value: number_format,
+        }
+
+
+class SheetMemory(Sheet):
+    def __init__(self, name: str, tracer: Tracer = NULL_TRACER) -> None:
+        """Sheet kept in memory
+
+        The raw values are kept in a list for each row with values, so that
+        the empty rows take no memory. A formula is kept as a string
+        starting with '='. Only the number formats other than 'General' are
+        kept.
+
+        Args:
+            name (str): Sheet name
+            tracer (Tracer, optional): Tracer
+        """
+        self._name = name
+        self._tracer = tracer
+        self._row_dic: Dict[int, List[Any]] = dict()
+        self._number_format_dic: Dict[Tuple[int, int], str] = dict()
+        self._max_row = 0
+        self._max_column = 0
+        self._protected = False
+
+    def get_tracer(self) -> Tracer:
+        return self._tracer
+
+    def get_name(self) -> str:
+        return self._name
+
+    def get_raw_value(self, row: int, column: int) -> Any:
+        """Get the raw value of a cell
+
+        Args:
+            row (int): Row index starting from 1
+            column (int): Column index starting from 1
+
+        Returns:
+            Any: Value, formula or None if the cell is empty
+        """
+        raw_row = self._row_dic.get(row)
+        if raw_row is None or len(raw_row) < column:
+            return None
+        return raw_row[column - 1]
+
+    def iter_raw_rows(
+        self, min_row: int, min_column: int, max_column: int, max_row: int
+    ) -> Iterator[List[Any]]:
+        """Iterate the raw values of the rows
+
+        Args:
+            min_row (int): Index of the first row starting from 1
+            min_column (int): Index of the first column starting from 1
+            max_column (int): Index of the last column starting from 1
+            max_row (int): Index of the last row starting from 1
+
+        Returns:
+            Iterator[List[Any]]: Raw values of the rows
+        """
+        start = min_column - 1
+        columns_count = max_column - start
+        for row in range(min_row, max_row + 1):
+            raw_row = self._row_dic.get(row)
+            if raw_row is None:
+                yield [None] * columns_count
+                continue
+            values = raw_row[start:max_column]
+            if len(values) < columns_count:
+                values.extend([None] * (columns_count - len(values)))
+            yield values
+
+    def set_raw_value(self, row: int, column: int, value: Any) -> None:
+        """Set the raw value of a cell
+
+        Args:
+            row (int): Row index starting from 1
+            column (int): Column index starting from 1
+            value (Any): Value, formula or None to clear the cell
+        """
+        self.set_raw_values(row, column, [value])
+
+    def set_raw_values(self, row: int, column: int, values: List[Any]) -> None:
+        """Set the raw values of the cells of a row
+
+        Args:
+            row (int): Row index starting from 1
+            column (int): Index of the first column starting from 1
+            values (List[Any]): Values, formulas or None to clear the cells
+        """
+        if row < 1 or column < 1:
+            raise XlFormArgumentException()
+        raw_row = self._row_dic.get(row)
+        if raw_row is None:
+            if all(value is None for value in values):
+                return
+            raw_row = list()
+            self._row_dic[row] = raw_row
+        last_column = column + len(values) - 1
+        if len(raw_row) < last_column:
+            raw_row.extend([None] * (last_column - len(raw_row)))
+        start = column - 1
+        raw_row[start:last_column] = values
+        self._max_row = max(self._max_row, row)
+        self._max_column = max(self._max_column, len(raw_row))
+
+    def get_number_format(self, row: int, column: int) -> str:
+        """Get the number format of a cell
+
+        Args:
+            row (int): Row index starting from 1
+            column (int): Column index starting from 1
+
+        Returns:
+            str: Number format
+        """
+        return self._number_format_dic.get(
+            (row, column), _GENERAL_NUMBER_FORMAT
+        )
+
+    def set_number_format(
+        self, row: int, column: int, number_format: str
+    ) -> None:
+        """Set the number format of a cell
+
+        Args:
+            row (int): Row index starting from 1
+            column (int): Column index starting from 1
+            number_format (str): Number format
+        """
+        if number_format == _GENERAL_NUMBER_FORMAT:
+            self._number_format_dic.pop((row, column), None)
+            return
+        self._number_format_dic[(row, column)] = number_format
+
+    def get_cell(self, row: int, column: int) -> Cell:
+        if row < 1 or column < 1:
+            raise XlFormArgumentException()
+        return CellMemory(self, row, column)
+
+    def get_range(self, arg: str) -> Range:
+        min_column, min_row, max_column, max_row = parse_range_arg(arg)
+        if min_row is None:
+            min_row = 1  # 'A:A'
+        if max_row is None:
+            max_row = max(self._max_row, min_row)  # 'A:A', 'A3:A'
+        if min_column is None or max_column is None:
+            min_column, max_column = 1, max(self._max_column, 1)  # '1:1'
+        return RangeMemory(self, min_row, min_column, max_row, max_column)
+
+    def get_max_row(self) -> int:
+        return self._max_row
+
+    def get_max_column(self) -> int:
+        """Get the index of the last column with values
+
+        Returns:
+            int: Column index starting from 1, 0 if the sheet is empty
+        """
+        return self._max_column
+
+    def iter_values(
+        self,
+        min_row: int,
+        min_column: int,
+        max_column: int,
+        max_row: Optional[int] = None,
+    ) -> Iterator[List[Optional[CellValue]]]:
+        if min_row < 1 or min_column < 1 or max_column < min_column:
+            raise XlFormArgumentException()
+        if max_row is None or max_row > self._max_row:
+            max_row = self._max_row
+        for raw_row in self.iter_raw_rows(
+            min_row, min_column, max_column, max_row
+        ):
+            self._tracer.count(CELLS_READ, len(raw_row))
+            yield [_get_value_or_none(raw_value) for raw_value in raw_row]
+
+    def is_protected(self) -> bool:
+        """Return True if the sheet is protected"""
+        return self._protected
+
+    def protect(self) -> None:
+        self._protected = True
+
+    def unprotect(self) -> None:
+        self._protected = False
+
+
+class BookMemory(Book):
+    def __init__(self, tracer: Tracer = NULL_TRACER) -> None:
+        """Book kept in memory
+
+        Args:
+            tracer (Tracer, optional): Tracer
+        """
+        self._tracer = tracer
+        self._sheet_dic: Dict[str, Sheet] = dict()
+
+    def get_tracer(self) -> Tracer:
+        return self._tracer
+
+    def get_cell_attributes(self) -> FrozenSet[CellAttribute]:
+        return _CELL_ATTRIBUTES
+
+    def save(self, path: BookTarget) -> None:
+        with self._tracer.span(SPAN_SAVE):
+            wb = openpyxl.Workbook(write_only=True)
+            for sheet in self._sheet_dic.values():
+                if not isinstance(sheet, SheetMemory):
+                    raise XlFormRuntimeException(
+                        "Can't save the book with unloaded sheets: %s"
+                        % (sheet.get_name())
+                    )
+                _write_sheet(wb.create_sheet(sheet.get_name()), sheet)
+            wb.save(get_book_target(path))
+            wb.close()
+
+    def close(self) -> None:
+        pass
+
+    def iter_sheets(self) -> Iterator[Sheet]:
+        for sheet in self._sheet_dic.values():
+            yield sheet
+
+    def get_sheet(self, name: str) -> Sheet:
+        try:
+            return self._sheet_dic[name]
+        except KeyError:
+            raise XlFormArgumentException("Sheet not found: %s" % (name))
+
+    def add_sheet(self, name: str) -> None:
+        if name in self._sheet_dic:
+            raise XlFormArgumentException("Sheet already exists: %s" % (name))
+        self._sheet_dic[name] = SheetMemory(name, self._tracer)
+        return None
+
+    def _add_unloaded_sheet(self, name: str) -> None:
+        self._sheet_dic[name] = UnloadedSheet(name, self._tracer)
+
+
+def _write_sheet(ws: Any, sheet: SheetMemory) -> None:
+    ws.protection.sheet = sheet.is_protected()
+    max_column = sheet.get_max_column()
+    for row_index, raw_row in enumerate(
+        sheet.iter_raw_rows(1, 1, max_column, sheet.get_max_row()), 1
+    ):
+        row: List[Any] = list()
+        for col_index, raw_value in enumerate(raw_row, 1):
+            number_format = sheet.get_number_format(row_index, col_index)
+            if number_format == _GENERAL_NUMBER_FORMAT:
+                row.append(raw_value)
+                continue
+            cell = openpyxl.cell.WriteOnlyCell(ws, value=raw_value)
+            cell.number_format = number_format
+            row.append(cell)
+        ws.append(row)
+
+
+def _read_sheet(ws: Any, sheet: SheetMemory) -> None:
+    for cells in ws.iter_rows():
+        # Empty cells of the read-only worksheet don't know their
+        # coordinates, so they are located by the other cells of the row.
+        offset = None
+        for index, c in enumerate(cells):
+            if c is not openpyxl.cell.read_only.EMPTY_CELL:
+                offset = c.column - index
+                break
+        if offset is None:
+            continue
+        row = cells[index].row
+        sheet.set_raw_values(row, offset, [c.value for c in cells])
+        for column, c in enumerate(cells, offset):
+            if c is openpyxl.cell.read_only.EMPTY_CELL or not c.has_style:
+                continue
+            sheet.set_number_format(row, column, c.number_format)
+
+
+class EngineMemory(Engine):
+    """Engine which keeps the books in memory
+
+    The books are plain grids of values, formulas and number formats, so
+    that they are fast to build and to read. openpyxl is used only to open
+    and to save the files; the other parts of the files, like the styles
+    other than the number formats, are not kept.
+    """
+
+    def __init__(self, tracer: Tracer = NULL_TRACER) -> None:
+        self.set_tracer(tracer)
+
+    def get_cell_attributes(self) -> FrozenSet[CellAttribute]:
+        return _CELL_ATTRIBUTES
+
+    def new_book(self) -> Book:
+        tracer = self.get_tracer()
+        with tracer.span(SPAN_NEW_BOOK):
+            book = BookMemory(tracer)
+            book.add_sheet("Sheet1")
+            return book
+
+    def open_book(
+        self, path: BookSource, sheets: Optional[Iterable[str]] = None
+    ) -> Book:
+        tracer = self.get_tracer()
+        with tracer.span(SPAN_OPEN_BOOK):
+            wb = openpyxl.load_workbook(get_book_file(path), read_only=True)
+            try:
+                loaded = get_loaded_sheet_names(wb.sheetnames, sheets)
+                book = BookMemory(tracer)
+                for ws in wb.worksheets:
+                    if ws.title not in loaded:
+                        book._add_unloaded_sheet(ws.title)
+                        continue
+                    book.add_sheet(ws.title)
+                    sheet = book.get_sheet(ws.title)
+                    assert isinstance(sheet, SheetMemory)
+                    _read_sheet(ws, sheet)
+            finally:
+                wb.close()
+            return book
@@ -1,24 +1,127 @@
-from pathlib import Path
 from typing import Any
 from typing import cast
+from typing import Dict
+from typing import FrozenSet
+from typing import IO
+from typing import Iterable
 from typing import Iterator
+from typing import List
+from typing import Optional
 from typing import Tuple
+from typing import Union
 from xlform.engine.base import Book
+from xlform.engine.base import BookSource
+from xlform.engine.base import BookTarget
 from xlform.engine.base import Cell
+from xlform.engine.base import CellAttribute
 from xlform.engine.base import CellValue
+from xlform.engine.base import check_range_values
 from xlform.engine.base import Engine
+from xlform.engine.base import get_book_file
+from xlform.engine.base import get_book_target
+from xlform.engine.base import get_column_letter
+from xlform.engine.base import get_loaded_sheet_names
 from xlform.engine.base import Range
 from xlform.engine.base import safe_cast_cell_value
 from xlform.engine.base import Sheet
+from xlform.engine.base import UnloadedSheet
 from xlform.exception import XlFormArgumentException
 from xlform.exception import XlFormInternalException
 from xlform.exception import XlFormNotImplementedException
+from xlform.exception import XlFormRuntimeException
+from xlform.trace import CELLS_READ
+from xlform.trace import CELLS_WRITTEN
+from xlform.trace import NULL_TRACER
+from xlform.trace import SPAN_NEW_BOOK
+from xlform.trace import SPAN_OPEN_BOOK
+from xlform.trace import SPAN_SAVE
+from xlform.trace import Tracer
+from xlform.trace import WRAPPERS
+import datetime
 import openpyxl  # type: ignore
 
+_CELL_ATTRIBUTES = frozenset(
+    [CellAttribute.FORMULA, CellAttribute.VALUE, CellAttribute.NUMBER_FORMAT]
+)
+_FORMULA_CELL_ATTRIBUTES = frozenset(
+    [CellAttribute.FORMULA, CellAttribute.NUMBER_FORMAT]
+)
+_EMPTY_CELL_ATTRIBUTES = frozenset([CellAttribute.NUMBER_FORMAT])
+
+# Empty cells of read-only worksheets have no number format.
+_EMPTY_CELL_NUMBER_FORMAT = "General"
+
+
+def _get_attributes(raw_value: Any) -> FrozenSet[CellAttribute]:
+    if isinstance(raw_value, str) and raw_value.startswith("="):
+        return _FORMULA_CELL_ATTRIBUTES
+    if isinstance(raw_value, (str, float, int, datetime.datetime)):
+        return _CELL_ATTRIBUTES
+    return _EMPTY_CELL_ATTRIBUTES
+
+
+def _dump_cells(
+    rows: Tuple[Tuple[Any, ...], ...],
+    row: int,
+    column: int,
+    columns_count: int,
+) -> Dict[str, List[Any]]:
+    column_letters = [
+        get_column_letter(col_index)
+        for col_index in range(column, column + columns_count)
+    ]
+    address: List[str] = list()
+    formula: List[Any] = list()
+    value: List[Any] = list()
+    number_format: List[str] = list()
+    for row_index, cells in enumerate(rows, start=row):
+        for column_letter, c in zip(column_letters, cells):
+            address.append("%s%d" % (column_letter, row_index))
+            raw_value = c.value
+            attributes = _get_attributes(raw_value)
+            if CellAttribute.FORMULA in attributes:
+                formula.append(raw_value)
+            else:
+                formula.append(None)
+            if CellAttribute.VALUE in attributes:
+                value.append(raw_value)
+            else:
+                value.append(None)
+            if c.number_format is None:
+                number_format.append(_EMPTY_CELL_NUMBER_FORMAT)
+            else:
+                number_format.append(c.number_format)
+    return {
+        "address": address,
+        CellAttribute.FORMULA.value: formula,
+        CellAttribute.VALUE.value: value,
+        CellAttribute.NUMBER_FORMAT.value: number_format,
+    }
+
+
+def _get_value_or_none(raw_value: Any) -> Optional[CellValue]:
+    if CellAttribute.VALUE in _get_attributes(raw_value):
+        return cast(CellValue, raw_value)
+    return None
+
+
+def _get_value(raw_value: Any) -> CellValue:
+    value = safe_cast_cell_value(raw_value)
+    if isinstance(value, str) and value.startswith("="):
+        raise XlFormNotImplementedException()
+    return value
+
 
 class CellOpenpyxl(Cell):
-    def __init__(self, cell: openpyxl.cell.cell.Cell):
+    def __init__(
+        self, cell: openpyxl.cell.cell.Cell, tracer: Tracer = NULL_TRACER
+    ):
         self._cell = cell
+        self._tracer = tracer
+        tracer.count(WRAPPERS)
+
+    def get_tracer(self) -> Tracer:
+        return self._tracer
 
     def get_row(self) -> int:
         row = self._cell.row
@@ -36,10 +139,8 @@ class CellOpenpyxl(Cell):
         return safe_cast_cell_value(self._cell.value)
 
     def get_value(self) -> CellValue:
-        value = safe_cast_cell_value(self._cell.value)
-        if isinstance(value, str) and value[0] == "=":
-            raise XlFormNotImplementedException()
-        return value
+        self._tracer.count(CELLS_READ)
+        return _get_value(self._cell.value)
 
     def get_number_format(self) -> str:
         number_format = self._cell.number_format
@@ -50,6 +151,9 @@ class CellOpenpyxl(Cell):
     def get_text(self) -> str:
         raise XlFormNotImplementedException()
 
+    def get_attributes(self) -> FrozenSet[CellAttribute]:
+        return _get_attributes(self._cell.value)
+
     def get_address(
         self, column_absolute: bool = True, row_absolute: bool = True
     ) -> str:
@@ -61,11 +165,16 @@ class CellOpenpyxl(Cell):
         )
 
     def set_value(self, value: CellValue) -> None:
+        self._tracer.count(CELLS_WRITTEN)
         self._cell.value = value
 
 
 class RangeOpenpyxl(Range):
-    def __init__(self, r: Tuple[Tuple[openpyxl.cell.cell.Cell]]):
+    def __init__(
+        self,
+        r: Tuple[Tuple[openpyxl.cell.cell.Cell]],
+        tracer: Tracer = NULL_TRACER,
+    ):
         if (
             (not isinstance(r, tuple))
             or (not isinstance(r[0], tuple))
@@ -75,6 +184,11 @@ class RangeOpenpyxl(Range):
         self._range = r
         self._column_offset = r[0][0].column - 1
         self._row_offset = r[0][0].row - 1
+        self._tracer = tracer
+        tracer.count(WRAPPERS)
+
+    def get_tracer(self) -> Tracer:
+        return self._tracer
 
     def get_cell(self, row: int, column: int) -> Cell:
         if (
@@ -84,7 +198,7 @@ class RangeOpenpyxl(Range):
             or self.get_columns_count() < column
         ):
             raise XlFormArgumentException()
-        return CellOpenpyxl(self._range[row - 1][column - 1])
+        return CellOpenpyxl(self._range[row - 1][column - 1], self._tracer)
 
     def get_columns_count(self) -> int:
         return len(self._range[0])
@@ -92,10 +206,59 @@ class RangeOpenpyxl(Range):
     def get_rows_count(self) -> int:
         return len(self._range)
 
+    def get_values(self, row: int = 1) -> List[List[CellValue]]:
+        if row < 1:
+            raise XlFormArgumentException()
+        start = row - 1
+        rows = self._range[start:]
+        self._tracer.count(CELLS_READ, len(rows) * self.get_columns_count())
+        return [[_get_value(c.value) for c in r] for r in rows]
+
+    def get_values_or_none(
+        self, row: int = 1
+    ) -> List[List[Optional[CellValue]]]:
+        if row < 1:
+            raise XlFormArgumentException()
+        start = row - 1
+        rows = self._range[start:]
+        self._tracer.count(CELLS_READ, len(rows) * self.get_columns_count())
+        return [[_get_value_or_none(c.value) for c in r] for r in rows]
+
+    def set_values(self, values: List[List[CellValue]], row: int = 1) -> None:
+        check_range_values(self, values, row)
+        self._tracer.count(
+            CELLS_WRITTEN, len(values) * self.get_columns_count()
+        )
+        start = row - 1
+        rows = self._range[start:]
+        for cells, row_values in zip(rows, values):
+            for c, value in zip(cells, row_values):
+                c.value = value
+
+    def dump(self, row: int = 1) -> Dict[str, List[Any]]:
+        if row < 1:
+            raise XlFormArgumentException()
+        start = row - 1
+        self._tracer.count(
+            CELLS_READ,
+            (self.get_rows_count() - start) * self.get_columns_count(),
+        )
+        return _dump_cells(
+            self._range[start:],
+            self._row_offset + row,
+            self._column_offset + 1,
+            self.get_columns_count(),
+        )
+
 
 class SheetOpenpyxl(Sheet):
-    def __init__(self, sheet: Any) -> None:
+    def __init__(self, sheet: Any, tracer: Tracer = NULL_TRACER) -> None:
         self._sheet = sheet
+        self._tracer = tracer
+        tracer.count(WRAPPERS)
+
+    def get_tracer(self) -> Tracer:
+        return self._tracer
 
     def get_name(self) -> str:
         return cast(str, self._sheet.title)
@@ -103,26 +266,53 @@ class SheetOpenpyxl(Sheet):
     def get_cell(self, row: int, column: int) -> Cell:
         if row < 1 or column < 1:
             raise XlFormArgumentException()
-        return CellOpenpyxl(self._sheet.cell(row=row, column=column))
+        return CellOpenpyxl(
+            self._sheet.cell(row=row, column=column), self._tracer
+        )
 
     def get_range(self, arg: str) -> Range:
         r = self._sheet[arg]
         if isinstance(r, openpyxl.cell.cell.Cell):
-            return RangeOpenpyxl(((r,),))  # 'A1'
+            return RangeOpenpyxl(((r,),), self._tracer)  # 'A1'
         if isinstance(r, tuple):
             if len(r) == 0 or (len(r) > 0 and isinstance(r[0], tuple)):
                 r2 = cast(Tuple[Tuple[Any]], r)
-                return RangeOpenpyxl(r2)  # 'A1:A2', 'A:B' or '1:2'
+                return RangeOpenpyxl(r2, self._tracer)  # 'A1:A2', 'A:B'
             if isinstance(r[0], openpyxl.cell.cell.Cell) and (
                 len(r) == 1 or (len(r) > 1 and r[0].column != r[1].column)
             ):
                 r3 = cast(Tuple[Any], r)
-                return RangeOpenpyxl((r3,))  # '1:1'
+                return RangeOpenpyxl((r3,), self._tracer)  # '1:1'
             r4 = cast(Tuple[Any], r)
             r5 = cast(Tuple[Tuple[Any]], tuple(map(lambda c: (c,), r4)))
-            return RangeOpenpyxl(r5)  # 'A:A'
+            return RangeOpenpyxl(r5, self._tracer)  # 'A:A'
         raise XlFormInternalException()
 
+    def get_max_row(self) -> int:
+        return cast(int, self._sheet.max_row)
+
+    def iter_values(
+        self,
+        min_row: int,
+        min_column: int,
+        max_column: int,
+        max_row: Optional[int] = None,
+    ) -> Iterator[List[Optional[CellValue]]]:
+        if min_row < 1 or min_column < 1 or max_column < min_column:
+            raise XlFormArgumentException()
+        # Avoid creating the cells after the last row.
+        if max_row is None or max_row > self._sheet.max_row:
+            max_row = self._sheet.max_row
+        for r in self._sheet.iter_rows(
+            min_row=min_row,
+            max_row=max_row,
+            min_col=min_column,
+            max_col=max_column,
+            values_only=True,
+        ):
+            self._tracer.count(CELLS_READ, len(r))
+            yield [_get_value_or_none(value) for value in r]
+
     def protect(self) -> None:
         if False:
             self._sheet.protection.enable()
@@ -135,34 +325,578 @@ class SheetOpenpyxl(Sheet):
 
 
 class BookOpenpyxl(Book):
-    def __init__(self, book: openpyxl.workbook.workbook.Workbook) -> None:
+    def __init__(
+        self,
+        book: openpyxl.workbook.workbook.Workbook,
+        tracer: Tracer = NULL_TRACER,
+        sheet_names: Optional[List[str]] = None,
+    ) -> None:
+        """Book of an openpyxl workbook
+
+        Args:
+            book (openpyxl.workbook.workbook.Workbook): Workbook
+            tracer (Tracer, optional): Tracer
+            sheet_names (Optional[List[str]]): Names of all the sheets of the
+            file, the worksheets of the workbook by default. The sheets which
+            are not in the workbook are unloaded.
+        """
         self._book = book
-
-    def save(self, path: Path) -> None:
-        self._book.save(str(path))
+        self._tracer = tracer
+        if sheet_names is None:
+            sheet_names = book.sheetnames
+        loaded_sheet_names = frozenset(book.sheetnames)
+        self._sheet_dic: Dict[str, Sheet] = dict()
+        for name in sheet_names:
+            if name in loaded_sheet_names:
+                self._sheet_dic[name] = self._new_sheet(book[name])
+            else:
+                self._sheet_dic[name] = UnloadedSheet(name, tracer)
+
+    def _new_sheet(self, sheet: Any) -> Sheet:
+        return SheetOpenpyxl(sheet, self._tracer)
+
+    def get_tracer(self) -> Tracer:
+        return self._tracer
+
+    def get_cell_attributes(self) -> FrozenSet[CellAttribute]:
+        return _CELL_ATTRIBUTES
+
+    def _check_loaded(self) -> None:
+        # The unloaded sheets are not in the workbook, and would be lost.
+        for sheet in self._sheet_dic.values():
+            if not sheet.is_loaded():
+                raise XlFormRuntimeException(
+                    "Can't save the book with unloaded sheets: %s"
+                    % (sheet.get_name())
+                )
+
+    def save(self, path: BookTarget) -> None:
+        self._check_loaded()
+        with self._tracer.span(SPAN_SAVE):
+            self._book.save(get_book_target(path))
         return None
 
     def close(self) -> None:
         self._book.close()
 
     def iter_sheets(self) -> Iterator[Sheet]:
-        for sheet in self._book:
-            yield SheetOpenpyxl(sheet)
+        for sheet in self._sheet_dic.values():
+            yield sheet
+
+    def get_sheet(self, name: str) -> Sheet:
+        try:
+            return self._sheet_dic[name]
+        except KeyError:
+            raise XlFormArgumentException("Sheet not found: %s" % (name))
 
     def add_sheet(self, name: str) -> None:
-        self._book.create_sheet(name)
+        ws = self._book.create_sheet(name)
+        self._sheet_dic[ws.title] = self._new_sheet(ws)
         return None
 
 
+class _ExcelReaderSelective(openpyxl.reader.excel.ExcelReader):  # type: ignore
+    """Reader which parses only the selected worksheets"""
+
+    def __init__(
+        self, path: Union[str, IO[bytes]], sheets: Iterable[str]
+    ) -> None:
+        super().__init__(path)
+        self._sheets = sheets
+        self.sheet_names: List[str] = list()
+
+    def read_worksheets(self) -> None:
+        found = list(self.parser.find_sheets())
+        self.sheet_names = [sheet.name for sheet, _ in found]
+        loaded = get_loaded_sheet_names(self.sheet_names, self._sheets)
+        index_dic: Dict[int, int] = dict()
+        for index, (sheet, _) in enumerate(found):
+            if sheet.name in loaded:
+                index_dic[index] = len(index_dic)
+        self.parser.find_sheets = lambda: (
+            (sheet, rel) for sheet, rel in found if sheet.name in loaded
+        )
+        super().read_worksheets()
+
+        # The local names refer to the sheets by the indexes in the file.
+        defined_names = self.parser.defined_names
+        defined_names.definedName = [
+            defn
+            for defn in defined_names.definedName
+            if defn.localSheetId is None or int(defn.localSheetId) in index_dic
+        ]
+        for defn in defined_names.definedName:
+            if defn.localSheetId is not None:
+                defn.localSheetId = index_dic[int(defn.localSheetId)]
+
+
 class EngineOpenpyxl(Engine):
-    def __init__(self) -> None:
-        pass
+    def __init__(self, tracer: Tracer = NULL_TRACER) -> None:
+        self.set_tracer(tracer)
+
+    def get_cell_attributes(self) -> FrozenSet[CellAttribute]:
+        return _CELL_ATTRIBUTES
+
+    def new_book(self) -> Book:
+        tracer = self.get_tracer()
+        with tracer.span(SPAN_NEW_BOOK):
+            wb = openpyxl.Workbook()
+            assert wb.sheetnames == ["Sheet"]
+            wb["Sheet"].title = "Sheet1"
+            return BookOpenpyxl(wb, tracer)
+
+    def open_book(
+        self, path: BookSource, sheets: Optional[Iterable[str]] = None
+    ) -> Book:
+        tracer = self.get_tracer()
+        with tracer.span(SPAN_OPEN_BOOK):
+            if sheets is None:
+                wb = openpyxl.load_workbook(get_book_file(path))
+                return BookOpenpyxl(wb, tracer)
+            reader = _ExcelReaderSelective(get_book_file(path), sheets)
+            reader.read()
+            return BookOpenpyxl(reader.wb, tracer, reader.sheet_names)
+
+
+class CellOpenpyxlReadOnly(CellOpenpyxl):
+    """Cell of a read-only worksheet
+
+    Empty cells of read-only worksheets don't know their coordinates,
+    so the coordinates are kept in the wrapper.
+    """
+
+    def __init__(
+        self, cell: Any, row: int, column: int, tracer: Tracer = NULL_TRACER
+    ):
+        super().__init__(cell, tracer)
+        self._row = row
+        self._column = column
+
+    def get_row(self) -> int:
+        return self._row
+
+    def get_column(self) -> int:
+        return self._column
+
+    def get_number_format(self) -> str:
+        if self._cell.number_format is None:
+            return _EMPTY_CELL_NUMBER_FORMAT
+        return super().get_number_format()
+
+    def get_address(
+        self, column_absolute: bool = True, row_absolute: bool = True
+    ) -> str:
+        return "%s%s%s%d" % (
+            "$" if column_absolute else "",
+            openpyxl.utils.cell.get_column_letter(self._column),
+            "$" if row_absolute else "",
+            self._row,
+        )
+
+    def set_value(self, value: CellValue) -> None:
+        raise XlFormNotImplementedException()
+
+
+class RangeOpenpyxlReadOnly(Range):
+    def __init__(
+        self,
+        r: Tuple[Tuple[Any, ...], ...],
+        row: int,
+        column: int,
+        tracer: Tracer = NULL_TRACER,
+    ):
+        if (not isinstance(r, tuple)) or (not isinstance(r[0], tuple)):
+            raise XlFormArgumentException()
+        self._range = r
+        self._row = row
+        self._column = column
+        self._tracer = tracer
+        tracer.count(WRAPPERS)
+
+    def get_tracer(self) -> Tracer:
+        return self._tracer
+
+    def get_cell(self, row: int, column: int) -> Cell:
+        if (
+            row < 1
+            or self.get_rows_count() < row
+            or column < 1
+            or self.get_columns_count() < column
+        ):
+            raise XlFormArgumentException()
+        return CellOpenpyxlReadOnly(
+            self._range[row - 1][column - 1],
+            self._row + row - 1,
+            self._column + column - 1,
+            self._tracer,
+        )
+
+    def get_columns_count(self) -> int:
+        return len(self._range[0])
+
+    def get_rows_count(self) -> int:
+        return len(self._range)
+
+    def get_values(self, row: int = 1) -> List[List[CellValue]]:
+        if row < 1:
+            raise XlFormArgumentException()
+        start = row - 1
+        rows = self._range[start:]
+        self._tracer.count(CELLS_READ, len(rows) * self.get_columns_count())
+        return [[_get_value(c.value) for c in r] for r in rows]
+
+    def get_values_or_none(
+        self, row: int = 1
+    ) -> List[List[Optional[CellValue]]]:
+        if row < 1:
+            raise XlFormArgumentException()
+        start = row - 1
+        rows = self._range[start:]
+        self._tracer.count(CELLS_READ, len(rows) * self.get_columns_count())
+        return [[_get_value_or_none(c.value) for c in r] for r in rows]
+
+    def set_values(self, values: List[List[CellValue]], row: int = 1) -> None:
+        raise XlFormNotImplementedException()
+
+    def dump(self, row: int = 1) -> Dict[str, List[Any]]:
+        if row < 1:
+            raise XlFormArgumentException()
+        start = row - 1
+        self._tracer.count(
+            CELLS_READ,
+            (self.get_rows_count() - start) * self.get_columns_count(),
+        )
+        return _dump_cells(
+            self._range[start:],
+            self._row + start,
+            self._column,
+            self.get_columns_count(),
+        )
+
+
+class SheetOpenpyxlReadOnly(Sheet):
+    def __init__(self, sheet: Any, tracer: Tracer = NULL_TRACER) -> None:
+        self._sheet = sheet
+        self._tracer = tracer
+        tracer.count(WRAPPERS)
+
+    def get_tracer(self) -> Tracer:
+        return self._tracer
+
+    def get_name(self) -> str:
+        return cast(str, self._sheet.title)
+
+    def get_cell(self, row: int, column: int) -> Cell:
+        if row < 1 or column < 1:
+            raise XlFormArgumentException()
+        return CellOpenpyxlReadOnly(
+            self._sheet.cell(row=row, column=column), row, column, self._tracer
+        )
+
+    def get_range(self, arg: str) -> Range:
+        try:
+            boundaries = openpyxl.utils.cell.range_boundaries(arg)
+        except ValueError as e:
+            raise XlFormArgumentException("Illegal range: %s" % (e))
+        min_col, min_row, max_col, max_row = boundaries
+        if min_row is None:
+            min_row, max_row = 1, self._sheet.max_row  # '1:1'
+        if min_col is None:
+            min_col, max_col = 1, self._sheet.max_column  # 'A:A'
+
+        # Only the rows of the range are parsed from the worksheet.
+        r = tuple(
+            self._sheet.iter_rows(
+                min_row=min_row,
+                max_row=max_row,
+                min_col=min_col,
+                max_col=max_col,
+            )
+        )
+        # The rows after the last row of the worksheet are not yielded.
+        empty_row = (openpyxl.cell.read_only.EMPTY_CELL,) * (
+            max_col - min_col + 1
+        )
+        r += (empty_row,) * (max_row - min_row + 1 - len(r))
+        if len(r) == 0:
+            raise XlFormArgumentException()
+        return RangeOpenpyxlReadOnly(r, min_row, min_col, self._tracer)
+
+    def get_max_row(self) -> int:
+        return cast(int, self._sheet.max_row)
+
+    def iter_values(
+        self,
+        min_row: int,
+        min_column: int,
+        max_column: int,
+        max_row: Optional[int] = None,
+    ) -> Iterator[List[Optional[CellValue]]]:
+        if min_row < 1 or min_column < 1 or max_column < min_column:
+            raise XlFormArgumentException()
+        # The rows are parsed from the worksheet as they are iterated.
+        for r in self._sheet.iter_rows(
+            min_row=min_row,
+            max_row=max_row,
+            min_col=min_column,
+            max_col=max_column,
+            values_only=True,
+        ):
+            self._tracer.count(CELLS_READ, len(r))
+            yield [_get_value_or_none(value) for value in r]
+
+    def protect(self) -> None:
+        raise XlFormNotImplementedException()
+
+    def unprotect(self) -> None:
+        raise XlFormNotImplementedException()
+
+
+class BookOpenpyxlReadOnly(BookOpenpyxl):
+    def _new_sheet(self, sheet: Any) -> Sheet:
+        return SheetOpenpyxlReadOnly(sheet, self._tracer)
+
+    def save(self, path: BookTarget) -> None:
+        raise XlFormNotImplementedException()
+
+    def add_sheet(self, name: str) -> None:
+        raise XlFormNotImplementedException()
+
+
+class EngineOpenpyxlReadOnly(Engine):
+    """Engine with openpyxl's read-only mode
+
+    Worksheets are parsed lazily when ranges are requested, so the whole
+    book is never held in memory. Books can't be modified.
+    """
+
+    def __init__(self, tracer: Tracer = NULL_TRACER) -> None:
+        self.set_tracer(tracer)
+
+    def get_cell_attributes(self) -> FrozenSet[CellAttribute]:
+        return _CELL_ATTRIBUTES
 
     def new_book(self) -> Book:
-        wb = openpyxl.Workbook()
-        assert wb.sheetnames == ["Sheet"]
-        wb["Sheet"].title = "Sheet1"
-        return BookOpenpyxl(wb)
+        raise XlFormNotImplementedException()
+
+    def open_book(
+        self, path: BookSource, sheets: Optional[Iterable[str]] = None
+    ) -> Book:
+        tracer = self.get_tracer()
+        with tracer.span(SPAN_OPEN_BOOK):
+            wb = openpyxl.load_workbook(get_book_file(path), read_only=True)
+            sheet_names = wb.sheetnames
+            loaded = get_loaded_sheet_names(sheet_names, sheets)
+            for name in sheet_names:
+                if name not in loaded:
+                    wb.remove(wb[name])
+            return BookOpenpyxlReadOnly(wb, tracer, sheet_names)
+
+
+class CellOpenpyxlWriteOnly(Cell):
+    def __init__(
+        self, sheet: "SheetOpenpyxlWriteOnly", row: int, column: int
+    ) -> None:
+        self._sheet = sheet
+        self._row = row
+        self._column = column
+        sheet.get_tracer().count(WRAPPERS)
+
+    def get_tracer(self) -> Tracer:
+        return self._sheet.get_tracer()
+
+    def get_row(self) -> int:
+        return self._row
+
+    def get_column(self) -> int:
+        return self._column
+
+    def get_address(
+        self, column_absolute: bool = True, row_absolute: bool = True
+    ) -> str:
+        return "%s%s%s%d" % (
+            "$" if column_absolute else "",
+            openpyxl.utils.cell.get_column_letter(self._column),
+            "$" if row_absolute else "",
+            self._row,
+        )
+
+    def get_attributes(self) -> FrozenSet[CellAttribute]:
+        return frozenset()
+
+    def set_value(self, value: CellValue) -> None:
+        self._sheet.write_value(self._row, self._column, value)
+
+
+class RangeOpenpyxlWriteOnly(Range):
+    def __init__(
+        self,
+        sheet: "SheetOpenpyxlWriteOnly",
+        min_row: int,
+        min_column: int,
+        max_row: int,
+        max_column: int,
+    ) -> None:
+        self._sheet = sheet
+        self._min_row = min_row
+        self._min_column = min_column
+        self._max_row = max_row
+        self._max_column = max_column
+        sheet.get_tracer().count(WRAPPERS)
+
+    def get_tracer(self) -> Tracer:
+        return self._sheet.get_tracer()
+
+    def get_cell(self, row: int, column: int) -> Cell:
+        if (
+            row < 1
+            or self.get_rows_count() < row
+            or column < 1
+            or self.get_columns_count() < column
+        ):
+            raise XlFormArgumentException()
+        return CellOpenpyxlWriteOnly(
+            self._sheet, self._min_row + row - 1, self._min_column + column - 1
+        )
 
-    def open_book(self, path: Path) -> Book:
-        return BookOpenpyxl(openpyxl.load_workbook(str(path.resolve())))
+    def get_columns_count(self) -> int:
+        return self._max_column - self._min_column + 1
+
+    def get_rows_count(self) -> int:
+        return self._max_row - self._min_row + 1
+
+    def set_values(self, values: List[List[CellValue]], row: int = 1) -> None:
+        check_range_values(self, values, row)
+        for row_index, row_values in enumerate(
+            values, start=self._min_row + row - 1
+        ):
+            for col_index, value in enumerate(
+                row_values, start=self._min_column
+            ):
+                self._sheet.write_value(row_index, col_index, value)
+
+
+class SheetOpenpyxlWriteOnly(Sheet):
+    """Sheet of a write-only book
+
+    Values must be written row by row from top to bottom. Only the row
+    being written is kept in memory; it is appended to the worksheet as
+    soon as a value is written to a lower row.
+    """
+
+    def __init__(self, sheet: Any, tracer: Tracer = NULL_TRACER) -> None:
+        self._sheet = sheet
+        self._tracer = tracer
+        self._appended_rows_count = 0
+        self._pending_row: Optional[int] = None
+        self._pending_values: Dict[int, CellValue] = dict()
+        tracer.count(WRAPPERS)
+
+    def get_tracer(self) -> Tracer:
+        return self._tracer
+
+    def get_name(self) -> str:
+        return cast(str, self._sheet.title)
+
+    def get_cell(self, row: int, column: int) -> Cell:
+        if row < 1 or column < 1:
+            raise XlFormArgumentException()
+        return CellOpenpyxlWriteOnly(self, row, column)
+
+    def get_range(self, arg: str) -> Range:
+        try:
+            boundaries = openpyxl.utils.cell.range_boundaries(arg)
+        except ValueError as e:
+            raise XlFormArgumentException("Illegal range: %s" % (e))
+        min_col, min_row, max_col, max_row = boundaries
+        if min_row is None or min_col is None:
+            raise XlFormArgumentException(
+                "Unbounded range is not supported: %s" % (arg)
+            )
+        return RangeOpenpyxlWriteOnly(self, min_row, min_col, max_row, max_col)
+
+    def write_value(self, row: int, column: int, value: CellValue) -> None:
+        """Write value
+
+        Args:
+            row (int): Row index starting from 1
+            column (int): Column index starting from 1
+            value (CellValue): Cell value
+        """
+        if row <= self._appended_rows_count:
+            raise XlFormArgumentException(
+                "Row %d has already been written." % (row)
+            )
+        if self._pending_row is not None and row < self._pending_row:
+            raise XlFormArgumentException(
+                "Row %d is above row %d being written."
+                % (row, self._pending_row)
+            )
+        if self._pending_row is not None and self._pending_row < row:
+            self.flush()
+        self._tracer.count(CELLS_WRITTEN)
+        self._pending_row = row
+        self._pending_values[column] = value
+
+    def flush(self) -> None:
+        """Append the row being written to the worksheet"""
+        if self._pending_row is None:
+            return
+        while self._appended_rows_count < self._pending_row - 1:
+            self._sheet.append([])
+            self._appended_rows_count += 1
+        row: List[Optional[CellValue]] = [None] * max(self._pending_values)
+        for column, value in self._pending_values.items():
+            row[column - 1] = value
+        self._sheet.append(row)
+        self._appended_rows_count += 1
+        self._pending_row = None
+        self._pending_values = dict()
+
+    def protect(self) -> None:
+        raise XlFormNotImplementedException()
+
+    def unprotect(self) -> None:
+        raise XlFormNotImplementedException()
+
+
+class BookOpenpyxlWriteOnly(BookOpenpyxl):
+    def get_cell_attributes(self) -> FrozenSet[CellAttribute]:
+        return frozenset()
+
+    def _new_sheet(self, sheet: Any) -> Sheet:
+        return SheetOpenpyxlWriteOnly(sheet, self._tracer)
+
+    def save(self, path: BookTarget) -> None:
+        with self._tracer.span(SPAN_SAVE):
+            for sheet in self._sheet_dic.values():
+                cast(SheetOpenpyxlWriteOnly, sheet).flush()
+            self._book.save(get_book_target(path))
+
+
+class EngineOpenpyxlWriteOnly(Engine):
+    """Engine with openpyxl's write-only mode
+
+    Rows are streamed to the file while they are written, so the memory
+    usage doesn't depend on the size of the book. Values can't be read,
+    and a book can be saved only once. The form items write their headers
+    with the values, since the headers can't be validated.
+    """
+
+    def __init__(self, tracer: Tracer = NULL_TRACER) -> None:
+        self.set_tracer(tracer)
+
+    def get_cell_attributes(self) -> FrozenSet[CellAttribute]:
+        return frozenset()
+
+    def new_book(self) -> Book:
+        tracer = self.get_tracer()
+        with tracer.span(SPAN_NEW_BOOK):
+            wb = openpyxl.Workbook(write_only=True)
+            wb.create_sheet("Sheet1")
+            return BookOpenpyxlWriteOnly(wb, tracer)
+
+    def open_book(
+        self, path: BookSource, sheets: Optional[Iterable[str]] = None
+    ) -> Book:
+        raise XlFormNotImplementedException()
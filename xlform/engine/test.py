@@ -1,5 +1,6 @@
 from pathlib import Path
 from typing import Any
+from typing import Iterable
 from typing import List
 from typing import Optional
 from typing import Tuple
@@ -7,12 +8,16 @@ from typing import Union
 from unittest import TestLoader
 from unittest import TestSuite
 from xlform.engine.base import Book
+from xlform.engine.base import BookSource
 from xlform.engine.base import Cell
 from xlform.engine.base import Engine
 from xlform.engine.base import Range
 from xlform.engine.base import Sheet
 from xlform.exception import XlFormArgumentException
 from xlform.exception import XlFormNotImplementedException
+from xlform.exception import XlFormRuntimeException
+import io
+import mmap
 import openpyxl  # type: ignore
 import tempfile
 import unittest
@@ -24,7 +29,9 @@ class EngineTestCase(unittest.TestCase):
             def new_book(self) -> Book:
                 pass
 
-            def open_book(self, path: Path) -> Book:
+            def open_book(
+                self, path: BookSource, sheets: Optional[Iterable[str]] = None
+            ) -> Book:
                 pass
 
         self._engine: Engine = FakeEngine()
@@ -100,6 +107,36 @@ class EngineTestCase(unittest.TestCase):
         self.assertIsInstance(sheets[0], Sheet)
         self.assertEqual(sheets[0].get_name(), "Sheet")
 
+    def test_engine_open_book__buffer(self) -> None:
+        path = self._get_a1_zero_book_path(prefix="test_engine_open_book")
+        data = path.read_bytes()
+
+        sources: List[BookSource] = [data, bytearray(data), memoryview(data)]
+        for source in sources:
+            book: Book = self._engine.open_book(source)
+            sheet: Sheet = book.get_sheet("Sheet")
+            self.assertEqual(sheet.get_range("A1").get_values(), [[0]])
+            book.close()
+
+    def test_engine_open_book__file(self) -> None:
+        path = self._get_a1_zero_book_path(prefix="test_engine_open_book")
+
+        with path.open("rb") as f:
+            book: Book = self._engine.open_book(f)
+            sheet: Sheet = book.get_sheet("Sheet")
+            self.assertEqual(sheet.get_range("A1").get_values(), [[0]])
+            book.close()
+
+    def test_engine_open_book__mmap(self) -> None:
+        path = self._get_a1_zero_book_path(prefix="test_engine_open_book")
+
+        with path.open("rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                book: Book = self._engine.open_book(m)
+                sheet: Sheet = book.get_sheet("Sheet")
+                self.assertEqual(sheet.get_range("A1").get_values(), [[0]])
+                book.close()
+
     def test_book_save__file_exists(self) -> None:
         path = self._get_a1_zero_book_path(prefix="test_book_save")
 
@@ -119,6 +156,32 @@ class EngineTestCase(unittest.TestCase):
         ws = wb.active
         self.assertEqual(ws["A1"].value, 0)
 
+    def test_book_save__stream(self) -> None:
+        path = self._get_a1_zero_book_path(prefix="test_book_save")
+        book: Book = self._engine.open_book(path)
+        f = io.BytesIO()
+        book.save(f)
+
+        wb = openpyxl.load_workbook(io.BytesIO(f.getvalue()))
+        self.assertEqual(wb.active["A1"].value, 0)
+
+    def test_book_save_bytes(self) -> None:
+        path = self._get_a1_zero_book_path(prefix="test_book_save")
+        book: Book = self._engine.open_book(path)
+        data = book.save_bytes()
+
+        wb = openpyxl.load_workbook(io.BytesIO(data))
+        self.assertEqual(wb.active["A1"].value, 0)
+
+    def test_book_get_cell_attributes(self) -> None:
+        path = self._get_a1_zero_book_path(prefix="test_book_close")
+
+        book: Book = self._engine.open_book(path)
+        self.assertEqual(
+            book.get_cell_attributes(), self._engine.get_cell_attributes()
+        )
+        book.close()
+
     def test_book_close(self) -> None:
         path = self._get_a1_zero_book_path(prefix="test_book_close")
 
@@ -158,6 +221,52 @@ class EngineTestCase(unittest.TestCase):
         self.assertIsInstance(sheets[1], Sheet)
         self.assertEqual(sheets[1].get_name(), "Sheet2")
 
+    def test_book_get_sheet(self) -> None:
+        path = self._get_a1_zero_book_path(prefix="test_book_get_sheet")
+
+        wb = openpyxl.load_workbook(str(path))
+        wb.create_sheet("Sheet2")
+        wb.save(str(path))
+        wb.close()
+
+        book: Book = self._engine.open_book(path)
+        sheet: Sheet = book.get_sheet("Sheet2")
+
+        self.assertIsInstance(sheet, Sheet)
+        self.assertEqual(sheet.get_name(), "Sheet2")
+
+    def test_book_get_sheet__not_found(self) -> None:
+        path = self._get_a1_zero_book_path(prefix="test_book_get_sheet")
+
+        book: Book = self._engine.open_book(path)
+        with self.assertRaises(XlFormArgumentException):
+            book.get_sheet("Sheet2")
+
+    def test_engine_open_book__sheets(self) -> None:
+        path = self._get_a1_zero_book_path(prefix="test_engine_open_book")
+
+        wb = openpyxl.load_workbook(str(path))
+        wb.create_sheet("Sheet2")["A1"] = 1
+        wb.save(str(path))
+        wb.close()
+
+        book: Book = self._engine.open_book(path, sheets=["Sheet2"])
+        sheets: List[Sheet] = book.get_sheets()
+
+        self.assertEqual([s.get_name() for s in sheets], ["Sheet", "Sheet2"])
+        self.assertFalse(sheets[0].is_loaded())
+        self.assertTrue(sheets[1].is_loaded())
+        self.assertEqual(sheets[1].get_range("A1").get_values(), [[1]])
+        with self.assertRaises(XlFormRuntimeException):
+            book.get_sheet("Sheet").get_range("A1")
+        book.close()
+
+    def test_engine_open_book__sheets_not_found(self) -> None:
+        path = self._get_a1_zero_book_path(prefix="test_engine_open_book")
+
+        with self.assertRaises(XlFormArgumentException):
+            self._engine.open_book(path, sheets=["Sheet2"])
+
     def test_book_add_sheet(self) -> None:
         path = self._get_a1_zero_book_path(prefix="test_book_add_sheet")
 
@@ -342,6 +451,121 @@ class EngineTestCase(unittest.TestCase):
         with self.assertRaises(XlFormArgumentException):
             r.get_cell(3, 1)
 
+    def test_range_get_values(self) -> None:
+        path = self._get_book_path(
+            rows=[[11, 12, 13], [21, 22, 23], [31, 32, 33]],
+            prefix="test_range_get_values",
+        )
+
+        book: Book = self._engine.open_book(path)
+        sheets: List[Sheet] = book.get_sheets()
+        sheet: Sheet = sheets[0]
+        r: Range = sheet.get_range("B2:C3")
+
+        self.assertEqual(r.get_values(), [[22, 23], [32, 33]])
+
+    def test_range_get_values__row(self) -> None:
+        path = self._get_book_path(
+            rows=[[11, 12, 13], [21, 22, 23], [31, 32, 33]],
+            prefix="test_range_get_values",
+        )
+
+        book: Book = self._engine.open_book(path)
+        sheets: List[Sheet] = book.get_sheets()
+        sheet: Sheet = sheets[0]
+        r: Range = sheet.get_range("A1:C3")
+
+        self.assertEqual(r.get_values(3), [[31, 32, 33]])
+
+    def test_range_get_values_or_none(self) -> None:
+        path = self._get_book_path(
+            rows=[[11, 12, 13], [21, 22, 23]],
+            prefix="test_range_get_values_or_none",
+        )
+
+        book: Book = self._engine.open_book(path)
+        sheets: List[Sheet] = book.get_sheets()
+        sheet: Sheet = sheets[0]
+        r: Range = sheet.get_range("B2:D3")
+
+        self.assertEqual(
+            r.get_values_or_none(), [[22, 23, None], [None, None, None]]
+        )
+        self.assertEqual(r.get_values_or_none(2), [[None, None, None]])
+
+    def test_sheet_iter_values(self) -> None:
+        path = self._get_book_path(
+            rows=[[11, 12, 13], [21, 22, 23], [31, 32, 33]],
+            prefix="test_sheet_iter_values",
+        )
+
+        book: Book = self._engine.open_book(path)
+        sheet: Sheet = book.get_sheets()[0]
+
+        self.assertEqual(
+            list(sheet.iter_values(2, 2, 4)), [[22, 23, None], [32, 33, None]]
+        )
+        self.assertEqual(list(sheet.iter_values(1, 1, 1, 2)), [[11], [21]])
+
+    def test_range_set_values(self) -> None:
+        path = self._get_book_path(
+            rows=[[11, 12, 13], [21, 22, 23], [31, 32, 33]],
+            prefix="test_range_set_values",
+        )
+
+        book: Book = self._engine.open_book(path)
+        sheets: List[Sheet] = book.get_sheets()
+        sheet: Sheet = sheets[0]
+        r: Range = sheet.get_range("A1:B3")
+        r.set_values([[1, 2], [3, 4]], 2)
+
+        self.assertEqual(r.get_values(), [[11, 12], [1, 2], [3, 4]])
+        self.assertEqual(sheet.get_cell(2, 3).get_value(), 23)
+
+    def test_range_set_values__out_of_range(self) -> None:
+        path = self._get_book_path(
+            rows=[[11, 12], [21, 22]], prefix="test_range_set_values"
+        )
+
+        book: Book = self._engine.open_book(path)
+        sheets: List[Sheet] = book.get_sheets()
+        sheet: Sheet = sheets[0]
+        r: Range = sheet.get_range("A1:B2")
+        with self.assertRaises(XlFormArgumentException):
+            r.set_values([[1, 2], [3, 4]], 2)
+        with self.assertRaises(XlFormArgumentException):
+            r.set_values([[1, 2, 3]])
+
+    def test_range_dump(self) -> None:
+        path = self._get_book_path(
+            rows=[[11, 12], [21, 22], [31, 32]], prefix="test_range_dump"
+        )
+
+        book: Book = self._engine.open_book(path)
+        sheets: List[Sheet] = book.get_sheets()
+        sheet: Sheet = sheets[0]
+        r: Range = sheet.get_range("A1:B3")
+        dump = r.dump(2)
+
+        self.assertEqual(dump["address"], ["A2", "B2", "A3", "B3"])
+        self.assertEqual(dump["value"], [21, 22, 31, 32])
+
+    def test_cell_get_attributes(self) -> None:
+        path = self._get_book_path(
+            rows=[[1, "=1+1", "a"]], prefix="test_cell_get_attributes"
+        )
+
+        book: Book = self._engine.open_book(path)
+        sheets: List[Sheet] = book.get_sheets()
+        sheet: Sheet = sheets[0]
+        engine_attributes = self._engine.get_cell_attributes()
+        for column in range(1, 5):
+            c: Cell = sheet.get_cell(1, column)
+            attributes = c.get_attributes()
+            self.assertTrue(attributes <= engine_attributes)
+            for attribute in attributes:
+                c.get_attribute(attribute)
+
     def test_cell_get_formula__simple_formula(self) -> None:
         path = self._get_book_path(
             rows=[["=1+1"]], prefix="test_cell_get_formula"
@@ -532,7 +756,7 @@ class EngineTestCase(unittest.TestCase):
         pass
 
 
-def load_tests(loader: TestLoader, test_cases: Tuple[Any]) -> TestSuite:
+def load_tests(loader: TestLoader, test_cases: Tuple[Any, ...]) -> TestSuite:
     suite = unittest.TestSuite()
     for test_class in test_cases:
         tests = loader.loadTestsFromTestCase(test_class)
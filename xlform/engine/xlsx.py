@@ -0,0 +1,811 @@
+from openpyxl.formula.translate import Translator  # type: ignore
+from openpyxl.styles.numbers import BUILTIN_FORMATS  # type: ignore
+from openpyxl.styles.numbers import is_date_format
+from openpyxl.utils.datetime import CALENDAR_MAC_1904  # type: ignore
+from openpyxl.utils.datetime import CALENDAR_WINDOWS_1900
+from openpyxl.utils.datetime import from_excel
+from openpyxl.utils.datetime import from_ISO8601
+from typing import Any
+from typing import cast
+from typing import Dict
+from typing import FrozenSet
+from typing import Generator
+from typing import IO
+from typing import Iterable
+from typing import Iterator
+from typing import List
+from typing import Optional
+from typing import Tuple
+from xlform.engine.base import Book
+from xlform.engine.base import BookSource
+from xlform.engine.base import BookTarget
+from xlform.engine.base import Cell
+from xlform.engine.base import CellAttribute
+from xlform.engine.base import CellValue
+from xlform.engine.base import Engine
+from xlform.engine.base import get_book_file
+from xlform.engine.base import get_column_index
+from xlform.engine.base import get_column_letter
+from xlform.engine.base import get_loaded_sheet_names
+from xlform.engine.base import parse_range_arg
+from xlform.engine.base import Range
+from xlform.engine.base import safe_cast_cell_value
+from xlform.engine.base import Sheet
+from xlform.engine.base import UnloadedSheet
+from xlform.exception import XlFormArgumentException
+from xlform.exception import XlFormNotImplementedException
+from xlform.trace import CELLS_READ
+from xlform.trace import NULL_TRACER
+from xlform.trace import SPAN_OPEN_BOOK
+from xlform.trace import Tracer
+from xlform.trace import WRAPPERS
+import datetime
+import posixpath
+import xml.etree.ElementTree as ElementTree
+import zipfile
+
+_MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+_DOC_REL_NS = (
+    "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+)
+
+_OFFICE_DOCUMENT_TYPE = "/officeDocument"
+_SHARED_STRINGS_TYPE = "/sharedStrings"
+_STYLES_TYPE = "/styles"
+
+_C = _MAIN_NS + "c"
+_CELL_XFS = _MAIN_NS + "cellXfs"
+_DIMENSION = _MAIN_NS + "dimension"
+_F = _MAIN_NS + "f"
+_IS = _MAIN_NS + "is"
+_NUM_FMT = _MAIN_NS + "numFmt"
+_R = _MAIN_NS + "r"
+_ROW = _MAIN_NS + "row"
+_SHEET = _MAIN_NS + "sheet"
+_SHEET_DATA = _MAIN_NS + "sheetData"
+_SI = _MAIN_NS + "si"
+_T = _MAIN_NS + "t"
+_V = _MAIN_NS + "v"
+_WORKBOOK_PR = _MAIN_NS + "workbookPr"
+_XF = _MAIN_NS + "xf"
+
+_CELL_ATTRIBUTES = frozenset(
+    [CellAttribute.FORMULA, CellAttribute.VALUE, CellAttribute.NUMBER_FORMAT]
+)
+_FORMULA_CELL_ATTRIBUTES = frozenset(
+    [CellAttribute.FORMULA, CellAttribute.NUMBER_FORMAT]
+)
+_EMPTY_CELL_ATTRIBUTES = frozenset([CellAttribute.NUMBER_FORMAT])
+
+_GENERAL_NUMBER_FORMAT = "General"
+
+# Raw values and style indexes of the cells of a row.
+_RawRow = Tuple[List[Any], List[int]]
+
+# Minimum rows count of the rows cached for the single cells.
+_CELL_ROWS_COUNT_MIN = 64
+
+
+def _get_attributes(raw_value: Any) -> FrozenSet[CellAttribute]:
+    if isinstance(raw_value, str) and raw_value.startswith("="):
+        return _FORMULA_CELL_ATTRIBUTES
+    if isinstance(raw_value, (str, float, int, datetime.datetime)):
+        return _CELL_ATTRIBUTES
+    return _EMPTY_CELL_ATTRIBUTES
+
+
+def _get_value(raw_value: Any) -> CellValue:
+    value = safe_cast_cell_value(raw_value)
+    if isinstance(value, str) and value.startswith("="):
+        raise XlFormNotImplementedException()
+    return value
+
+
+def _get_value_or_none(raw_value: Any) -> Optional[CellValue]:
+    if CellAttribute.VALUE in _get_attributes(raw_value):
+        return safe_cast_cell_value(raw_value)
+    return None
+
+
+def _get_text(elem: Any) -> str:
+    # Text of a string item, with the runs of a rich text and without the
+    # phonetic runs.
+    t = elem.find(_T)
+    if t is not None:
+        return t.text or ""
+    return "".join(r.findtext(_T, "") for r in elem.iterfind(_R))
+
+
+def _get_number(text: str) -> Any:
+    if "." in text or "E" in text or "e" in text:
+        return float(text)
+    return int(text)
+
+
+def _resolve_target(source: str, target: str) -> str:
+    if target.startswith("/"):
+        return target[1:]
+    return posixpath.normpath(
+        posixpath.join(posixpath.dirname(source), target)
+    )
+
+
+def _get_rels_part(part: str) -> str:
+    directory, name = posixpath.split(part)
+    return posixpath.join(directory, "_rels", name + ".rels")
+
+
+class CellXlsx(Cell):
+    __slots__ = ("_book", "_raw_value", "_style", "_row", "_column")
+
+    def __init__(
+        self,
+        book: "BookXlsx",
+        raw_value: Any,
+        style: int,
+        row: int,
+        column: int,
+    ) -> None:
+        self._book = book
+        self._raw_value = raw_value
+        self._style = style
+        self._row = row
+        self._column = column
+        book.get_tracer().count(WRAPPERS)
+
+    def get_tracer(self) -> Tracer:
+        return self._book.get_tracer()
+
+    def get_row(self) -> int:
+        return self._row
+
+    def get_column(self) -> int:
+        return self._column
+
+    def get_formula(self) -> CellValue:
+        return safe_cast_cell_value(self._raw_value)
+
+    def get_value(self) -> CellValue:
+        self._book.get_tracer().count(CELLS_READ)
+        return _get_value(self._raw_value)
+
+    def get_number_format(self) -> str:
+        return self._book.get_number_format(self._style)
+
+    def get_text(self) -> str:
+        raise XlFormNotImplementedException()
+
+    def get_attributes(self) -> FrozenSet[CellAttribute]:
+        return _get_attributes(self._raw_value)
+
+    def get_address(
+        self, column_absolute: bool = True, row_absolute: bool = True
+    ) -> str:
+        return "%s%s%s%d" % (
+            "$" if column_absolute else "",
+            get_column_letter(self._column),
+            "$" if row_absolute else "",
+            self._row,
+        )
+
+    def set_value(self, value: CellValue) -> None:
+        raise XlFormNotImplementedException()
+
+
+class RangeXlsx(Range):
+    def __init__(
+        self,
+        book: "BookXlsx",
+        raw_rows: List[_RawRow],
+        min_row: int,
+        min_column: int,
+    ) -> None:
+        if len(raw_rows) == 0 or len(raw_rows[0][0]) == 0:
+            raise XlFormArgumentException()
+        self._book = book
+        self._raw_rows = raw_rows
+        self._min_row = min_row
+        self._min_column = min_column
+        book.get_tracer().count(WRAPPERS)
+
+    def get_tracer(self) -> Tracer:
+        return self._book.get_tracer()
+
+    def get_rows_count(self) -> int:
+        return len(self._raw_rows)
+
+    def get_columns_count(self) -> int:
+        return len(self._raw_rows[0][0])
+
+    def get_cell(self, row: int, column: int) -> Cell:
+        if (
+            row < 1
+            or self.get_rows_count() < row
+            or column < 1
+            or self.get_columns_count() < column
+        ):
+            raise XlFormArgumentException()
+        raw_values, styles = self._raw_rows[row - 1]
+        return CellXlsx(
+            self._book,
+            raw_values[column - 1],
+            styles[column - 1],
+            self._min_row + row - 1,
+            self._min_column + column - 1,
+        )
+
+    def get_values(self, row: int = 1) -> List[List[CellValue]]:
+        if row < 1:
+            raise XlFormArgumentException()
+        start = row - 1
+        rows = self._raw_rows[start:]
+        self.get_tracer().count(
+            CELLS_READ, len(rows) * self.get_columns_count()
+        )
+        return [[_get_value(v) for v in raw_values] for raw_values, _ in rows]
+
+    def get_values_or_none(
+        self, row: int = 1
+    ) -> List[List[Optional[CellValue]]]:
+        if row < 1:
+            raise XlFormArgumentException()
+        start = row - 1
+        rows = self._raw_rows[start:]
+        self.get_tracer().count(
+            CELLS_READ, len(rows) * self.get_columns_count()
+        )
+        return [
+            [_get_value_or_none(v) for v in raw_values]
+            for raw_values, _ in rows
+        ]
+
+    def set_values(self, values: List[List[CellValue]], row: int = 1) -> None:
+        raise XlFormNotImplementedException()
+
+    def dump(self, row: int = 1) -> Dict[str, List[Any]]:
+        if row < 1:
+            raise XlFormArgumentException()
+        column_letters = [
+            get_column_letter(col_index)
+            for col_index in range(
+                self._min_column, self._min_column + self.get_columns_count()
+            )
+        ]
+        address: List[str] = list()
+        formula: List[Any] = list()
+        value: List[Any] = list()
+        number_format: List[str] = list()
+        start = row - 1
+        for row_index, (raw_values, styles) in enumerate(
+            self._raw_rows[start:], self._min_row + start
+        ):
+            for column_letter, raw_value, style in zip(
+                column_letters, raw_values, styles
+            ):
+                address.append("%s%d" % (column_letter, row_index))
+                attributes = _get_attributes(raw_value)
+                if CellAttribute.FORMULA in attributes:
+                    formula.append(raw_value)
+                else:
+                    formula.append(None)
+                if CellAttribute.VALUE in attributes:
+                    value.append(raw_value)
+                else:
+                    value.append(None)
+                number_format.append(self._book.get_number_format(style))
+        self.get_tracer().count(CELLS_READ, len(address))
+        return {
+            "address": address,
+            CellAttribute.FORMULA.value: formula,
+            CellAttribute.VALUE.value: value,
+            CellAttribute.NUMBER_FORMAT.value: number_format,
+        }
+
+
+class SheetXlsx(Sheet):
+    def __init__(self, book: "BookXlsx", name: str, part: str) -> None:
+        """Sheet read from the worksheet part on demand
+
+        Each request of ranges parses the part from the beginning, and stops
+        after the last row of the request. The rows before the first row of
+        the request are skipped without decoding their values.
+
+        The single cells are read from the rows cached by get_cell(). A read
+        below the cached rows parses the part again, and caches at least
+        twice as many rows, so the reads of the cells of a form parse the
+        part a few times in all.
+
+        Args:
+            book (BookXlsx): Book
+            name (str): Sheet name
+            part (str): Name of the worksheet part in the zip file
+        """
+        self._book = book
+        self._name = name
+        self._part = part
+        self._dimension: Optional[Tuple[int, int]] = None
+        self._cell_row_dic: Dict[int, _RawRow] = dict()
+        self._cell_max_row = 0
+        book.get_tracer().count(WRAPPERS)
+
+    def get_tracer(self) -> Tracer:
+        return self._book.get_tracer()
+
+    def get_name(self) -> str:
+        return self._name
+
+    def _get_dimension(self) -> Tuple[int, int]:
+        # The last row and the last column, from the dimension of the
+        # worksheet if it is written before the cells.
+        if self._dimension is not None:
+            return self._dimension
+        with self._book.open_part(self._part) as f:
+            for _, elem in ElementTree.iterparse(f, events=("start",)):
+                if elem.tag == _DIMENSION:
+                    ref = elem.get("ref", "")
+                    try:
+                        _, _, max_column, max_row = parse_range_arg(ref)
+                    except XlFormArgumentException:
+                        break
+                    if max_column is not None and max_row is not None:
+                        self._dimension = (max_row, max_column)
+                        return self._dimension
+                    break
+                if elem.tag == _SHEET_DATA:
+                    break
+        max_row, max_column = 0, 0
+        for row, raw_values, _ in self._iter_raw_rows(1, 1, None, None):
+            max_row = row
+            for column in range(len(raw_values), 0, -1):
+                if raw_values[column - 1] is not None:
+                    max_column = max(max_column, column)
+                    break
+        self._dimension = (max(max_row, 1), max(max_column, 1))
+        return self._dimension
+
+    def _iter_raw_rows(
+        self,
+        min_row: int,
+        min_column: int,
+        max_column: Optional[int],
+        max_row: Optional[int],
+    ) -> Iterator[Tuple[int, List[Any], List[int]]]:
+        # Yields the index, the raw values and the style indexes of the rows
+        # in the part. The rows without cells may be omitted.
+        book = self._book
+        shared_formula_dic: Dict[str, Tuple[str, str]] = dict()
+        with book.open_part(self._part) as f:
+            sheet_data = None
+            row_index = 0
+            column_index = 0
+            raw_values: Optional[List[Any]] = None
+            styles: List[int] = list()
+            for event, elem in ElementTree.iterparse(
+                f, events=("start", "end")
+            ):
+                tag = elem.tag
+                if event == "start":
+                    if tag == _ROW:
+                        r = elem.get("r")
+                        row_index = row_index + 1 if r is None else int(r)
+                        if max_row is not None and max_row < row_index:
+                            return
+                        column_index = 0
+                        raw_values = None
+                        if min_row <= row_index:
+                            raw_values, styles = list(), list()
+                    elif tag == _SHEET_DATA:
+                        sheet_data = elem
+                    continue
+                if tag == _C:
+                    ref = elem.get("r")
+                    if ref is None:
+                        column_index += 1
+                        ref = "%s%d" % (
+                            get_column_letter(column_index),
+                            row_index,
+                        )
+                    else:
+                        column_index = book.get_column_index(ref)
+                    f_elem = elem.find(_F)
+                    if f_elem is not None and f_elem.get("t") == "shared":
+                        si = f_elem.get("si", "")
+                        if f_elem.text:
+                            shared_formula_dic[si] = ("=" + f_elem.text, ref)
+                    if raw_values is None or column_index < min_column:
+                        continue
+                    if max_column is not None and max_column < column_index:
+                        continue
+                    position = column_index - min_column
+                    if len(raw_values) < position:
+                        raw_values.extend(
+                            [None] * (position - len(raw_values))
+                        )
+                        styles.extend([0] * (position - len(styles)))
+                    raw_values.append(
+                        self._get_raw_value(
+                            elem, f_elem, ref, shared_formula_dic
+                        )
+                    )
+                    styles.append(int(elem.get("s", "0")))
+                elif tag == _ROW:
+                    if raw_values is not None:
+                        yield row_index, raw_values, styles
+                    if sheet_data is not None:
+                        sheet_data.clear()  # Release the parsed rows.
+                elif tag == _SHEET_DATA:
+                    return
+
+    def _get_raw_value(
+        self,
+        elem: Any,
+        f_elem: Any,
+        ref: str,
+        shared_formula_dic: Dict[str, Tuple[str, str]],
+    ) -> Any:
+        if f_elem is not None:
+            if f_elem.text:
+                return "=" + f_elem.text
+            shared = shared_formula_dic.get(f_elem.get("si", ""))
+            if f_elem.get("t") == "shared" and shared is not None:
+                formula, origin = shared
+                return Translator(formula, origin=origin).translate_formula(
+                    ref
+                )
+        data_type = elem.get("t", "n")
+        if data_type == "inlineStr":
+            is_elem = elem.find(_IS)
+            return None if is_elem is None else _get_text(is_elem)
+        text = elem.findtext(_V)
+        if text is None or text == "":
+            return None
+        if data_type == "s":
+            return self._book.get_shared_string(int(text))
+        if data_type == "n":
+            number = _get_number(text)
+            style = int(elem.get("s", "0"))
+            if style != 0 and self._book.is_date_style(style):
+                return from_excel(number, self._book.get_epoch())
+            return number
+        if data_type == "b":
+            return bool(int(text))
+        if data_type == "d":
+            return from_ISO8601(text)
+        return text  # 'str' or 'e'
+
+    def _get_raw_rows(
+        self, min_row: int, min_column: int, max_row: int, max_column: int
+    ) -> List[_RawRow]:
+        columns_count = max_column - min_column + 1
+        raw_rows: List[_RawRow] = list()
+        for row_index, raw_values, styles in self._iter_raw_rows(
+            min_row, min_column, max_column, max_row
+        ):
+            while len(raw_rows) < row_index - min_row:
+                raw_rows.append(([None] * columns_count, [0] * columns_count))
+            missing = columns_count - len(raw_values)
+            raw_values.extend([None] * missing)
+            styles.extend([0] * missing)
+            raw_rows.append((raw_values, styles))
+        while len(raw_rows) < max_row - min_row + 1:
+            raw_rows.append(([None] * columns_count, [0] * columns_count))
+        return raw_rows
+
+    def get_cell(self, row: int, column: int) -> Cell:
+        if row < 1 or column < 1:
+            raise XlFormArgumentException()
+        if self._cell_max_row < row:
+            max_row = max(row, self._cell_max_row * 2, _CELL_ROWS_COUNT_MIN)
+            self._cell_row_dic = {
+                row_index: (raw_values, styles)
+                for row_index, raw_values, styles in self._iter_raw_rows(
+                    1, 1, None, max_row
+                )
+            }
+            self._cell_max_row = max_row
+        raw_values, styles = self._cell_row_dic.get(row, ([], []))
+        if len(raw_values) < column:
+            return CellXlsx(self._book, None, 0, row, column)
+        return CellXlsx(
+            self._book, raw_values[column - 1], styles[column - 1], row, column
+        )
+
+    def get_range(self, arg: str) -> Range:
+        min_column, min_row, max_column, max_row = parse_range_arg(arg)
+        if min_row is None:
+            min_row = 1  # 'A:A'
+        if max_row is None:
+            max_row = max(self.get_max_row(), min_row)  # 'A:A', 'A3:A'
+        if min_column is None or max_column is None:
+            min_column, max_column = 1, self._get_dimension()[1]  # '1:1'
+        return RangeXlsx(
+            self._book,
+            self._get_raw_rows(min_row, min_column, max_row, max_column),
+            min_row,
+            min_column,
+        )
+
+    def get_max_row(self) -> int:
+        return self._get_dimension()[0]
+
+    def iter_values(
+        self,
+        min_row: int,
+        min_column: int,
+        max_column: int,
+        max_row: Optional[int] = None,
+    ) -> Iterator[List[Optional[CellValue]]]:
+        if min_row < 1 or min_column < 1 or max_column < min_column:
+            raise XlFormArgumentException()
+        columns_count = max_column - min_column + 1
+        tracer = self.get_tracer()
+        next_row = min_row
+        for row_index, raw_values, _ in self._iter_raw_rows(
+            min_row, min_column, max_column, max_row
+        ):
+            while next_row < row_index:
+                tracer.count(CELLS_READ, columns_count)
+                yield [None] * columns_count
+                next_row += 1
+            values = [_get_value_or_none(v) for v in raw_values]
+            values.extend([None] * (columns_count - len(values)))
+            tracer.count(CELLS_READ, columns_count)
+            yield values
+            next_row += 1
+
+    def protect(self) -> None:
+        raise XlFormNotImplementedException()
+
+    def unprotect(self) -> None:
+        raise XlFormNotImplementedException()
+
+
+class BookXlsx(Book):
+    def __init__(
+        self,
+        zip_file: zipfile.ZipFile,
+        tracer: Tracer = NULL_TRACER,
+        sheets: Optional[Iterable[str]] = None,
+    ) -> None:
+        """Book read from the parts of a xlsx file on demand
+
+        Only the workbook part is parsed when the book is opened. The shared
+        strings are parsed as far as the strings are requested. The styles
+        are parsed up to the cell formats when a number format is requested,
+        or when the first number of a cell with a style is read, since the
+        style of a cell is an index of the cell formats, and the number
+        format tells if the number is a date.
+
+        Args:
+            zip_file (zipfile.ZipFile): Zip file of the book
+            tracer (Tracer, optional): Tracer
+            sheets (Optional[Iterable[str]]): Names of the sheets to load,
+            all sheets by default
+        """
+        self._zip_file = zip_file
+        self._tracer = tracer
+        self._column_index_dic: Dict[str, int] = dict()
+        self._shared_strings: List[str] = list()
+        self._shared_strings_iter: Optional[Generator[str, None, None]] = None
+        self._number_formats: Optional[List[str]] = None
+        self._date_styles: Optional[List[bool]] = None
+
+        workbook_part = self._get_part_dic("")[_OFFICE_DOCUMENT_TYPE]
+        self._part_dic = self._get_part_dic(workbook_part)
+        rel_dic = self._get_rel_dic(workbook_part)
+        self._epoch = CALENDAR_WINDOWS_1900
+        sheet_parts: List[Tuple[str, str]] = list()
+        with self.open_part(workbook_part) as f:
+            for _, elem in ElementTree.iterparse(f):
+                if elem.tag == _WORKBOOK_PR:
+                    if elem.get("date1904") in ("1", "true"):
+                        self._epoch = CALENDAR_MAC_1904
+                elif elem.tag == _SHEET:
+                    name = elem.get("name", "")
+                    part = rel_dic[elem.get(_DOC_REL_NS + "id", "")]
+                    sheet_parts.append((name, part))
+        loaded = get_loaded_sheet_names([n for n, _ in sheet_parts], sheets)
+        self._sheet_dic: Dict[str, Sheet] = dict()
+        for name, part in sheet_parts:
+            if name in loaded:
+                self._sheet_dic[name] = SheetXlsx(self, name, part)
+            else:
+                self._sheet_dic[name] = UnloadedSheet(name, tracer)
+
+    def open_part(self, part: str) -> IO[bytes]:
+        """Open a part of the zip file
+
+        Args:
+            part (str): Part name
+
+        Returns:
+            IO[bytes]: Stream of the part
+        """
+        return self._zip_file.open(part)
+
+    def _get_rel_dic(self, part: str) -> Dict[str, str]:
+        # Targets by the ids of the relationships of the part.
+        rel_dic: Dict[str, str] = dict()
+        with self.open_part(_get_rels_part(part)) as f:
+            for _, elem in ElementTree.iterparse(f):
+                if elem.tag == _REL_NS + "Relationship":
+                    target = _resolve_target(part, elem.get("Target", ""))
+                    rel_dic[elem.get("Id", "")] = target
+        return rel_dic
+
+    def _get_part_dic(self, part: str) -> Dict[str, str]:
+        # Targets by the suffixes of the types of the relationships.
+        part_dic: Dict[str, str] = dict()
+        with self.open_part(_get_rels_part(part)) as f:
+            for _, elem in ElementTree.iterparse(f):
+                if elem.tag == _REL_NS + "Relationship":
+                    rel_type = elem.get("Type", "")
+                    suffix = "/" + rel_type.rsplit("/", 1)[-1]
+                    target = _resolve_target(part, elem.get("Target", ""))
+                    part_dic.setdefault(suffix, target)
+        return part_dic
+
+    def get_tracer(self) -> Tracer:
+        return self._tracer
+
+    def get_cell_attributes(self) -> FrozenSet[CellAttribute]:
+        return _CELL_ATTRIBUTES
+
+    def get_epoch(self) -> datetime.datetime:
+        """Get the epoch of the dates"""
+        return cast(datetime.datetime, self._epoch)
+
+    def get_column_index(self, ref: str) -> int:
+        """Get the column index of a cell reference like 'B2'"""
+        letters = ref.rstrip("0123456789")
+        column = self._column_index_dic.get(letters)
+        if column is None:
+            column = get_column_index(letters)
+            self._column_index_dic[letters] = column
+        return column
+
+    def _iter_shared_strings(self) -> Generator[str, None, None]:
+        part = self._part_dic.get(_SHARED_STRINGS_TYPE)
+        if part is None:
+            return
+        with self.open_part(part) as f:
+            for _, elem in ElementTree.iterparse(f):
+                if elem.tag == _SI:
+                    yield _get_text(elem)
+                    elem.clear()
+
+    def get_shared_string(self, index: int) -> str:
+        """Get a shared string
+
+        The part of the shared strings is parsed up to the string.
+
+        Args:
+            index (int): Index of the string
+
+        Returns:
+            str: String
+        """
+        if self._shared_strings_iter is None:
+            self._shared_strings_iter = self._iter_shared_strings()
+        while len(self._shared_strings) <= index:
+            try:
+                self._shared_strings.append(next(self._shared_strings_iter))
+            except StopIteration:
+                raise XlFormArgumentException(
+                    "Shared string not found: %d" % (index)
+                )
+        return self._shared_strings[index]
+
+    def _load_styles(self) -> List[str]:
+        if self._number_formats is not None:
+            return self._number_formats
+        number_formats: List[str] = list()
+        part = self._part_dic.get(_STYLES_TYPE)
+        if part is not None:
+            custom_dic: Dict[int, str] = dict()
+            cell_xfs = None
+            with self.open_part(part) as f:
+                for event, elem in ElementTree.iterparse(
+                    f, events=("start", "end")
+                ):
+                    if event == "start":
+                        if elem.tag == _CELL_XFS:
+                            cell_xfs = elem
+                        continue
+                    if elem.tag == _NUM_FMT:
+                        custom_dic[int(elem.get("numFmtId", "0"))] = elem.get(
+                            "formatCode", _GENERAL_NUMBER_FORMAT
+                        )
+                    elif elem.tag == _XF and cell_xfs is not None:
+                        number_format_id = int(elem.get("numFmtId", "0"))
+                        number_formats.append(
+                            custom_dic.get(
+                                number_format_id,
+                                BUILTIN_FORMATS.get(
+                                    number_format_id, _GENERAL_NUMBER_FORMAT
+                                ),
+                            )
+                        )
+                    elif elem.tag == _CELL_XFS:
+                        break
+        self._number_formats = number_formats
+        self._date_styles = [is_date_format(nf) for nf in number_formats]
+        return number_formats
+
+    def get_number_format(self, style: int) -> str:
+        """Get the number format of a style
+
+        Args:
+            style (int): Index of the style
+
+        Returns:
+            str: Number format
+        """
+        number_formats = self._load_styles()
+        if style < len(number_formats):
+            return number_formats[style]
+        return _GENERAL_NUMBER_FORMAT
+
+    def is_date_style(self, style: int) -> bool:
+        """Return True if the number format of the style is for dates
+
+        The styles are parsed on the first call.
+        """
+        self._load_styles()
+        assert self._date_styles is not None
+        return style < len(self._date_styles) and self._date_styles[style]
+
+    def save(self, path: BookTarget) -> None:
+        raise XlFormNotImplementedException()
+
+    def close(self) -> None:
+        if self._shared_strings_iter is not None:
+            # Closes the part of the shared strings parsed in part.
+            self._shared_strings_iter.close()
+            self._shared_strings_iter = None
+        self._zip_file.close()
+
+    def iter_sheets(self) -> Iterator[Sheet]:
+        for sheet in self._sheet_dic.values():
+            yield sheet
+
+    def get_sheet(self, name: str) -> Sheet:
+        try:
+            return self._sheet_dic[name]
+        except KeyError:
+            raise XlFormArgumentException("Sheet not found: %s" % (name))
+
+    def add_sheet(self, name: str) -> None:
+        raise XlFormNotImplementedException()
+
+
+class EngineXlsxReader(Engine):
+    """Engine which reads the xlsx files directly
+
+    The XML parts of the worksheets are stream-parsed only when the cells
+    are requested, and the parsing stops after the last requested row.
+    The styles are parsed only if the number formats are needed. Books
+    can't be modified.
+    """
+
+    def __init__(self, tracer: Tracer = NULL_TRACER) -> None:
+        self.set_tracer(tracer)
+
+    def get_cell_attributes(self) -> FrozenSet[CellAttribute]:
+        return _CELL_ATTRIBUTES
+
+    def new_book(self) -> Book:
+        raise XlFormNotImplementedException()
+
+    def open_book(
+        self, path: BookSource, sheets: Optional[Iterable[str]] = None
+    ) -> Book:
+        tracer = self.get_tracer()
+        with tracer.span(SPAN_OPEN_BOOK):
+            zip_file = zipfile.ZipFile(get_book_file(path))
+            try:
+                return BookXlsx(zip_file, tracer, sheets)
+            except Exception:
+                zip_file.close()
+                raise
@@ -1,31 +1,134 @@
 from abc import ABC
 from abc import abstractmethod
+from concurrent.futures import Executor
 from typing_extensions import final
 from typing import Any
+from typing import cast
 from typing import Dict
+from typing import FrozenSet
+from typing import Iterator
 from typing import List
 from typing import Optional
+from typing import Sequence
+from typing import Tuple
+from xlform.engine.base import AsyncRunner
 from xlform.engine.base import Book
+from xlform.engine.base import Cell
+from xlform.engine.base import CellAttribute
 from xlform.engine.base import CellValue
+from xlform.engine.base import format_range_arg
+from xlform.engine.base import get_column_letter
+from xlform.engine.base import parse_range_arg
 from xlform.engine.base import Range
 from xlform.engine.base import Sheet
 from xlform.exception import XlFormArgumentException
 from xlform.exception import XlFormInternalException
 from xlform.exception import XlFormNotImplementedException
+from xlform.exception import XlFormRuntimeException
 from xlform.exception import XlFormValidationException
+from xlform.trace import EXCEPTIONS
+from xlform.trace import get_item_span_name
+from xlform.trace import NULL_TRACER
+from xlform.trace import SPAN_DEEPCOPY
+from xlform.trace import SPAN_DUMP
+from xlform.trace import SPAN_GET_ITEM_DOC
+from xlform.trace import SPAN_GET_RANGE
+from xlform.trace import SPAN_GET_SHEET
+from xlform.trace import SPAN_PREFETCH
+from xlform.trace import SPAN_SCAN
+from xlform.trace import SPAN_SET_ITEM_DOC
+from xlform.trace import SPAN_VALIDATE_BOOK
+from xlform.trace import SPAN_VALIDATE_ITEM_DOC
+from xlform.trace import Tracer
 from xlform import cell_dump
+from xlform import dump_range
+import array
 import copy
+import datetime
+import enum
+import functools
+import hashlib
+import inspect
+import itertools
+import json
+import weakref
 
 
 ItemDocMeta = Dict[str, Any]
 ItemDocResult = Any
 
 
+class MetaLevel(enum.Enum):
+    """Level of the meta data of item documents
+
+    NONE has no meta data, VALUES has the values of the cells and FULL has
+    all attributes of the cells supported by the engine.
+    """
+
+    NONE = "none"
+    VALUES = "values"
+    FULL = "full"
+
+
+class ResultFormat(enum.Enum):
+    """Format of the results of table items
+
+    ROWS has a list or a dict for each row. COLUMNS has a sequence for each
+    column, in a list or in dicts nested by the header paths. The columns of
+    ints or floats are array.array, which numpy.frombuffer can wrap without
+    copying.
+    """
+
+    ROWS = "rows"
+    COLUMNS = "columns"
+
+
+def _to_column(
+    values: List[CellValue], infer_rows_count: int
+) -> Sequence[CellValue]:
+    sample = values[:infer_rows_count]
+    typecode: Optional[str] = None
+    if all(type(value) is int for value in sample):
+        typecode = "q"
+    elif all(type(value) in (int, float) for value in sample):
+        typecode = "d"
+    if typecode is not None and len(sample) > 0:
+        numbers: List[Any] = values
+        try:
+            return array.array(typecode, numbers)
+        except (TypeError, OverflowError):
+            pass  # A value after the sample doesn't fit the type.
+    return values
+
+
+def _dump_cell(cell: Cell, meta_level: MetaLevel) -> ItemDocMeta:
+    if meta_level == MetaLevel.NONE:
+        return dict()
+    if meta_level == MetaLevel.VALUES:
+        addr = cell.get_address(column_absolute=False, row_absolute=False)
+        return {addr: {"value": cell.get_value()}}
+    return cell_dump(cell)
+
+
 class ItemDoc(object):
     @final
     def __init__(
-        self, result: ItemDocResult, meta: Optional[ItemDocMeta] = None
+        self,
+        result: ItemDocResult,
+        meta: Optional[ItemDocMeta] = None,
+        frozen: bool = False,
     ) -> None:
+        """Item document
+
+        A frozen document is treated as immutable. The accessors return the
+        result and the meta data without copying them, so the owner must
+        not modify them after creating the document.
+
+        Args:
+            result (ItemDocResult): Result
+            meta (Optional[ItemDocMeta]): Meta data
+            frozen (bool, optional): True if the document is frozen
+        """
         self._result: ItemDocResult = result
 
         if meta is None:
@@ -33,15 +136,25 @@ class ItemDoc(object):
         if not isinstance(meta, dict):
             raise XlFormArgumentException("meta is not a dict type.")
         self._meta: ItemDocMeta = meta
+        self._frozen = frozen
+
+    @final
+    def is_frozen(self) -> bool:
+        """Return True if the document is frozen"""
+        return self._frozen
 
     @final
     def get_meta(self) -> ItemDocMeta:
         """Get meta data"""
+        if self._frozen:
+            return self._meta
         return copy.deepcopy(self._meta)
 
     @final
     def get_result(self) -> ItemDocResult:
         """Get result"""
+        if self._frozen:
+            return self._result
         return copy.deepcopy(self._result)
 
     @final
@@ -50,6 +163,638 @@ class ItemDoc(object):
         return {"_meta": self.get_meta(), "result": self.get_result()}
 
 
+class _GridCell(Cell):
+    """Cell with the value read from the grid of the session
+
+    The other attributes are read from the cell of the book.
+    """
+
+    def __init__(self, range_: "_GridRange", row: int, column: int) -> None:
+        self._range = range_
+        self._row = row
+        self._column = column
+        self._cell: Optional[Cell] = None
+
+    def _get_cell(self) -> Cell:
+        if self._cell is None:
+            self._cell = self._range.get_book_range().get_cell(
+                self._row, self._column
+            )
+        return self._cell
+
+    def get_row(self) -> int:
+        return self._range.get_origin_row() + self._row - 1
+
+    def get_column(self) -> int:
+        return self._range.get_origin_column() + self._column - 1
+
+    def get_formula(self) -> CellValue:
+        return self._get_cell().get_formula()
+
+    def get_value(self) -> CellValue:
+        value = self._range.get_grid_value(self._row, self._column)
+        if value is None:
+            return self._get_cell().get_value()
+        return value
+
+    def get_number_format(self) -> str:
+        return self._get_cell().get_number_format()
+
+    def get_text(self) -> str:
+        return self._get_cell().get_text()
+
+    def get_attributes(self) -> FrozenSet[CellAttribute]:
+        return self._get_cell().get_attributes()
+
+    def get_address(
+        self, column_absolute: bool = True, row_absolute: bool = True
+    ) -> str:
+        return "%s%s%s%d" % (
+            "$" if column_absolute else "",
+            get_column_letter(self.get_column()),
+            "$" if row_absolute else "",
+            self.get_row(),
+        )
+
+    def set_value(self, value: CellValue) -> None:
+        self._get_cell().set_value(value)
+
+
+class _GridRange(Range):
+    """Range with the values read from the grid of the session
+
+    The values of the cells which can't be read from the grid, like empty
+    cells and formulas, are read from the book. Writes go to the book.
+    """
+
+    def __init__(
+        self,
+        session: "FormSession",
+        sheet_name: str,
+        range_arg: str,
+        column: int,
+        row: int,
+        values: List[List[Optional[CellValue]]],
+    ) -> None:
+        self._session = session
+        self._sheet_name = sheet_name
+        self._range_arg = range_arg
+        self._column = column
+        self._row = row
+        self._values = values
+        self._range: Optional[Range] = None
+
+    def get_origin_column(self) -> int:
+        return self._column
+
+    def get_origin_row(self) -> int:
+        return self._row
+
+    def get_grid_value(self, row: int, column: int) -> Optional[CellValue]:
+        return self._values[row - 1][column - 1]
+
+    def get_book_range(self) -> Range:
+        """Get the range of the book"""
+        if self._range is None:
+            book = self._session.get_book()
+            sheet = book.get_sheet(self._sheet_name)
+            self._range = sheet.get_range(self._range_arg)
+        return self._range
+
+    def get_rows_count(self) -> int:
+        return len(self._values)
+
+    def get_columns_count(self) -> int:
+        return len(self._values[0])
+
+    def get_cell(self, row: int, column: int) -> Cell:
+        if not 1 <= row <= self.get_rows_count():
+            return self.get_book_range().get_cell(row, column)
+        if not 1 <= column <= self.get_columns_count():
+            return self.get_book_range().get_cell(row, column)
+        return _GridCell(self, row, column)
+
+    def get_values(self, row: int = 1) -> List[List[CellValue]]:
+        if row < 1:
+            raise XlFormArgumentException()
+        start = row - 1
+        rows = self._values[start:]
+        if any(value is None for row_values in rows for value in row_values):
+            return self.get_book_range().get_values(row)
+        return cast(List[List[CellValue]], [list(r) for r in rows])
+
+    def get_values_or_none(
+        self, row: int = 1
+    ) -> List[List[Optional[CellValue]]]:
+        if row < 1:
+            raise XlFormArgumentException()
+        start = row - 1
+        return [list(row_values) for row_values in self._values[start:]]
+
+    def set_values(self, values: List[List[CellValue]], row: int = 1) -> None:
+        self.get_book_range().set_values(values, row)
+
+    def dump(self, row: int = 1) -> Dict[str, List[Any]]:
+        return self.get_book_range().dump(row)
+
+
+class TableEnd(object):
+    """End of an open-ended table
+
+    The table ends before the first row matching any of the conditions,
+    after the header rows. A blank row has no cells with values, and a row
+    with the sentinel value has the value in the first column.
+    """
+
+    def __init__(
+        self,
+        blank_row: bool = True,
+        sentinel_value: Optional[CellValue] = None,
+        max_rows_count: Optional[int] = None,
+    ) -> None:
+        """End of an open-ended table
+
+        Args:
+            blank_row (bool, optional): True if a blank row ends the table
+            sentinel_value (Optional[CellValue]): Value which ends the table
+            max_rows_count (Optional[int]): Max number of the rows after the
+            header rows
+        """
+        if max_rows_count is not None and max_rows_count < 1:
+            raise XlFormArgumentException()
+        self._blank_row = blank_row
+        self._sentinel_value = sentinel_value
+        self._max_rows_count = max_rows_count
+
+    def get_key(self) -> Tuple[bool, Optional[CellValue], Optional[int]]:
+        """Get the key to compare the conditions"""
+        return (self._blank_row, self._sentinel_value, self._max_rows_count)
+
+    def get_max_rows_count(self) -> Optional[int]:
+        """Get the max number of the rows after the header rows"""
+        return self._max_rows_count
+
+    def is_end(self, values: List[Optional[CellValue]]) -> bool:
+        """Return True if the row ends the table
+
+        Args:
+            values (List[Optional[CellValue]]): Values of the row, with None
+            for the cells without values
+        """
+        if self._blank_row and all(value is None for value in values):
+            return True
+        if self._sentinel_value is None or len(values) == 0:
+            return False
+        return values[0] == self._sentinel_value
+
+
+_Grid = Tuple[int, int, List[List[Optional[CellValue]]]]
+
+
+def _is_bounded(range_arg: str) -> bool:
+    try:
+        bounds = parse_range_arg(range_arg)
+    except XlFormArgumentException:
+        return False
+    return all(bound is not None for bound in bounds)
+
+
+class FormSession(object):
+    """Cache shared by the form items on a book
+
+    The ranges resolved by the sheets are kept until the session is
+    invalidated. Writing values doesn't move the cells, so after writing
+    to a range the form items discard only the cached values of the range
+    and the extents of the open-ended ranges of the sheet. Call
+    invalidate() after modifying the book without the form items.
+
+    The values of regions of the sheets can be prefetched into grids, and
+    the ranges inside the regions are served from the grids. The regions
+    of the scanned open-ended ranges are kept as grids too.
+
+    The form items report the spans and the counters to the tracer of the
+    session, which is the tracer of the book by default.
+    """
+
+    def __init__(self, book: Book, tracer: Optional[Tracer] = None) -> None:
+        self._book_ref = weakref.ref(book)
+        self._tracer = book.get_tracer() if tracer is None else tracer
+        self._range_dic: Dict[Tuple[str, str], Range] = dict()
+        self._grid_dic: Dict[str, List[_Grid]] = dict()
+        self._prefetch_dic: Dict[Tuple[str, str], _Grid] = dict()
+        self._scan_dic: Dict[Tuple[Any, ...], Optional[str]] = dict()
+        self._scan_grid_dic: Dict[Tuple[Any, ...], _Grid] = dict()
+
+    def get_book(self) -> Book:
+        """Get book
+
+        Returns:
+            Book: Book
+        """
+        book = self._book_ref()
+        if book is None:
+            raise XlFormRuntimeException("The book has been released.")
+        return book
+
+    def get_tracer(self) -> Tracer:
+        """Get tracer
+
+        Returns:
+            Tracer: Tracer
+        """
+        return self._tracer
+
+    def get_range(self, sheet_name: str, range_arg: str) -> Range:
+        """Get range
+
+        Args:
+            sheet_name (str): Sheet name
+            range_arg (str): range like 'A1', 'A1:C3'
+
+        Returns:
+            Range: Range
+        """
+        key = (sheet_name, range_arg)
+        r = self._range_dic.get(key)
+        if r is None:
+            r = self._get_grid_range(sheet_name, range_arg)
+        if r is None:
+            with self._tracer.span(SPAN_GET_SHEET):
+                sheet = self.get_book().get_sheet(sheet_name)
+            with self._tracer.span(SPAN_GET_RANGE):
+                r = sheet.get_range(range_arg)
+        self._range_dic[key] = r
+        return r
+
+    def _get_grid_range(
+        self, sheet_name: str, range_arg: str
+    ) -> Optional[Range]:
+        grid_list = self._grid_dic.get(sheet_name)
+        if grid_list is None:
+            return None
+        try:
+            min_column, min_row, max_column, max_row = parse_range_arg(
+                range_arg
+            )
+        except XlFormArgumentException:
+            self._tracer.count(EXCEPTIONS)
+            return None
+        if min_column is None or max_column is None:
+            return None
+        if min_row is None or max_row is None:
+            return None
+        for grid_column, grid_row, grid_values in grid_list:
+            top = min_row - grid_row
+            bottom = max_row - grid_row + 1
+            left = min_column - grid_column
+            right = max_column - grid_column + 1
+            if top < 0 or left < 0:
+                continue
+            if bottom > len(grid_values) or right > len(grid_values[0]):
+                continue
+            values = [row[left:right] for row in grid_values[top:bottom]]
+            return _GridRange(
+                self, sheet_name, range_arg, min_column, min_row, values
+            )
+        return None
+
+    def _add_grid(self, sheet_name: str, grid: _Grid) -> None:
+        self._grid_dic.setdefault(sheet_name, list()).append(grid)
+        for key in [k for k in self._range_dic if k[0] == sheet_name]:
+            del self._range_dic[key]
+
+    def _remove_grid(self, sheet_name: str, grid: _Grid) -> None:
+        grid_list = self._grid_dic.get(sheet_name, list())
+        grid_list[:] = [g for g in grid_list if g is not grid]
+        for key, g in list(self._prefetch_dic.items()):
+            if g is grid:
+                del self._prefetch_dic[key]
+
+    def prefetch(self, sheet_name: str, range_arg: str) -> None:
+        """Read the values of a region of the sheet at once
+
+        The ranges inside the region are served from the values until the
+        session is invalidated. A region prefetched before is not read
+        again, since the writes of the form items keep it up to date.
+
+        Args:
+            sheet_name (str): Sheet name
+            range_arg (str): range like 'A1:C3'
+        """
+        key = (sheet_name, range_arg)
+        if key in self._prefetch_dic:
+            return
+        min_column, min_row, max_column, max_row = parse_range_arg(range_arg)
+        if min_column is None or max_column is None:
+            raise XlFormArgumentException("Unbounded range: %s" % (range_arg))
+        if min_row is None or max_row is None:
+            raise XlFormArgumentException("Unbounded range: %s" % (range_arg))
+        with self._tracer.span(SPAN_PREFETCH):
+            values = self._read_values(
+                sheet_name, min_row, min_column, max_column, max_row
+            )
+        grid = (min_column, min_row, values)
+        self._add_grid(sheet_name, grid)
+        self._prefetch_dic[key] = grid
+
+    def scan_range(
+        self,
+        sheet_name: str,
+        range_arg: str,
+        header_rows_count: int,
+        table_end: TableEnd,
+    ) -> Optional[str]:
+        """Find the extent of an open-ended range
+
+        The rows are read until the end of the table, and the values are
+        kept as a grid. The extent is kept until the session is invalidated.
+
+        Args:
+            sheet_name (str): Sheet name
+            range_arg (str): range like 'A3:C'
+            header_rows_count (int): Number of the header rows
+            table_end (TableEnd): End of the table
+
+        Returns:
+            Optional[str]: range like 'A3:C10', None if the range has no
+            rows after the header rows
+        """
+        key = (sheet_name, range_arg, header_rows_count, table_end.get_key())
+        if key in self._scan_dic:
+            return self._scan_dic[key]
+        min_column, min_row, max_column, max_row = parse_range_arg(range_arg)
+        if min_column is None or max_column is None or min_row is None:
+            raise XlFormArgumentException("Illegal range: %s" % (range_arg))
+        if max_row is not None:
+            raise XlFormArgumentException("Bounded range: %s" % (range_arg))
+        max_rows_count = table_end.get_max_rows_count()
+        if max_rows_count is not None:
+            max_row = min_row + header_rows_count + max_rows_count - 1
+
+        values: List[List[Optional[CellValue]]] = list()
+        with self._tracer.span(SPAN_SCAN):
+            sheet = self.get_book().get_sheet(sheet_name)
+            for row_values in sheet.iter_values(
+                min_row, min_column, max_column, max_row
+            ):
+                if len(values) >= header_rows_count:
+                    if table_end.is_end(row_values):
+                        break
+                values.append(row_values)
+
+        scanned: Optional[str] = None
+        if len(values) > header_rows_count:
+            grid = (min_column, min_row, values)
+            self._add_grid(sheet_name, grid)
+            self._scan_grid_dic[key] = grid
+            scanned = format_range_arg(
+                min_column, min_row, max_column, min_row + len(values) - 1
+            )
+        self._scan_dic[key] = scanned
+        return scanned
+
+    def invalidate(self) -> None:
+        """Discard the cache"""
+        self._range_dic.clear()
+        self._grid_dic.clear()
+        self._prefetch_dic.clear()
+        self._scan_dic.clear()
+        self._scan_grid_dic.clear()
+
+    def _read_values(
+        self,
+        sheet_name: str,
+        min_row: int,
+        min_column: int,
+        max_column: int,
+        max_row: int,
+    ) -> List[List[Optional[CellValue]]]:
+        sheet = self.get_book().get_sheet(sheet_name)
+        values = list(
+            sheet.iter_values(min_row, min_column, max_column, max_row)
+        )
+        columns_count = max_column - min_column + 1
+        for row_values in values:
+            if len(row_values) != columns_count:
+                raise XlFormInternalException()
+        # The rows after the last row of the sheet are blank.
+        blank_row: List[Optional[CellValue]] = [None] * columns_count
+        while len(values) < max_row - min_row + 1:
+            values.append(list(blank_row))
+        return values
+
+    def invalidate_range(self, sheet_name: str, range_: Range) -> None:
+        """Discard the cache of the values of a range after writing to it
+
+        The values of the range in the grids are read from the book again,
+        or the grids are discarded if the book can't read values. The
+        extents of the open-ended ranges of the sheet are discarded, since
+        the written values may end or extend them. The other resolved ranges
+        are kept.
+
+        Args:
+            sheet_name (str): Sheet name
+            range_ (Range): Range written to
+        """
+        origin = range_.get_cell(1, 1)
+        min_row, min_column = origin.get_row(), origin.get_column()
+        max_row = min_row + range_.get_rows_count() - 1
+        max_column = min_column + range_.get_columns_count() - 1
+        grid_list = self._grid_dic.get(sheet_name, list())
+        for key in [k for k in self._scan_dic if k[0] == sheet_name]:
+            del self._scan_dic[key]
+            grid = self._scan_grid_dic.pop(key, None)
+            if grid is not None:
+                self._remove_grid(sheet_name, grid)
+        values: Optional[List[List[Optional[CellValue]]]] = None
+        for grid in list(grid_list):
+            grid_column, grid_row, grid_values = grid
+            top = max(min_row - grid_row, 0)
+            bottom = min(max_row - grid_row + 1, len(grid_values))
+            left = max(min_column - grid_column, 0)
+            right = min(max_column - grid_column + 1, len(grid_values[0]))
+            if bottom <= top or right <= left:
+                continue
+            if values is None:
+                try:
+                    values = self._read_values(
+                        sheet_name, min_row, min_column, max_column, max_row
+                    )
+                except XlFormNotImplementedException:
+                    self._tracer.count(EXCEPTIONS)
+                    values = list()
+            if len(values) == 0:
+                self._remove_grid(sheet_name, grid)  # Can't read values.
+                continue
+            # The written values are read again, since None in the grids
+            # stands for the empty cells.
+            start = grid_column + left - min_column
+            stop = start + right - left
+            for index in range(top, bottom):
+                row_values = values[grid_row + index - min_row]
+                grid_values[index][left:right] = row_values[start:stop]
+        for key, r in list(self._range_dic.items()):
+            if key[0] != sheet_name:
+                continue
+            # The grid ranges hold copies of the values of the grids.
+            if isinstance(r, _GridRange) or not _is_bounded(key[1]):
+                del self._range_dic[key]
+
+
+class FormPlan(object):
+    """Regions of the sheets read by a form
+
+    Each region is the bounding box of the ranges of the form items on the
+    sheet. The ranges without bounds are not included, and are read from
+    the book.
+    """
+
+    def __init__(self, range_arg_dic: Dict[str, str]) -> None:
+        """Form plan
+
+        Args:
+            range_arg_dic (Dict[str, str]): Region by the sheet names
+        """
+        self._range_arg_dic = dict(range_arg_dic)
+
+    def get_sheet_names(self) -> List[str]:
+        """Get the names of the sheets read by the form"""
+        return list(self._range_arg_dic.keys())
+
+    def get_range_arg(self, sheet_name: str) -> str:
+        """Get the region of the sheet
+
+        Args:
+            sheet_name (str): Sheet name
+
+        Returns:
+            str: range like 'A1:C3'
+        """
+        return self._range_arg_dic[sheet_name]
+
+    def prefetch(self, session: FormSession) -> None:
+        """Read the regions into the session
+
+        Args:
+            session (FormSession): Session
+        """
+        for sheet_name, range_arg in self._range_arg_dic.items():
+            session.prefetch(sheet_name, range_arg)
+
+
+@functools.lru_cache(maxsize=None)
+def _accepts_session(cls: Any) -> bool:
+    # The form item classes written before the sessions don't take them.
+    try:
+        parameters = inspect.signature(cls).parameters
+    except (TypeError, ValueError):
+        return False
+    return any(
+        p.name == "session" or p.kind == inspect.Parameter.VAR_KEYWORD
+        for p in parameters.values()
+    )
+
+
+def _get_session(book: Book, session: Optional[FormSession]) -> FormSession:
+    if session is None:
+        return FormSession(book)
+    if session.get_book() is not book:
+        raise XlFormArgumentException("The session is for another book.")
+    return session
+
+
+class CellChange(object):
+    def __init__(
+        self,
+        sheet_name: str,
+        address: str,
+        old_value: Optional[CellValue],
+        new_value: CellValue,
+    ) -> None:
+        """Change of a cell value
+
+        Args:
+            sheet_name (str): Sheet name
+            address (str): Address like 'A1'
+            old_value (Optional[CellValue]): Value before the change, None if
+            the cell had no value
+            new_value (CellValue): Value after the change
+        """
+        self._sheet_name = sheet_name
+        self._address = address
+        self._old_value = old_value
+        self._new_value = new_value
+
+    def get_sheet_name(self) -> str:
+        return self._sheet_name
+
+    def get_address(self) -> str:
+        return self._address
+
+    def get_old_value(self) -> Optional[CellValue]:
+        return self._old_value
+
+    def get_new_value(self) -> CellValue:
+        return self._new_value
+
+    def get_dict(self) -> Dict[str, Any]:
+        """Get change"""
+        return {
+            "sheet_name": self._sheet_name,
+            "address": self._address,
+            "old_value": self._old_value,
+            "new_value": self._new_value,
+        }
+
+
+def _is_same_value(old: Optional[CellValue], new: CellValue) -> bool:
+    # 1, 1.0 and True are equal, but writing one over another changes the
+    # type of the cell.
+    return type(old) is type(new) and old == new
+
+
+def _can_read_values(book: Book) -> bool:
+    # The headers of write-only books can't be read back, so they are
+    # written with the values instead of being validated.
+    return CellAttribute.VALUE in book.get_cell_attributes()
+
+
+def _set_values_diff(
+    sheet_name: str,
+    range_: Range,
+    values: List[List[CellValue]],
+    row: int = 1,
+    column: int = 1,
+) -> List[CellChange]:
+    # Writes the values to the cells from the row and the column of the
+    # range, only where they differ from the current values.
+    old_values = range_.get_values_or_none(row)
+    if len(old_values) < len(values):
+        raise XlFormArgumentException()
+    start = column - 1
+    stop = start + len(values[0]) if len(values) > 0 else start
+    change_list: List[CellChange] = list()
+    origin: Optional[Cell] = None
+    for row_index, (old_row, new_row) in enumerate(zip(old_values, values)):
+        old_row = old_row[start:stop]
+        if len(old_row) != len(new_row):
+            raise XlFormArgumentException()
+        for col_index, (old, new) in enumerate(zip(old_row, new_row)):
+            if _is_same_value(old, new):
+                continue
+            if origin is None:
+                origin = range_.get_cell(1, 1)
+            cell_row = row + row_index
+            cell_column = column + col_index
+            address = "%s%d" % (
+                get_column_letter(origin.get_column() + cell_column - 1),
+                origin.get_row() + cell_row - 1,
+            )
+            range_.get_cell(cell_row, cell_column).set_value(new)
+            change_list.append(CellChange(sheet_name, address, old, new))
+    return change_list
+
+
 class FormItem(ABC):
     @abstractmethod
     def _validate_book(self) -> None:
@@ -63,27 +808,63 @@ class FormItem(ABC):
 
     @abstractmethod
     def _get_item_doc(self) -> ItemDoc:
-        """Get item document from book"""
+        """Get item document from book, with the full meta data"""
         raise XlFormNotImplementedException()
 
+    def _get_item_doc_at_level(self, meta_level: MetaLevel) -> ItemDoc:
+        """Get item document from book, with the level of the meta data
+
+        Override this to skip collecting the meta data. By default, the
+        document of _get_item_doc() is returned, without the meta data for
+        MetaLevel.NONE.
+
+        Args:
+            meta_level (MetaLevel): Level of the meta data
+        """
+        item_doc = self._get_item_doc()
+        if meta_level == MetaLevel.NONE and item_doc is not None:
+            return ItemDoc(
+                result=item_doc.get_result(), frozen=item_doc.is_frozen()
+            )
+        return item_doc
+
     @abstractmethod
     def _set_item_doc(self, item_doc: ItemDoc) -> None:
         """Set item document to book"""
         raise XlFormNotImplementedException()
 
+    def _set_item_doc_diff(self, item_doc: ItemDoc) -> List[CellChange]:
+        """Set item document to book, only the cells with changed values
+
+        Returns:
+            List[CellChange]: Changes of the cells
+        """
+        raise XlFormNotImplementedException()
+
+    def _get_tracer(self) -> Tracer:
+        """Get the tracer of the phases"""
+        return NULL_TRACER
+
     @final
-    def get_item_doc(self) -> ItemDoc:
+    def get_item_doc(self, meta_level: MetaLevel = MetaLevel.FULL) -> ItemDoc:
         """Get item document from book
 
         If validation fails, it raises an exception.
 
+        Args:
+            meta_level (MetaLevel, optional): Level of the meta data
+
         Returns:
             ItemDoc: [TODO:description]
         """
-        self._validate_book()
-        item_doc = self._get_item_doc()
+        tracer = self._get_tracer()
+        with tracer.span(SPAN_VALIDATE_BOOK):
+            self._validate_book()
+        with tracer.span(SPAN_GET_ITEM_DOC):
+            item_doc = self._get_item_doc_at_level(meta_level)
         assert item_doc is not None
-        self._validate_item_doc(item_doc)
+        with tracer.span(SPAN_VALIDATE_ITEM_DOC):
+            self._validate_item_doc(item_doc)
         return item_doc
 
     @final
@@ -96,31 +877,64 @@ class FormItem(ABC):
         Args:
             item_doc (ItemDoc): Item document
         """
-        self._validate_item_doc(item_doc)
-        self._validate_book()
-        self._set_item_doc(item_doc)
-        self._validate_book()
+        tracer = self._get_tracer()
+        with tracer.span(SPAN_VALIDATE_ITEM_DOC):
+            self._validate_item_doc(item_doc)
+        with tracer.span(SPAN_VALIDATE_BOOK):
+            self._validate_book()
+        with tracer.span(SPAN_SET_ITEM_DOC):
+            self._set_item_doc(item_doc)
+        with tracer.span(SPAN_VALIDATE_BOOK):
+            self._validate_book()
+
+    @final
+    def set_item_doc_diff(self, item_doc: ItemDoc) -> List[CellChange]:
+        """Set item document to book, only the cells with changed values
+
+        The values are compared with the current values of the cells, and
+        only the cells with different values are written. If validation
+        fails, it raises an exception like set_item_doc().
+
+        Args:
+            item_doc (ItemDoc): Item document
+
+        Returns:
+            List[CellChange]: Changes of the cells, empty if nothing changed
+        """
+        tracer = self._get_tracer()
+        with tracer.span(SPAN_VALIDATE_ITEM_DOC):
+            self._validate_item_doc(item_doc)
+        with tracer.span(SPAN_VALIDATE_BOOK):
+            self._validate_book()
+        with tracer.span(SPAN_SET_ITEM_DOC):
+            change_list = self._set_item_doc_diff(item_doc)
+        with tracer.span(SPAN_VALIDATE_BOOK):
+            self._validate_book()
+        return change_list
 
 
 class FormItemCell(FormItem):
-    def __init__(self, book: Book, sheet_name: str, range_arg: str):
+    def __init__(
+        self,
+        book: Book,
+        sheet_name: str,
+        range_arg: str,
+        session: Optional[FormSession] = None,
+    ):
         self._book = book
         self._sheet_name = sheet_name
         self._range_arg = range_arg
+        self._session = _get_session(book, session)
         try:
             self._validate_book()
         except XlFormValidationException:
             raise XlFormArgumentException()
 
-    def _find_sheet(self, sheet_name: str) -> Sheet:
-        for sheet in self._book.iter_sheets():
-            if sheet.get_name() == self._sheet_name:
-                return sheet
-        raise XlFormArgumentException()
+    def _get_tracer(self) -> Tracer:
+        return self._session.get_tracer()
 
     def _validate_book(self) -> None:
-        sheet = self._find_sheet(self._sheet_name)
-        r = sheet.get_range(self._range_arg)
+        r = self._session.get_range(self._sheet_name, self._range_arg)
         if r.get_rows_count() != 1 or r.get_columns_count() != 1:
             raise XlFormArgumentException()
 
@@ -128,15 +942,27 @@ class FormItemCell(FormItem):
         pass
 
     def _get_item_doc(self) -> ItemDoc:
-        sheet = self._find_sheet(self._sheet_name)
-        r = sheet.get_range(self._range_arg)
+        return self._get_item_doc_at_level(MetaLevel.FULL)
+
+    def _get_item_doc_at_level(self, meta_level: MetaLevel) -> ItemDoc:
+        r = self._session.get_range(self._sheet_name, self._range_arg)
         cell = r.get_cell(1, 1)
-        return ItemDoc(meta=cell_dump(cell), result=cell.get_value())
+        with self._get_tracer().span(SPAN_DUMP):
+            meta = _dump_cell(cell, meta_level)
+        return ItemDoc(meta=meta, result=cell.get_value(), frozen=True)
 
     def _set_item_doc(self, item_doc: ItemDoc) -> None:
-        sheet = self._find_sheet(self._sheet_name)
-        r = sheet.get_range(self._range_arg)
+        r = self._session.get_range(self._sheet_name, self._range_arg)
         r.get_cell(1, 1).set_value(item_doc.get_result())
+        self._session.invalidate_range(self._sheet_name, r)
+
+    def _set_item_doc_diff(self, item_doc: ItemDoc) -> List[CellChange]:
+        r = self._session.get_range(self._sheet_name, self._range_arg)
+        values = [[item_doc.get_result()]]
+        change_list = _set_values_diff(self._sheet_name, r, values)
+        if len(change_list) > 0:
+            self._session.invalidate_range(self._sheet_name, r)
+        return change_list
 
 
 class FormItemKeyValueCells(FormItem):
@@ -151,25 +977,25 @@ class FormItemKeyValueCells(FormItem):
         sheet_name: str,
         range_arg: str,
         header_value: CellValue,
+        session: Optional[FormSession] = None,
     ):
         self._book = book
         self._sheet_name = sheet_name
         self._range_arg = range_arg
         self._header_value = header_value
+        self._session = _get_session(book, session)
         try:
             self._validate_book()
         except XlFormValidationException as e:
             raise XlFormArgumentException("Illegal argument: %s" % (str(e)))
 
-    def _find_sheet(self, sheet_name: str) -> Sheet:
-        for sheet in self._book.iter_sheets():
-            if sheet.get_name() == self._sheet_name:
-                return sheet
-        raise XlFormArgumentException()
+    def _get_tracer(self) -> Tracer:
+        return self._session.get_tracer()
 
     def _validate_book(self) -> None:
-        sheet = self._find_sheet(self._sheet_name)
-        r = sheet.get_range(self._range_arg)
+        if not _can_read_values(self._book):
+            return
+        r = self._session.get_range(self._sheet_name, self._range_arg)
         if r.get_cell(1, 1).get_value() != self._header_value:
             raise XlFormValidationException("header_value not found.")
 
@@ -177,17 +1003,152 @@ class FormItemKeyValueCells(FormItem):
         pass
 
     def _get_item_doc(self) -> ItemDoc:
-        sheet = self._find_sheet(self._sheet_name)
-        r = sheet.get_range(self._range_arg)
+        return self._get_item_doc_at_level(MetaLevel.FULL)
+
+    def _get_item_doc_at_level(self, meta_level: MetaLevel) -> ItemDoc:
+        r = self._session.get_range(self._sheet_name, self._range_arg)
         meta = dict()
         cell = r.get_cell(1, 2)
-        meta.update(cell_dump(cell))
-        return ItemDoc(meta=meta, result=cell.get_value())
+        with self._get_tracer().span(SPAN_DUMP):
+            meta.update(_dump_cell(cell, meta_level))
+        return ItemDoc(meta=meta, result=cell.get_value(), frozen=True)
 
     def _set_item_doc(self, item_doc: ItemDoc) -> None:
-        sheet = self._find_sheet(self._sheet_name)
-        r = sheet.get_range(self._range_arg)
+        r = self._session.get_range(self._sheet_name, self._range_arg)
+        if not _can_read_values(self._book):
+            r.get_cell(1, 1).set_value(self._header_value)
         r.get_cell(1, 2).set_value(item_doc.get_result())
+        self._session.invalidate_range(self._sheet_name, r)
+
+    def _set_item_doc_diff(self, item_doc: ItemDoc) -> List[CellChange]:
+        r = self._session.get_range(self._sheet_name, self._range_arg)
+        values = [[item_doc.get_result()]]
+        change_list = _set_values_diff(self._sheet_name, r, values, column=2)
+        if len(change_list) > 0:
+            self._session.invalidate_range(self._sheet_name, r)
+        return change_list
+
+
+def _get_values_meta(
+    column: int, row: int, values: List[List[CellValue]]
+) -> ItemDocMeta:
+    meta: ItemDocMeta = dict()
+    if len(values) == 0:
+        return meta
+    column_letters = [
+        get_column_letter(column + col_index)
+        for col_index in range(0, len(values[0]))
+    ]
+    for row_index, row_list in enumerate(values, start=row):
+        for column_letter, value in zip(column_letters, row_list):
+            addr = "%s%d" % (column_letter, row_index)
+            meta[addr] = {"value": value}
+    return meta
+
+
+def _get_dump_meta(dump: Dict[str, List[Any]]) -> ItemDocMeta:
+    meta: ItemDocMeta = dict()
+    addresses = dump.pop("address")
+    for cell_index, addr in enumerate(addresses):
+        meta[addr] = {
+            key: column[cell_index]
+            for key, column in dump.items()
+            if column[cell_index] is not None
+        }
+    return meta
+
+
+class _HeaderPaths(object):
+    """Header paths compiled into the nodes of the nested dicts
+
+    The nodes are the dicts of the paths except the last parts, in the
+    order their parents come first. Each column has a slot, which is the
+    key of the value in a node. The rows are built and read with flat loops
+    over the nodes and the slots.
+    """
+
+    def __init__(self, header_path_list: List[List[str]]) -> None:
+        node_dic: Dict[Tuple[str, ...], int] = {(): 0}
+        self._node_list: List[Tuple[int, str]] = list()
+        self._slot_list: List[Tuple[int, str]] = list()
+        leaf_dic: Dict[Tuple[str, ...], int] = dict()
+        for header_path in header_path_list:
+            if not isinstance(header_path, list) or len(header_path) == 0:
+                raise XlFormArgumentException(
+                    "Illegal header path: %s" % (header_path,)
+                )
+            for index in range(1, len(header_path)):
+                path = tuple(header_path[:index])
+                if path in leaf_dic:
+                    raise XlFormArgumentException(
+                        "Conflicting header path: %s" % (header_path)
+                    )
+                if path not in node_dic:
+                    parent = node_dic[path[:-1]]
+                    node_dic[path] = len(self._node_list) + 1
+                    self._node_list.append((parent, path[-1]))
+            leaf = tuple(header_path)
+            if leaf in node_dic or leaf in leaf_dic:
+                raise XlFormArgumentException(
+                    "Conflicting header path: %s" % (header_path)
+                )
+            leaf_dic[leaf] = len(self._slot_list)
+            self._slot_list.append((node_dic[leaf[:-1]], leaf[-1]))
+
+    def get_columns_count(self) -> int:
+        return len(self._slot_list)
+
+    def build(self, values: Sequence[Any]) -> Dict[str, Any]:
+        """Build the nested dict from the values of the columns"""
+        row: Dict[str, Any] = dict()
+        nodes: List[Dict[str, Any]] = [row]
+        for parent, key in self._node_list:
+            node: Dict[str, Any] = dict()
+            nodes[parent][key] = node
+            nodes.append(node)
+        for (parent, key), value in zip(self._slot_list, values):
+            nodes[parent][key] = value
+        return row
+
+    def extract(self, row: Any) -> List[Any]:
+        """Extract the values of the columns from the nested dict
+
+        Raises XlFormValidationException if the dict lacks a header path.
+        """
+        if not isinstance(row, dict):
+            raise XlFormValidationException("not isinstance(row, dict)")
+        nodes: List[Dict[str, Any]] = [row]
+        for parent, key in self._node_list:
+            node = nodes[parent].get(key)
+            if not isinstance(node, dict):
+                raise XlFormValidationException(
+                    "not isinstance(node, dict): row=%s, key=%s" % (row, key)
+                )
+            nodes.append(node)
+        values: List[Any] = list()
+        for parent, key in self._slot_list:
+            node = nodes[parent]
+            if key not in node:
+                raise XlFormValidationException(
+                    "key not in node: row=%s, key=%s" % (row, key)
+                )
+            values.append(node[key])
+        return values
+
+
+_META_CHUNK_ROWS_COUNT_MIN = 64
+
+_META_CHUNK_ROWS_COUNT_MAX = 65536
+
+
+def _is_open_ended(range_arg: str) -> bool:
+    try:
+        min_column, min_row, max_column, max_row = parse_range_arg(range_arg)
+    except XlFormArgumentException:
+        return False
+    if min_column is None or max_column is None or min_row is None:
+        return False
+    return max_row is None
 
 
 class FormItemTable(FormItem):
@@ -198,13 +1159,54 @@ class FormItemTable(FormItem):
         range_arg: str,
         header_rows_count: int = 0,
         header_path_list: Optional[List[List[str]]] = None,
+        session: Optional[FormSession] = None,
+        result_format: ResultFormat = ResultFormat.ROWS,
+        infer_rows_count: int = 100,
+        table_end: Optional[TableEnd] = None,
     ):
+        """A form item with a table
+
+        The range may be open-ended like 'A3:C'. The rows of an open-ended
+        table are read until the end of the table.
+
+        Args:
+            book (Book): Book
+            sheet_name (str): Sheet name
+            range_arg (str): Range of the table including the headers
+            header_rows_count (int, optional): Number of the header rows
+            header_path_list (Optional[List[List[str]]]): Header path of
+            each column
+            session (Optional[FormSession]): Session
+            result_format (ResultFormat, optional): Format of the result
+            infer_rows_count (int, optional): Number of the rows to infer
+            the types of the columns from in the COLUMNS format
+            table_end (Optional[TableEnd]): End of the open-ended table, a
+            blank row by default
+        """
         self._book = book
         self._sheet_name = sheet_name
         self._range_arg = range_arg
         self._header_rows_count = header_rows_count
         self._header_path_list = header_path_list
-
+        self._session = _get_session(book, session)
+        self._result_format = result_format
+        self._infer_rows_count = infer_rows_count
+        self._table_end = table_end
+
+        self._header_paths: Optional[_HeaderPaths] = None
+        if self._header_rows_count >= 1:
+            if isinstance(self._header_path_list, list):
+                self._header_paths = _HeaderPaths(self._header_path_list)
+
+        if _is_open_ended(self._range_arg):
+            if self._table_end is None:
+                self._table_end = TableEnd()
+        elif self._table_end is not None:
+            raise XlFormArgumentException("The range is not open-ended.")
+        if not isinstance(self._result_format, ResultFormat):
+            raise XlFormArgumentException()
+        if self._infer_rows_count < 1:
+            raise XlFormArgumentException()
         if self._header_rows_count < 0:
             raise XlFormArgumentException()
         elif self._header_rows_count > 1:
@@ -224,17 +1226,51 @@ class FormItemTable(FormItem):
                         "len(header_path) != self._header_rows_count"
                     )
 
-    def _find_sheet(self, sheet_name: str) -> Sheet:
-        for sheet in self._book.iter_sheets():
-            if sheet.get_name() == self._sheet_name:
-                return sheet
-        raise XlFormArgumentException()
+    def _get_tracer(self) -> Tracer:
+        return self._session.get_tracer()
+
+    def _get_range(self) -> Range:
+        if self._table_end is None:
+            return self._session.get_range(self._sheet_name, self._range_arg)
+        range_arg = self._session.scan_range(
+            self._sheet_name,
+            self._range_arg,
+            self._header_rows_count,
+            self._table_end,
+        )
+        if range_arg is None:
+            raise XlFormValidationException("The table has no rows.")
+        return self._session.get_range(self._sheet_name, range_arg)
+
+    def _get_header_range(self) -> Range:
+        # Only the rows compared with the header paths are read from a
+        # bounded range, so that the data rows are not read to validate it.
+        if not _is_bounded(self._range_arg):
+            r = self._get_range()
+            if r.get_rows_count() <= self._header_rows_count:
+                raise XlFormValidationException()
+            return r
+        min_column, min_row, max_column, max_row = parse_range_arg(
+            self._range_arg
+        )
+        assert min_column is not None and min_row is not None
+        assert max_column is not None and max_row is not None
+        if max_row - min_row + 1 <= self._header_rows_count:
+            raise XlFormValidationException()
+        rows_count = max(
+            [self._header_rows_count, 1]
+            + [len(p) for p in self._header_path_list or list()]
+        )
+        range_arg = format_range_arg(
+            min_column,
+            min_row,
+            max_column,
+            min(min_row + rows_count - 1, max_row),
+        )
+        return self._session.get_range(self._sheet_name, range_arg)
 
     def _validate_book(self) -> None:
-        sheet = self._find_sheet(self._sheet_name)
-        r = sheet.get_range(self._range_arg)
-        if r.get_rows_count() <= self._header_rows_count:
-            raise XlFormValidationException()
+        r = self._get_header_range()
         if r.get_columns_count() <= 0:
             raise XlFormInternalException()
         if self._header_rows_count == 0:
@@ -246,6 +1282,8 @@ class FormItemTable(FormItem):
                 raise XlFormArgumentException(
                     "len(self._header_path_list) != r.get_columns_count()"
                 )
+            if not _can_read_values(self._book):
+                return
             for col_index, header_path in enumerate(
                 self._header_path_list, start=1
             ):
@@ -267,30 +1305,39 @@ class FormItemTable(FormItem):
     def _validate_item_doc_row_dict(
         self, range_: Range, row: Dict[str, Any], row_index: int
     ) -> None:
-        assert isinstance(self._header_path_list, list)
-        for col_index, header_path in enumerate(self._header_path_list):
-            dic = row
-            for header_path_index in range(0, len(header_path) - 1):
-                path_part = header_path[header_path_index]
-                if path_part not in dic:
-                    raise XlFormValidationException(
-                        "path_part not in dic: header_path=%s, row=%s"
-                        % (header_path, row)
-                    )
-                dic = dic[path_part]
-                if not isinstance(dic, dict):
-                    raise XlFormValidationException(
-                        "not isinstance(dic, dict): row=%s, header_path=%s"
-                        % (row, header_path)
-                    )
-            if not header_path[-1] in dic:
+        assert self._header_paths is not None
+        self._header_paths.extract(row)
+
+    def _get_column_list(self, result: Any) -> List[Sequence[CellValue]]:
+        if self._header_rows_count == 0:
+            if not isinstance(result, list):
                 raise XlFormValidationException()
+            return result
+        assert self._header_paths is not None
+        return self._header_paths.extract(result)
+
+    def _validate_item_doc_columns(self, range_: Range, result: Any) -> None:
+        column_list = self._get_column_list(result)
+        if len(column_list) != range_.get_columns_count():
+            raise XlFormValidationException(
+                "len(column_list) != range_.get_columns_count(): %d, %d"
+                % (len(column_list), range_.get_columns_count())
+            )
+        data_rows_count = range_.get_rows_count() - self._header_rows_count
+        for column in column_list:
+            if len(column) != data_rows_count:
+                raise XlFormValidationException(
+                    "len(column) != data_rows_count: %d, %d"
+                    % (len(column), data_rows_count)
+                )
 
     def _validate_item_doc(self, item_doc: ItemDoc) -> None:
         result = item_doc.get_result()
 
-        sheet = self._find_sheet(self._sheet_name)
-        r = sheet.get_range(self._range_arg)
+        r = self._get_range()
+        if self._result_format == ResultFormat.COLUMNS:
+            self._validate_item_doc_columns(r, result)
+            return
         if not isinstance(result, list):
             raise XlFormValidationException()
 
@@ -309,101 +1356,457 @@ class FormItemTable(FormItem):
             else:
                 raise XlFormValidationException()
 
+    def _get_meta(
+        self,
+        range_: Range,
+        values: List[List[CellValue]],
+        meta_level: MetaLevel,
+    ) -> Dict[str, Any]:
+        start = 1 + self._header_rows_count
+        if meta_level == MetaLevel.NONE:
+            return dict()
+        elif meta_level == MetaLevel.VALUES:
+            origin = range_.get_cell(1, 1)
+            row = origin.get_row() + start - 1
+            return _get_values_meta(origin.get_column(), row, values)
+        elif meta_level == MetaLevel.FULL:
+            return _get_dump_meta(dump_range(range_, start))
+        else:
+            raise XlFormArgumentException()
+
     def _get_item_doc_row_list(
-        self, meta: Dict[str, Any], range_: Range
+        self, meta: Dict[str, Any], values: List[List[CellValue]]
     ) -> ItemDoc:
-        result_list: List[List[CellValue]] = list()
-        for row_index in range(1, range_.get_rows_count() + 1):
-            row_list: List[CellValue] = list()
-            for col_index in range(1, range_.get_columns_count() + 1):
-                cell = range_.get_cell(row_index, col_index)
-                meta.update(cell_dump(cell))
-                row_list.append(cell.get_value())
-            result_list.append(row_list)
-        return ItemDoc(meta=meta, result=result_list)
+        return ItemDoc(meta=meta, result=values, frozen=True)
 
     def _get_item_doc_row_dict(
-        self, meta: Dict[str, Any], range_: Range
+        self, meta: Dict[str, Any], values: List[List[CellValue]]
     ) -> ItemDoc:
-        result_list: List[Dict[str, CellValue]] = list()
-        start = 1 + self._header_rows_count
-        for row_index in range(start, range_.get_rows_count() + 1):
-            row_dict: Dict[str, CellValue] = dict()
-            for col_index in range(1, range_.get_columns_count() + 1):
-                cell = range_.get_cell(row_index, col_index)
-                meta.update(cell_dump(cell))
-                assert self._header_path_list is not None
-                header_path = self._header_path_list[col_index - 1]
-
-                dic: Dict[str, Any] = row_dict
-                for header_path_index in range(0, len(header_path) - 1):
-                    path_part = header_path[header_path_index]
-                    if path_part not in dic:
-                        dic[path_part] = dict()
-                    if not isinstance(dic[path_part], dict):
-                        raise XlFormInternalException()
-                    dic = dic[path_part]
-                dic[header_path[-1]] = cell.get_value()
-            result_list.append(row_dict)
-        return ItemDoc(meta=meta, result=result_list)
+        result_list = [self._get_row_dict(row_list) for row_list in values]
+        return ItemDoc(meta=meta, result=result_list, frozen=True)
+
+    def _get_row_dict(self, row_list: List[CellValue]) -> Dict[str, Any]:
+        assert self._header_paths is not None
+        return self._header_paths.build(row_list)
+
+    def _get_item_doc_columns(
+        self, meta: Dict[str, Any], values: List[List[CellValue]]
+    ) -> ItemDoc:
+        column_list = [
+            _to_column(list(column), self._infer_rows_count)
+            for column in zip(*values)
+        ]
+        if self._header_rows_count == 0:
+            return ItemDoc(meta=meta, result=column_list, frozen=True)
+
+        assert self._header_paths is not None
+        result = self._header_paths.build(column_list)
+        return ItemDoc(meta=meta, result=result, frozen=True)
 
     def _get_item_doc(self) -> ItemDoc:
-        sheet = self._find_sheet(self._sheet_name)
-        r = sheet.get_range(self._range_arg)
-        meta: Dict[str, Any] = dict()
+        return self._get_item_doc_at_level(MetaLevel.FULL)
+
+    def _get_item_doc_at_level(self, meta_level: MetaLevel) -> ItemDoc:
+        r = self._get_range()
+        values = r.get_values(1 + self._header_rows_count)
+        with self._get_tracer().span(SPAN_DUMP):
+            meta = self._get_meta(r, values, meta_level)
+        if self._result_format == ResultFormat.COLUMNS:
+            return self._get_item_doc_columns(meta, values)
         if self._header_rows_count == 0:
-            return self._get_item_doc_row_list(meta, r)
+            return self._get_item_doc_row_list(meta, values)
         elif self._header_rows_count >= 1:
-            return self._get_item_doc_row_dict(meta, r)
+            return self._get_item_doc_row_dict(meta, values)
         else:
             raise XlFormInternalException()
 
-    def _set_item_doc(self, item_doc: ItemDoc) -> None:
-        sheet = self._find_sheet(self._sheet_name)
-        r = sheet.get_range(self._range_arg)
+    def _iter_data_rows(self) -> Iterator[Tuple[int, int, List[CellValue]]]:
+        # Yields the row index, the column index and the values of the rows
+        # after the header rows.
+        try:
+            bounds = parse_range_arg(self._range_arg)
+        except XlFormArgumentException:
+            self._get_tracer().count(EXCEPTIONS)
+            bounds = (None, None, None, None)
+        min_column, min_row, max_column, max_row = bounds
+        if min_column is None or max_column is None:
+            r = self._get_range()
+            origin = r.get_cell(1, 1)
+            start = 1 + self._header_rows_count
+            row = origin.get_row() + start - 1
+            for row_index, values in enumerate(r.get_values(start), row):
+                yield row_index, origin.get_column(), values
+            return
+
+        if min_row is None:
+            min_row = 1  # 'A:C'
+        columns_count = max_column - min_column + 1
+        if self._header_path_list is not None and self._header_rows_count:
+            if len(self._header_path_list) != columns_count:
+                raise XlFormArgumentException(
+                    "len(self._header_path_list) != columns_count"
+                )
+        data_row = min_row + self._header_rows_count
+        if max_row is not None and max_row < data_row:
+            raise XlFormValidationException("The table has no rows.")
+        if self._table_end is not None:
+            max_rows_count = self._table_end.get_max_rows_count()
+            if max_rows_count is not None:
+                max_row = data_row + max_rows_count - 1
+
+        sheet = self._session.get_book().get_sheet(self._sheet_name)
+        row_index = data_row
+        for row_values in sheet.iter_values(
+            data_row, min_column, max_column, max_row
+        ):
+            if self._table_end is not None and self._table_end.is_end(
+                row_values
+            ):
+                break
+            for col_index, value in enumerate(row_values):
+                if value is None:
+                    raise XlFormValidationException(
+                        "The cell has no value: %s%d"
+                        % (
+                            get_column_letter(min_column + col_index),
+                            row_index,
+                        )
+                    )
+            yield row_index, min_column, cast(List[CellValue], row_values)
+            row_index += 1
+
+        if row_index == data_row and self._table_end is not None:
+            raise XlFormValidationException("The table has no rows.")
+        if self._table_end is None and max_row is not None:
+            if row_index <= max_row:
+                raise XlFormValidationException(
+                    "The row has no values: %d" % (row_index)
+                )
+
+    def _validate_rows(self) -> None:
+        # Validates the book once before streaming the rows. Only the
+        # header rows of a bounded range are read, and the extent of an
+        # open-ended range is not resolved, since it reads all the rows.
+        with self._get_tracer().span(SPAN_VALIDATE_BOOK):
+            if not _is_open_ended(self._range_arg):
+                self._validate_book()
+                return
+            min_column, _, max_column, _ = parse_range_arg(self._range_arg)
+            assert min_column is not None and max_column is not None
+            if self._header_rows_count == 0:
+                return
+            if self._header_path_list is None:
+                raise XlFormInternalException()
+            columns_count = max_column - min_column + 1
+            if len(self._header_path_list) != columns_count:
+                raise XlFormArgumentException(
+                    "len(self._header_path_list) != columns_count"
+                )
+
+    def _get_row(self, values: List[CellValue]) -> Any:
+        if self._header_rows_count == 0:
+            return values
+        return self._get_row_dict(values)
+
+    @final
+    def iter_rows(self) -> Iterator[Any]:
+        """Iterate the rows of the table
+
+        The rows are read from the book one by one as they are iterated,
+        without keeping the rows read before. Each row is a list if the
+        table has no header rows, or a dict nested by the header paths,
+        regardless of the result format.
+
+        Returns:
+            Iterator[Any]: Rows
+        """
+        self._validate_rows()
+        for _, _, values in self._iter_data_rows():
+            yield self._get_row(values)
+
+    @final
+    def iter_row_values(self) -> Iterator[List[CellValue]]:
+        """Iterate the values of the rows of the table
+
+        The rows are read like iter_rows(), but each row is the list of the
+        values of the columns, without the dicts of the header paths.
+
+        Returns:
+            Iterator[List[CellValue]]: Values of the rows
+        """
+        self._validate_rows()
+        for _, _, values in self._iter_data_rows():
+            yield values
+
+    @final
+    def get_column_paths(self) -> List[List[str]]:
+        """Get the path of each column
+
+        Returns:
+            List[List[str]]: Header paths, or the column letters if the
+            table has no header paths
+        """
+        if self._header_rows_count >= 1 and self._header_path_list:
+            return [list(path) for path in self._header_path_list]
+        min_column, _, max_column, _ = parse_range_arg(self._range_arg)
+        if min_column is None or max_column is None:
+            r = self._get_range()
+            min_column = r.get_cell(1, 1).get_column()
+            max_column = min_column + r.get_columns_count() - 1
+        return [
+            [get_column_letter(column)]
+            for column in range(min_column, max_column + 1)
+        ]
+
+    @final
+    def iter_item_doc(
+        self, meta_level: MetaLevel = MetaLevel.FULL
+    ) -> Iterator[ItemDoc]:
+        """Iterate the item documents of the rows of the table
+
+        The rows are read like iter_rows(). With the FULL level, the cells
+        are read from the book again to get the meta data, in chunks of the
+        rows growing up to 65536 rows. Without the meta data, the table is
+        streamed row by row.
+
+        Args:
+            meta_level (MetaLevel, optional): Level of the meta data
 
+        Returns:
+            Iterator[ItemDoc]: Item documents with the rows as the results
+        """
+        if not isinstance(meta_level, MetaLevel):
+            raise XlFormArgumentException()
+        self._validate_rows()
+        rows = self._iter_data_rows()
+        if meta_level != MetaLevel.FULL:
+            for row_index, column, values in rows:
+                if meta_level == MetaLevel.VALUES:
+                    meta = _get_values_meta(column, row_index, [values])
+                else:
+                    meta = dict()
+                yield ItemDoc(
+                    result=self._get_row(values), meta=meta, frozen=True
+                )
+            return
+
+        sheet = self._session.get_book().get_sheet(self._sheet_name)
+        chunk_rows_count = _META_CHUNK_ROWS_COUNT_MIN
+        while True:
+            chunk = list(itertools.islice(rows, chunk_rows_count))
+            if len(chunk) == 0:
+                return
+            meta_list = self._get_chunk_meta(sheet, chunk)
+            for (_, _, values), meta in zip(chunk, meta_list):
+                yield ItemDoc(
+                    result=self._get_row(values), meta=meta, frozen=True
+                )
+            chunk_rows_count = min(
+                chunk_rows_count * 2, _META_CHUNK_ROWS_COUNT_MAX
+            )
+
+    def _get_chunk_meta(
+        self, sheet: Sheet, chunk: List[Tuple[int, int, List[CellValue]]]
+    ) -> List[ItemDocMeta]:
+        # Dumps the rows of the chunk at once, since the streaming engines
+        # read the sheet from the top for each range.
+        if len(chunk) == 0:
+            return list()
+        first_row, column, values = chunk[0]
+        last_row = chunk[-1][0]
+        columns_count = len(values)
+        range_arg = format_range_arg(
+            column, first_row, column + columns_count - 1, last_row
+        )
+        dump = dump_range(sheet.get_range(range_arg))
+        meta_list: List[ItemDocMeta] = list()
+        for row_index, _, _ in chunk:
+            start = (row_index - first_row) * columns_count
+            stop = start + columns_count
+            meta_list.append(
+                _get_dump_meta(
+                    {key: cells[start:stop] for key, cells in dump.items()}
+                )
+            )
+        return meta_list
+
+    def _get_result_rows(
+        self, range_: Range, item_doc: ItemDoc
+    ) -> List[List[CellValue]]:
         result = item_doc.get_result()
+        if self._result_format == ResultFormat.COLUMNS:
+            column_list = self._get_column_list(result)
+            result = [list(row) for row in zip(*column_list)]
         if isinstance(result, list):
             rows_count = len(result)
-            if r.get_rows_count() - self._header_rows_count != rows_count:
+            if range_.get_rows_count() - self._header_rows_count != rows_count:
                 raise XlFormArgumentException()
+            if self._header_paths is not None:
+                header_paths = self._header_paths
+                result = [
+                    header_paths.extract(row) if isinstance(row, dict) else row
+                    for row in result
+                ]
             for row in result:
-                if len(row) != r.get_columns_count():
+                if isinstance(row, dict):
+                    raise XlFormNotImplementedException()
+                if len(row) != range_.get_columns_count():
                     raise XlFormArgumentException()
-
-            for row_index, row in enumerate(result, start=1):
-                for col_index, value in enumerate(row, start=1):
-                    r.get_cell(row_index, col_index).set_value(value)
+            return result
 
         elif isinstance(result, dict):
             raise XlFormNotImplementedException()
+        raise XlFormArgumentException()
+
+    def _get_header_rows(self) -> List[List[CellValue]]:
+        assert self._header_path_list is not None
+        paths = self._header_path_list
+        if any(len(path) < self._header_rows_count for path in paths):
+            raise XlFormArgumentException(
+                "The header paths are shorter than the header rows."
+            )
+        return [
+            [path[row_index] for path in paths]
+            for row_index in range(self._header_rows_count)
+        ]
+
+    def _set_item_doc(self, item_doc: ItemDoc) -> None:
+        r = self._get_range()
+        result = self._get_result_rows(r, item_doc)
+        if self._header_rows_count > 0 and not _can_read_values(self._book):
+            r.set_values(self._get_header_rows() + result)
+        else:
+            r.set_values(result, 1 + self._header_rows_count)
+        self._session.invalidate_range(self._sheet_name, r)
+
+    def _set_item_doc_diff(self, item_doc: ItemDoc) -> List[CellChange]:
+        r = self._get_range()
+        result = self._get_result_rows(r, item_doc)
+        change_list = _set_values_diff(
+            self._sheet_name, r, result, 1 + self._header_rows_count
+        )
+        if len(change_list) > 0:
+            self._session.invalidate_range(self._sheet_name, r)
+        return change_list
 
 
 class Form(object):
     @final
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        tracer: Optional[Tracer] = None,
+        async_runner: Optional[AsyncRunner] = None,
+    ) -> None:
+        """Form
+
+        Args:
+            tracer (Optional[Tracer]): Tracer of the spans of the form items
+            async_runner (Optional[AsyncRunner]): Runner of the blocking
+            calls of the async methods, a runner in the default executor by
+            default
+        """
         self._form_item_dic: Dict[str, FormItem] = dict()
+        self._tracer = NULL_TRACER if tracer is None else tracer
+        self._async_runner = (
+            AsyncRunner() if async_runner is None else async_runner
+        )
 
     @final
     def add_form_item(self, name: str, form_item: FormItem) -> None:
         self._form_item_dic[name] = form_item
 
     @final
-    def get_form_doc(self) -> Dict[str, Any]:
+    def get_form_item(self, name: str) -> FormItem:
+        """Get form item
+
+        Args:
+            name (str): Form item name
+
+        Returns:
+            FormItem: Form item
+        """
+        if name not in self._form_item_dic:
+            raise XlFormArgumentException("Form item not found: %s" % (name))
+        return self._form_item_dic[name]
+
+    @final
+    def get_form_doc(
+        self, meta_level: MetaLevel = MetaLevel.FULL
+    ) -> Dict[str, Any]:
+        """Get form document from book
+
+        Args:
+            meta_level (MetaLevel, optional): Level of the meta data
+
+        Returns:
+            Dict[str, Any]: Item documents by the form item names
+        """
         dic: Dict[str, Any] = dict()
         for form_item_name, form_item in self._form_item_dic.items():
-            item_doc = form_item.get_item_doc()
-            dic[form_item_name] = item_doc.get_dict()
+            with self._tracer.span(get_item_span_name(form_item_name)):
+                item_doc = form_item.get_item_doc(meta_level)
+                with self._tracer.span(SPAN_DEEPCOPY):
+                    dic[form_item_name] = item_doc.get_dict()
         return dic
 
+    @final
+    async def get_form_doc_async(
+        self,
+        meta_level: MetaLevel = MetaLevel.FULL,
+        executor: Optional[Executor] = None,
+    ) -> Dict[str, Any]:
+        """Get form document from book in an executor
+
+        The executor must run in this process, since the book can't be sent
+        to another process. Without the executor, the form document is got
+        by the runner of the form.
+
+        Args:
+            meta_level (MetaLevel, optional): Level of the meta data
+            executor (Optional[Executor]): Executor, the runner of the form
+            by default
+
+        Returns:
+            Dict[str, Any]: Item documents by the form item names
+        """
+        if executor is None:
+            runner = self._async_runner
+        else:
+            runner = AsyncRunner(executor)
+        return await runner.run(self.get_form_doc, meta_level)
+
     @final
     def set_form_doc(self, doc: Dict[str, Any]) -> None:
+        for name, form_item, item_doc in self._get_item_doc_list(doc):
+            with self._tracer.span(get_item_span_name(name)):
+                form_item.set_item_doc(item_doc)
+
+    @final
+    def set_form_doc_diff(self, doc: Dict[str, Any]) -> List[CellChange]:
+        """Set form document to book, only the cells with changed values
+
+        Args:
+            doc (Dict[str, Any]): Form document
+
+        Returns:
+            List[CellChange]: Changes of the cells, empty if nothing changed
+        """
+        change_list: List[CellChange] = list()
+        for name, form_item, item_doc in self._get_item_doc_list(doc):
+            with self._tracer.span(get_item_span_name(name)):
+                change_list.extend(form_item.set_item_doc_diff(item_doc))
+        return change_list
+
+    def _get_item_doc_list(
+        self, doc: Dict[str, Any]
+    ) -> List[Tuple[str, FormItem, ItemDoc]]:
         form_item_name_list: List[str] = list(doc.keys())
 
         for form_item_name in form_item_name_list:
             if form_item_name not in self._form_item_dic:
                 raise XlFormArgumentException()
 
+        item_doc_list: List[Tuple[str, FormItem, ItemDoc]] = list()
         for form_item_name in form_item_name_list:
             form_item = self._form_item_dic[form_item_name]
             if not isinstance(doc[form_item_name], dict):
@@ -411,13 +1814,39 @@ class Form(object):
             if "result" not in doc[form_item_name]:
                 raise XlFormArgumentException()
             result = doc[form_item_name]["result"]
-            item_doc = ItemDoc(result=result)
-            form_item.set_item_doc(item_doc)
+            item_doc = ItemDoc(result=result, frozen=True)
+            item_doc_list.append((form_item_name, form_item, item_doc))
+        return item_doc_list
+
+
+def _get_fingerprint_value(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return [type(value).__name__, value.value]
+    if isinstance(value, TableEnd):
+        return ["TableEnd", list(value.get_key())]
+    if isinstance(value, datetime.datetime):
+        return ["datetime", value.isoformat()]
+    raise XlFormArgumentException(
+        "The argument has no fingerprint: %s" % (type(value).__name__)
+    )
 
 
 class FormFactory(object):
     def __init__(self) -> None:
         self._form_dic: Dict[str, Dict[str, Any]] = dict()
+        self._plan_dic: Dict[str, FormPlan] = dict()
+        self._session_dic: "weakref.WeakKeyDictionary[Book, FormSession]"
+        self._session_dic = weakref.WeakKeyDictionary()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The sessions are bound to the books of this process.
+        state = self.__dict__.copy()
+        del state["_session_dic"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._session_dic = weakref.WeakKeyDictionary()
 
     def register_form(
         self, name: str, form_item_cls_kwargs_dic: Dict[str, Dict[str, Any]]
@@ -448,22 +1877,161 @@ class FormFactory(object):
                 )
 
         self._form_dic[name] = form_item_cls_kwargs_dic
+        self._plan_dic.pop(name, None)
+
+    def compile_form(self, name: str) -> FormPlan:
+        """Compile the form into the regions of the sheets to read
+
+        Args:
+            name (str): Form name
+
+        Returns:
+            FormPlan: Form plan
+        """
+        plan = self._plan_dic.get(name)
+        if plan is not None:
+            return plan
+        box_dic: Dict[str, List[int]] = dict()
+        for cls_kwargs_dic in self._form_dic[name].values():
+            kwargs = cls_kwargs_dic.get("kwargs", dict())
+            sheet_name = kwargs.get("sheet_name")
+            range_arg = kwargs.get("range_arg")
+            if not isinstance(sheet_name, str):
+                continue
+            if not isinstance(range_arg, str):
+                continue
+            try:
+                min_column, min_row, max_column, max_row = parse_range_arg(
+                    range_arg
+                )
+            except XlFormArgumentException:
+                continue
+            if min_column is None or min_row is None:
+                continue
+            if max_column is None or max_row is None:
+                continue
+            box = box_dic.get(sheet_name)
+            if box is None:
+                box_dic[sheet_name] = [
+                    min_column,
+                    min_row,
+                    max_column,
+                    max_row,
+                ]
+                continue
+            box[0] = min(box[0], min_column)
+            box[1] = min(box[1], min_row)
+            box[2] = max(box[2], max_column)
+            box[3] = max(box[3], max_row)
+        plan = FormPlan(
+            {
+                sheet_name: format_range_arg(*box)
+                for sheet_name, box in box_dic.items()
+            }
+        )
+        self._plan_dic[name] = plan
+        return plan
+
+    def get_sheet_names(self, name: str) -> List[str]:
+        """Get the names of the sheets read by the form
+
+        The names can be passed to Engine.open_book to load only the sheets
+        of the form.
+
+        Args:
+            name (str): Form name
+
+        Returns:
+            List[str]: Sheet names in the order of the form items
+        """
+        sheet_names: List[str] = list()
+        for cls_kwargs_dic in self._form_dic[name].values():
+            kwargs = cls_kwargs_dic.get("kwargs", dict())
+            sheet_name = kwargs.get("sheet_name")
+            if isinstance(sheet_name, str) and sheet_name not in sheet_names:
+                sheet_names.append(sheet_name)
+        return sheet_names
+
+    def get_fingerprint(self, name: str) -> str:
+        """Get the fingerprint of the registration of the form
+
+        The fingerprint changes when the FormItem classes or the constructor
+        arguments change.
+
+        Args:
+            name (str): Form name
+
+        Returns:
+            str: Hex digest
+        """
+        registration: Dict[str, Any] = dict()
+        for form_item_name, cls_kwargs_dic in self._form_dic[name].items():
+            cls = cls_kwargs_dic["cls"]
+            registration[form_item_name] = {
+                "cls": "%s.%s" % (cls.__module__, cls.__qualname__),
+                "kwargs": cls_kwargs_dic.get("kwargs", dict()),
+            }
+        data = json.dumps(
+            registration, sort_keys=True, default=_get_fingerprint_value
+        )
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def get_session(self, book: Book) -> FormSession:
+        """Get the session shared by the forms on the book
 
-    def new_form(self, name: str, book: Book) -> Form:
+        Args:
+            book (Book): Book
+
+        Returns:
+            FormSession: Session
+        """
+        session = self._session_dic.get(book)
+        if session is None:
+            session = FormSession(book)
+            self._session_dic[book] = session
+        return session
+
+    def new_form(
+        self,
+        name: str,
+        book: Book,
+        session: Optional[FormSession] = None,
+        compiled: bool = False,
+    ) -> Form:
         """Create a new form
 
+        The form items share the session. If the session is omitted, the
+        session of the book is used. The form reports to the tracer of the
+        session, and runs the async methods by the runner of the book.
+
+        If compiled, the region of each sheet read by the form is read at
+        once, and the form items are served from the values. This suits the
+        engines which read the sheets sequentially.
+
         Args:
             name (str): Form name
             book (Book): Book
+            session (Optional[FormSession]): Session
+            compiled (bool, optional): True to read the regions at once
 
         Returns:
             Form: Form object
         """
         form_item_cls_kwargs_dic = self._form_dic[name]
-
-        form: Form = Form()
+        if session is None:
+            session = self.get_session(book)
+        if compiled:
+            self.compile_form(name).prefetch(session)
+
+        form: Form = Form(
+            tracer=session.get_tracer(),
+            async_runner=book.get_async_runner(),
+        )
         for form_item_name, cls_kwargs_dic in form_item_cls_kwargs_dic.items():
             cls, kwargs = cls_kwargs_dic["cls"], cls_kwargs_dic["kwargs"]
-            form_item = cls(book=book, **kwargs)
+            if _accepts_session(cls):
+                form_item = cls(book=book, session=session, **kwargs)
+            else:
+                form_item = cls(book=book, **kwargs)
             form.add_form_item(form_item_name, form_item)
         return form
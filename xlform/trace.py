@@ -0,0 +1,216 @@
+from types import TracebackType
+from typing import Any
+from typing import Callable
+from typing import ContextManager
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+from typing import Type
+import time
+
+# Names of the counters.
+CELLS_READ = "cells_read"
+CELLS_WRITTEN = "cells_written"
+WRAPPERS = "wrappers"
+EXCEPTIONS = "exceptions"
+
+# Names of the spans of the phases.
+SPAN_OPEN_BOOK = "open_book"
+SPAN_NEW_BOOK = "new_book"
+SPAN_SAVE = "save"
+SPAN_GET_SHEET = "get_sheet"
+SPAN_GET_RANGE = "get_range"
+SPAN_PREFETCH = "prefetch"
+SPAN_SCAN = "scan"
+SPAN_VALIDATE_BOOK = "validate_book"
+SPAN_VALIDATE_ITEM_DOC = "validate_item_doc"
+SPAN_GET_ITEM_DOC = "get_item_doc"
+SPAN_SET_ITEM_DOC = "set_item_doc"
+SPAN_DUMP = "dump"
+SPAN_DEEPCOPY = "deepcopy"
+
+SpanPath = Tuple[str, ...]
+
+
+def get_item_span_name(name: str) -> str:
+    """Get the name of the span of a form item
+
+    Args:
+        name (str): Form item name
+
+    Returns:
+        str: Span name
+    """
+    return "item:%s" % (name)
+
+
+class _NullSpan(object):
+    def __enter__(self) -> None:
+        return None
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        return None
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer(object):
+    """Observer of the spans and the counters
+
+    This tracer ignores everything, and is used by default. It costs a
+    method call for each span and each count.
+    """
+
+    def span(self, name: str) -> ContextManager[None]:
+        """Get the context of a timed span
+
+        The spans are nested by the contexts.
+
+        Args:
+            name (str): Span name
+
+        Returns:
+            ContextManager[None]: Context of the span
+        """
+        return _NULL_SPAN
+
+    def count(self, name: str, value: int = 1) -> None:
+        """Add to a counter in the current span
+
+        Args:
+            name (str): Counter name
+            value (int, optional): Value to add
+        """
+        return None
+
+
+NULL_TRACER = Tracer()
+
+
+def _format_counters(counters: Dict[str, int]) -> str:
+    return " ".join(
+        "%s=%d" % (name, counters[name]) for name in sorted(counters.keys())
+    )
+
+
+class _AggregateSpan(object):
+    def __init__(self, tracer: "AggregateTracer", name: str) -> None:
+        self._tracer = tracer
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._tracer._enter(self._name)
+        self._start = self._tracer._clock()
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self._tracer._exit(self._tracer._clock() - self._start)
+
+
+class AggregateTracer(Tracer):
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        """Tracer which aggregates the spans and the counters by the paths
+
+        The path of a span is the names of the enclosing spans and its
+        name. The tracer is not thread-safe.
+
+        Args:
+            clock (Callable[[], float], optional): Clock in seconds
+        """
+        self._clock = clock
+        self._path: List[str] = list()
+        self._span_dic: Dict[SpanPath, List[Any]] = dict()
+        self._counter_dic: Dict[SpanPath, Dict[str, int]] = dict()
+
+    def span(self, name: str) -> ContextManager[None]:
+        return _AggregateSpan(self, name)
+
+    def count(self, name: str, value: int = 1) -> None:
+        counters = self._counter_dic.setdefault(tuple(self._path), dict())
+        counters[name] = counters.get(name, 0) + value
+
+    def _enter(self, name: str) -> None:
+        self._path.append(name)
+
+    def _exit(self, elapsed: float) -> None:
+        entry = self._span_dic.setdefault(tuple(self._path), [0, 0.0])
+        entry[0] += 1
+        entry[1] += elapsed
+        self._path.pop()
+
+    def reset(self) -> None:
+        """Clear the spans and the counters"""
+        self._span_dic.clear()
+        self._counter_dic.clear()
+
+    def get_span_dic(self) -> Dict[SpanPath, Tuple[int, float]]:
+        """Get the spans
+
+        Returns:
+            Dict[SpanPath, Tuple[int, float]]: Numbers of the calls and the
+            total seconds by the paths
+        """
+        return {path: (e[0], e[1]) for path, e in self._span_dic.items()}
+
+    def get_counter_dic(self, path: SpanPath = ()) -> Dict[str, int]:
+        """Get the counters in a span including the nested spans
+
+        Args:
+            path (SpanPath, optional): Path of the span, the root by default
+
+        Returns:
+            Dict[str, int]: Values by the counter names
+        """
+        result: Dict[str, int] = dict()
+        for counter_path, counters in self._counter_dic.items():
+            if counter_path[: len(path)] != path:
+                continue
+            for name, value in counters.items():
+                result[name] = result.get(name, 0) + value
+        return result
+
+    def report(self) -> str:
+        """Get the breakdown of the spans as a text
+
+        Each line shows a span indented by the depth, the number of the
+        calls, the total time, the time outside the nested spans and the
+        counters including the nested spans.
+
+        Returns:
+            str: Report
+        """
+        child_time_dic: Dict[SpanPath, float] = dict()
+        for path, entry in self._span_dic.items():
+            parent = path[:-1]
+            child_time_dic[parent] = child_time_dic.get(parent, 0.0) + entry[1]
+
+        lines = ["%-40s %8s %12s %12s" % ("span", "calls", "total", "self")]
+        for path in sorted(self._span_dic.keys()):
+            calls, total = self._span_dic[path]
+            self_time = total - child_time_dic.get(path, 0.0)
+            lines.append(
+                (
+                    "%-40s %8d %9.3f ms %9.3f ms %s"
+                    % (
+                        "  " * (len(path) - 1) + path[-1],
+                        calls,
+                        total * 1000,
+                        self_time * 1000,
+                        _format_counters(self.get_counter_dic(path)),
+                    )
+                ).rstrip()
+            )
+        lines.append("total: %s" % (_format_counters(self.get_counter_dic())))
+        return "\n".join(lines) + "\n"